@@ -1,9 +1,11 @@
 from interfaceUsuario import Usuario
 from gerenciadorUsuario import GerenciadorUsuarios
-import os
-from cliente import Cliente
+from cliente import Cliente, StatusCartao
+from dinheiro import formatar_reais
 
 class Administrador(Usuario):
+    __slots__ = ('_gerenciador', 'nivel_acesso', 'tipo')
+
     def __init__(self, gerenciador: GerenciadorUsuarios, nome: str = None, sobrenome: str = None, email: str = None, senha: str = None, cpf: str = None, nivel_acesso: str = 'admin') -> None:
         '''
         Inicializa um objeto Administrador.
@@ -58,7 +60,7 @@ class Administrador(Usuario):
         '''
         Aprova solicitações de cartão de crédito pendentes.
         '''
-        pedidos = [cliente for cliente in self._gerenciador.usuarios if isinstance(cliente, Cliente) and cliente.status_cartao == 'pendente']
+        pedidos = [cliente for cliente in self._gerenciador.usuarios if isinstance(cliente, Cliente) and cliente.status_cartao == StatusCartao.PENDENTE]
         if not pedidos:
             print("\nNão há solicitações de cartão pendentes.")
             return
@@ -69,10 +71,11 @@ class Administrador(Usuario):
         if escolha.isdigit() and int(escolha) > 0 and int(escolha) <= len(pedidos):
             cliente_selecionado = pedidos[int(escolha) - 1]
             limite_inicial = float(input(f"Digite o limite inicial para o cartão de {cliente_selecionado.get_nome()}: "))
-            cliente_selecionado.status_cartao = 'aprovado'
-            cliente_selecionado.limite_cartao = limite_inicial
-            self._gerenciador.salvar_usuarios()
-            print(f"Cartão de crédito aprovado para {cliente_selecionado.get_nome()} com limite de R${limite_inicial:.2f}.")
+            with self._gerenciador.travar_contas(cliente_selecionado):
+                cliente_selecionado.status_cartao = StatusCartao.APROVADO
+                cliente_selecionado.limite_cartao = limite_inicial
+            self._gerenciador.salvar_usuarios(cliente_selecionado)
+            print(f"Cartão de crédito aprovado para {cliente_selecionado.get_nome()} com limite de R${formatar_reais(cliente_selecionado.limite_cartao_centavos)}.")
         else:
             print("Operação cancelada ou entrada inválida.")
            
@@ -89,7 +92,7 @@ class Administrador(Usuario):
         print("\nLista de clientes:")
         for idx, cliente in enumerate(clientes, start=1):
             print(f"{idx}. Nome: {cliente.get_nome()}, Email: {cliente.get_email()}, Cartão: {cliente.status_cartao}, "
-                  f"R${cliente.limite_cartao:.2f}, Aumento de Limite: R${cliente.limite_requerido:.2f}, "
+                  f"R${formatar_reais(cliente.limite_cartao_centavos)}, Aumento de Limite: R${formatar_reais(cliente.limite_requerido_centavos)}, "
                   f"Encerramento: {'Sim' if cliente.solicitar_encerramento else 'Não'}")
         
         escolha = input("\nEscolha um cliente para visualizar as informações detalhadas ou '0' para cancelar: ").strip()
@@ -100,11 +103,11 @@ class Administrador(Usuario):
             print(f"Sobrenome: {cliente_selecionado.get_sobrenome()}")
             print(f"Email: {cliente_selecionado.get_email()}")
             print(f"CPF: {cliente_selecionado.get_cpf()}")
-            print(f"Saldo Atual: R${cliente_selecionado.get_saldo():.2f}")
-            print(f"Limite Cartão: R${cliente_selecionado.limite_cartao:.2f}")
+            print(f"Saldo Atual: R${formatar_reais(cliente_selecionado.get_saldo_centavos())}")
+            print(f"Limite Cartão: R${formatar_reais(cliente_selecionado.limite_cartao_centavos)}")
             print(f"Status Cartão: {cliente_selecionado.status_cartao}")
-            print(f"Dívida Cartão: R${cliente_selecionado.divida_cartao:.2f}")
-            print(f"Requerimento de Aumento de Limite: R${cliente_selecionado.limite_requerido:.2f}")
+            print(f"Dívida Cartão: R${formatar_reais(cliente_selecionado.divida_cartao_centavos)}")
+            print(f"Requerimento de Aumento de Limite: R${formatar_reais(cliente_selecionado.limite_requerido_centavos)}")
             print(f"Solicitação de Encerramento de Conta: {'Sim' if cliente_selecionado.solicitar_encerramento else 'Não'}")
         else:
             print("Operação cancelada ou entrada inválida.")
@@ -126,14 +129,12 @@ class Administrador(Usuario):
         escolha = input("Escolha uma conta para encerrar ou '0' para cancelar: ").strip()
         if escolha.isdigit() and int(escolha) > 0 and int(escolha) <= len(solicitacoes):
             cliente_selecionado = solicitacoes[int(escolha) - 1]
-            if cliente_selecionado.get_saldo() == 0 and cliente_selecionado.divida_cartao == 0:
-                self._gerenciador.usuarios.remove(cliente_selecionado)
-                arquivo_fatura = f"fatura_{cliente_selecionado.get_email().replace('@', '_').replace('.', '_')}.txt"
-                try:
-                    os.remove(arquivo_fatura)
-                except FileNotFoundError:
-                    pass
-                self._gerenciador.salvar_usuarios()
+            with self._gerenciador.travar_contas(cliente_selecionado):
+                encerrar = cliente_selecionado.get_saldo_centavos() == 0 and cliente_selecionado.divida_cartao_centavos == 0
+                if encerrar:
+                    self._gerenciador.remover_usuario(cliente_selecionado)
+            if encerrar:
+                self._gerenciador.faturas.quitar(cliente_selecionado.get_email())
                 print(f"Conta de {cliente_selecionado.get_nome()} encerrada com sucesso.")
             else:
                 print("A conta não pode ser encerrada. Verifique se há saldo ou dívidas pendentes.")
@@ -152,15 +153,16 @@ class Administrador(Usuario):
 
         print("\nSolicitações de aumento de limite pendentes:")
         for idx, cliente in enumerate(solicitacoes, start=1):
-            print(f"{idx}. {cliente.get_nome()} - Email: {cliente.get_email()}, Solicitação: R${cliente.limite_requerido:.2f}")
+            print(f"{idx}. {cliente.get_nome()} - Email: {cliente.get_email()}, Solicitação: R${formatar_reais(cliente.limite_requerido_centavos)}")
         
         escolha = input("Escolha uma solicitação para aprovar ou digite 0 para cancelar: ")
         if escolha.isdigit() and int(escolha) > 0 and int(escolha) <= len(solicitacoes):
             cliente_selecionado = solicitacoes[int(escolha) - 1]
-            cliente_selecionado.limite_cartao = cliente_selecionado.limite_requerido
-            cliente_selecionado.limite_requerido = 0
-            self._gerenciador.salvar_usuarios()
-            print(f"Limite de crédito de {cliente_selecionado.get_nome()} aumentado para R${cliente_selecionado.limite_cartao:.2f}.")
+            with self._gerenciador.travar_contas(cliente_selecionado):
+                cliente_selecionado.limite_cartao_centavos = cliente_selecionado.limite_requerido_centavos
+                cliente_selecionado.limite_requerido_centavos = 0
+            self._gerenciador.salvar_usuarios(cliente_selecionado)
+            print(f"Limite de crédito de {cliente_selecionado.get_nome()} aumentado para R${formatar_reais(cliente_selecionado.limite_cartao_centavos)}.")
             print("Solicitação de aumento de limite aprovada e processada com sucesso.")
         elif escolha == 0:
             print("Operação cancelada.")
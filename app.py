@@ -1,8 +1,10 @@
 import flet as ft
-import re, os
+import re
 from sistema import SistemaBliBank
-from cliente import Cliente
+from cliente import Cliente, StatusCartao
+from dinheiro import formatar_reais, formatar_digitacao, ler_reais, para_centavos, para_reais
 from administrador import Administrador
+from tarefas import executor_padrao
 
 class TelaInicial:
     def __init__(self, app):
@@ -36,8 +38,13 @@ class TelaInicial:
 
         def ao_clicar_sair(e):
             '''
-            Fecha a janela do aplicativo.
+            Encerra a sessão, grava as alterações pendentes e fecha a janela do aplicativo.
+
+            O sistema é compartilhado pelas demais páginas abertas; o escritor de
+            persistência é encerrado ao fim do processo.
             '''
+            self.app.encerrar_sessao()
+            self.app.sistema.gerenciador.descarregar()
             self.app.pagina.window_close()
 
         self.app.pagina.add(
@@ -85,12 +92,16 @@ class TelaLogin:
             '''
             Realiza o login do usuário.
             '''
-            usuario = self.app.sistema.login(email.value, senha.value)
-            if usuario:
+            token = self.app.sistema.login(email.value, senha.value)
+            if token:
+                usuario = self.app.sistema.usuario_da_sessao(token)
                 if isinstance(usuario, Cliente) and usuario.solicitar_encerramento:
+                    self.app.sistema.logout(token)
                     self.app.mostrar_snackbar("Conta desativada. Ela será encerrada em breve.")
                     return
                 
+                self.app.encerrar_sessao()
+                self.app.token = token
                 if isinstance(usuario, Cliente):
                     self.app.menu_cliente.mostrar()
                 elif isinstance(usuario, Administrador):
@@ -383,8 +394,8 @@ class MenuCliente:
         '''
         self.app.pagina.controls.clear()
 
-        if isinstance(self.app.sistema.sessao_atual, Cliente):
-            saldo_formatado = f"{self.app.sistema.sessao_atual.get_saldo():,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        if isinstance(self.app.sessao_atual, Cliente):
+            saldo_formatado = formatar_reais(self.app.sessao_atual.get_saldo_centavos())
             self.app.saldo_texto = ft.Text(
                 f"Saldo: R${saldo_formatado}",
                 size=18,
@@ -415,16 +426,16 @@ class MenuCliente:
             '''
             Verifica se a conta pode ser encerrada e exibe a confirmação de encerramento.
             '''
-            saldo = self.app.sistema.sessao_atual.get_saldo()
-            divida_cartao = self.app.sistema.sessao_atual.divida_cartao
+            saldo = self.app.sessao_atual.get_saldo_centavos()
+            divida_cartao = self.app.sessao_atual.divida_cartao_centavos
 
-            if abs(saldo) > 1e-2 or abs(divida_cartao) > 1e-2:
+            if saldo != 0 or divida_cartao != 0:
                 mensagens = []
-                if abs(saldo) > 1e-2:
-                    saldo_formatado = f"{saldo:.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                if saldo != 0:
+                    saldo_formatado = formatar_reais(saldo)
                     mensagens.append(f"Saldo na conta: R${saldo_formatado}")
-                if abs(divida_cartao) > 1e-2:
-                    divida_formatada = f"{divida_cartao:.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                if divida_cartao != 0:
+                    divida_formatada = formatar_reais(divida_cartao)
                     mensagens.append(f"Dívida no cartão de crédito: R${divida_formatada}")
 
                 self.app.pagina.controls.clear()
@@ -457,7 +468,7 @@ class MenuCliente:
             '''
             Realiza logout e retorna à tela inicial.
             '''
-            mensagem_logout = self.app.sistema.logout()
+            mensagem_logout = self.app.encerrar_sessao()
             self.app.mostrar_snackbar(mensagem_logout)
             self.app.tela_inicial.mostrar()
 
@@ -510,7 +521,8 @@ class MenuCliente:
         '''
         Confirma e solicita o encerramento da conta.
         '''
-        self.app.sistema.sessao_atual.gestao_conta.solicitar_encerramento_conta()
+        self.app.sessao_atual.gestao_conta.solicitar_encerramento_conta()
+        self.app.encerrar_sessao()
         self.app.mostrar_snackbar("Sua solicitação de encerramento de conta foi recebida e será processada em breve. Sentiremos sua falta!")
         self.app.tela_inicial.mostrar()
 
@@ -564,6 +576,12 @@ class MenuOperacoes:
             '''
             self.app.tela_investimento.mostrar()
 
+        def ao_clicar_extrato(e):
+            '''
+            Exibe o extrato da conta.
+            '''
+            self.app.tela_extrato.mostrar()
+
         self.app.pagina.add(
             ft.Container(
                 content=ft.Column(
@@ -573,6 +591,7 @@ class MenuOperacoes:
                         ft.ElevatedButton("Saque", on_click=ao_clicar_saque),
                         ft.ElevatedButton("Transferência", on_click=ao_clicar_transferencia),
                         ft.ElevatedButton("Investir", on_click=ao_clicar_investir),
+                        ft.ElevatedButton("Extrato", on_click=ao_clicar_extrato),
                         ft.ElevatedButton("Voltar", on_click=self.app.menu_cliente.mostrar),
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -625,18 +644,7 @@ class TelaValor:
             '''
             Formata o valor inserido pelo usuário para o formato monetário.
             '''
-            input_value = valor.value
-            input_value = ''.join(filter(str.isdigit, input_value))  
-            
-            if not input_value:
-                input_value = "0"
-            
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"{int(input_value[:-2]):,}.{input_value[-2:]}" 
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            valor.value = formatted_value
+            valor.value = formatar_digitacao(valor.value)
             self.app.pagina.update()
 
         def ao_clicar_confirmar(e):
@@ -644,28 +652,37 @@ class TelaValor:
             Realiza a operação financeira ao clicar no botão confirmar.
             '''
             try:
-                valor_formatado = valor.value.replace(".", "").replace(",", ".")
-                valor_float = float(valor_formatado)
+                valor_centavos = ler_reais(valor.value)
                 
-                if valor_float == 0:
+                if valor_centavos == 0:
                     self.app.mostrar_snackbar("Valor inválido.")
                     return
                 
                 # Atualiza o saldo antes de realizar a operação
                 self.app.atualizar_saldo()
                 
-                if tipo_operacao == '2' and valor_float > self.app.sistema.sessao_atual.get_saldo():
+                if tipo_operacao == '2' and valor_centavos > self.app.sessao_atual.get_saldo_centavos():
                     self.app.mostrar_snackbar("Saldo insuficiente.")
                     return
 
-                resultado = self.app.sistema.realizar_operacao_financeira(tipo_operacao, valor_float)
-                self.app.atualizar_saldo()  # Atualiza o saldo após a operação
-                
-                saldo_atualizado = f"{self.app.sistema.sessao_atual.get_saldo():,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-                valor_final_formatado = f"{valor_float:,.2f}".replace(",", "X").replace(".", ",").replace("X", ",")
+                token = self.app.token
+
+                def realizar():
+                    return self.app.sistema.realizar_operacao_financeira(token, tipo_operacao, para_reais(valor_centavos))
+
+                def concluir(resultado):
+                    if self.app.sessao_atual is None:
+                        self.app.mostrar_snackbar(resultado)
+                        return
+                    self.app.atualizar_saldo()  # Atualiza o saldo após a operação
+
+                    saldo_atualizado = formatar_reais(self.app.sessao_atual.get_saldo_centavos())
+                    valor_final_formatado = formatar_reais(valor_centavos)
+
+                    mensagem = f"{operacao} de R${valor_final_formatado} realizado com sucesso.\nSaldo atualizado: R${saldo_atualizado}"
+                    self.app.mostrar_resultado_operacao(mensagem)
 
-                mensagem = f"{operacao} de R${valor_final_formatado} realizado com sucesso.\nSaldo atualizado: R${saldo_atualizado}"
-                self.app.mostrar_resultado_operacao(mensagem)
+                self.app.executar_em_segundo_plano(realizar, concluir, controle=e.control)
             except ValueError:
                 self.app.mostrar_snackbar("Por favor, insira um valor válido.")
 
@@ -724,18 +741,7 @@ class TelaTransferencia:
             '''
             Formata o valor inserido pelo usuário para o formato monetário.
             '''
-            input_value = valor.value
-            input_value = ''.join(filter(str.isdigit, input_value)) 
-
-            if not input_value:
-                input_value = "0"
-
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"{int(input_value[:-2]):,}.{input_value[-2:]}" 
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            valor.value = formatted_value
+            valor.value = formatar_digitacao(valor.value)
             self.app.pagina.update()
 
         def ao_clicar_confirmar(e):
@@ -743,10 +749,9 @@ class TelaTransferencia:
             Realiza a transferência ao clicar no botão confirmar.
             '''
             try:
-                valor_formatado = valor.value.replace(".", "").replace(",", ".")
-                valor_float = float(valor_formatado)
+                valor_centavos = ler_reais(valor.value)
 
-                if valor_float == 0:
+                if valor_centavos == 0:
                     self.app.mostrar_snackbar("O valor da transferência não pode ser R$0,00.")
                     return
 
@@ -760,32 +765,43 @@ class TelaTransferencia:
                     self.app.pagina.update()
                     return
 
-                if email_destinatario.value == self.app.sistema.sessao_atual.get_email():
+                if email_destinatario.value == self.app.sessao_atual.get_email():
                     self.app.mostrar_snackbar("Você não pode transferir para o próprio e-mail.")
                     email_destinatario.value = ""
                     self.app.pagina.update()
                     return
 
-                if valor_float > self.app.sistema.sessao_atual.get_saldo():
+                if valor_centavos > self.app.sessao_atual.get_saldo_centavos():
                     self.app.mostrar_snackbar("Saldo insuficiente.")
                     return
 
-                resultado = self.app.sistema.realizar_operacao_financeira('3', valor_float, email_destinatario=email_destinatario.value)
-                if resultado == "UsuarioNaoEncontrado":
-                    self.app.mostrar_snackbar(f"Usuário com email {email_destinatario.value} não encontrado.")
-                    email_destinatario.value = ""
-                    self.app.pagina.update()
-                    return
-
-                self.app.atualizar_saldo()
-                if isinstance(resultado, str):
-                    self.app.mostrar_resultado_operacao(resultado)
-                else:
-                    saldo_atualizado = f"{self.app.sistema.sessao_atual.get_saldo():,.2f}".replace(",", "X").replace(".", ",").replace("X", ",")
-                    valor_final_formatado = f"{valor_float:,.2f}".replace(",", "X").replace(".", ",").replace("X", ",")
-
-                    mensagem = f"Transferência de R${valor_final_formatado} para {email_destinatario.value} realizada com sucesso.\nSaldo atualizado: R${saldo_atualizado}"
-                    self.app.mostrar_resultado_operacao(mensagem)
+                token = self.app.token
+                destinatario = email_destinatario.value
+
+                def realizar():
+                    return self.app.sistema.realizar_operacao_financeira(token, '3', para_reais(valor_centavos), email_destinatario=destinatario)
+
+                def concluir(resultado):
+                    if resultado == "UsuarioNaoEncontrado":
+                        self.app.mostrar_snackbar(f"Usuário com email {destinatario} não encontrado.")
+                        email_destinatario.value = ""
+                        self.app.pagina.update()
+                        return
+                    if self.app.sessao_atual is None:
+                        self.app.mostrar_snackbar(resultado)
+                        return
+
+                    self.app.atualizar_saldo()
+                    if isinstance(resultado, str):
+                        self.app.mostrar_resultado_operacao(resultado)
+                    else:
+                        saldo_atualizado = formatar_reais(self.app.sessao_atual.get_saldo_centavos())
+                        valor_final_formatado = formatar_reais(valor_centavos)
+
+                        mensagem = f"Transferência de R${valor_final_formatado} para {destinatario} realizada com sucesso.\nSaldo atualizado: R${saldo_atualizado}"
+                        self.app.mostrar_resultado_operacao(mensagem)
+
+                self.app.executar_em_segundo_plano(realizar, concluir, controle=e.control)
             except ValueError:
                 self.app.mostrar_snackbar("Por favor, insira um valor válido.")
 
@@ -857,18 +873,7 @@ class TelaInvestimento:
             '''
             Formata o valor inserido pelo usuário para o formato monetário.
             '''
-            input_value = valor.value
-            input_value = ''.join(filter(str.isdigit, input_value)) 
-            
-            if not input_value:
-                input_value = "0"
-            
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"{int(input_value[:-2]):,}.{input_value[-2:]}"  
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            valor.value = formatted_value
+            valor.value = formatar_digitacao(valor.value)
             self.app.pagina.update()
 
         def ao_selecionar_tipo(e):
@@ -883,14 +888,13 @@ class TelaInvestimento:
             Realiza o investimento ao clicar no botão confirmar.
             '''
             try:
-                valor_formatado = valor.value.replace(".", "").replace(",", ".")
-                valor_float = round(float(valor_formatado), 2)
+                valor_centavos = ler_reais(valor.value)
                 
-                if valor_float == 0:
+                if valor_centavos == 0:
                     self.app.mostrar_snackbar("O valor do investimento não pode ser R$0,00.")
                     return
                 
-                if valor_float > self.app.sistema.sessao_atual.get_saldo():
+                if valor_centavos > self.app.sessao_atual.get_saldo_centavos():
                     self.app.mostrar_snackbar("Saldo insuficiente.")
                     return
 
@@ -899,19 +903,30 @@ class TelaInvestimento:
                     return
 
                 descricao_investimento = tipo_investimento.value.lower() 
-                resultado = self.app.sistema.realizar_operacao_financeira('4', valor_float, descricao=descricao_investimento)
-                self.app.atualizar_saldo()
-                if isinstance(resultado, str):
-                    self.app.resultado_operacao.mostrar(resultado)
-                else:
-                    rendimento_percentual, rendimento_valor, valor_final = resultado
-                    mensagem = (
-                        f"Investimento em {tipo_investimento.value} realizado com sucesso.\n"
-                        f"Investimento de R${valor_float:.2f}.\n"
-                        f"Rendimento de {rendimento_percentual:.2f}%, o que te retornou R${rendimento_valor:.2f}.\n"
-                        f"Seu saldo atual é R${self.app.sistema.sessao_atual.get_saldo():.2f}"
-                    )
-                    self.app.resultado_operacao.mostrar(mensagem)
+                investimento = tipo_investimento.value
+                token = self.app.token
+
+                def realizar():
+                    return self.app.sistema.realizar_operacao_financeira(token, '4', para_reais(valor_centavos), descricao=descricao_investimento)
+
+                def concluir(resultado):
+                    if self.app.sessao_atual is None:
+                        self.app.mostrar_snackbar(resultado)
+                        return
+                    self.app.atualizar_saldo()
+                    if isinstance(resultado, str):
+                        self.app.resultado_operacao.mostrar(resultado)
+                    else:
+                        rendimento_percentual, rendimento_valor, valor_final = resultado
+                        mensagem = (
+                            f"Investimento em {investimento} realizado com sucesso.\n"
+                            f"Investimento de R${formatar_reais(valor_centavos)}.\n"
+                            f"Rendimento de {rendimento_percentual:.2f}%, o que te retornou R${formatar_reais(para_centavos(rendimento_valor))}.\n"
+                            f"Seu saldo atual é R${formatar_reais(self.app.sessao_atual.get_saldo_centavos())}"
+                        )
+                        self.app.resultado_operacao.mostrar(mensagem)
+
+                self.app.executar_em_segundo_plano(realizar, concluir, controle=e.control)
             except ValueError:
                 self.app.mostrar_snackbar("Por favor, insira um valor válido.")
 
@@ -993,6 +1008,84 @@ class ResultadoOperacao:
         self.app.pagina.update()
 
 
+class TelaExtrato:
+    TAMANHO_PAGINA = 20
+
+    def __init__(self, app):
+        '''
+        Inicializa a tela do extrato da conta.
+
+        Parâmetros
+        ----------
+        app : BliBankApp
+            Instância do aplicativo principal.
+        '''
+        self.app = app
+
+    def mostrar(self, e=None, apos=None):
+        '''
+        Exibe uma página do extrato, lida em segundo plano.
+
+        Parâmetros
+        ----------
+        apos : Lancamento, opcional
+            Último lançamento da página anterior; se omitido, exibe a primeira página.
+        '''
+        self.app.pagina.controls.clear()
+        self.app.pagina.add(
+            ft.Container(
+                content=self.app.saldo_texto,
+                alignment=ft.alignment.top_right,
+                padding=10,
+            )
+        )
+
+        lancamentos_extrato = ft.Column(
+            [self.app.indicador_carregamento("Carregando extrato...")],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        botao_proxima = ft.ElevatedButton("Próxima Página", visible=False)
+
+        def ler_extrato():
+            '''
+            Lê a página do extrato (executada em segundo plano).
+            '''
+            return self.app.sistema.consultar_extrato(self.app.token, limite=self.TAMANHO_PAGINA, apos=apos)
+
+        def exibir_extrato(lancamentos):
+            '''
+            Exibe os lançamentos lidos e habilita a próxima página, se houver.
+            '''
+            if lancamentos:
+                lancamentos_extrato.controls = [ft.Text(str(lancamento), size=16, color=ft.colors.WHITE) for lancamento in lancamentos]
+            else:
+                lancamentos_extrato.controls = [ft.Text("Nenhuma movimentação encontrada.", size=18, color=ft.colors.WHITE)]
+            if lancamentos and len(lancamentos) == self.TAMANHO_PAGINA:
+                botao_proxima.on_click = lambda e: self.mostrar(apos=lancamentos[-1])
+                botao_proxima.visible = True
+            self.app.pagina.update()
+
+        self.app.pagina.add(
+            ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Text("Extrato", size=24, color=ft.colors.PINK, weight=ft.FontWeight.BOLD),
+                        lancamentos_extrato,
+                        botao_proxima,
+                        ft.ElevatedButton("Voltar", on_click=self.app.menu_operacoes.mostrar),
+                    ],
+                    alignment=ft.MainAxisAlignment.CENTER,
+                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                    spacing=20,
+                ),
+                alignment=ft.alignment.center,
+                expand=True,
+            )
+        )
+        self.app.pagina.update()
+        self.app.executar_em_segundo_plano(ler_extrato, exibir_extrato, mensagem_pendente=None)
+
+
 class MenuCartao:
     def __init__(self, app):
         '''
@@ -1022,7 +1115,7 @@ class MenuCartao:
             '''
             Trata o clique no botão de solicitar cartão de crédito.
             '''
-            if self.app.sistema.sessao_atual.cartao_credito.solicitar_cartao():
+            if self.app.sessao_atual.cartao_credito.solicitar_cartao():
                 self.app.mostrar_snackbar("Solicitação de cartão de crédito enviada.")
                 self.mostrar()
             else:
@@ -1057,15 +1150,15 @@ class MenuCartao:
             '''
             Trata o clique no botão de solicitar aumento de limite.
             '''
-            limite_requerido = self.app.sistema.sessao_atual.limite_requerido
+            limite_requerido = self.app.sessao_atual.limite_requerido
             if limite_requerido != 0:
                 self.app.mostrar_snackbar("Já tem uma solicitação pendente. Aguarde.")
             else:
                 self.mostrar_aumento_limite_interface()
 
-        status_cartao = self.app.sistema.sessao_atual.status_cartao
+        status_cartao = self.app.sessao_atual.status_cartao
         mensagem_status = ""
-        if status_cartao == 'pendente':
+        if status_cartao == StatusCartao.PENDENTE:
             mensagem_status = "Solicitação de cartão já enviada. Seu cartão será aprovado em breve."
 
         self.app.pagina.add(
@@ -1074,11 +1167,11 @@ class MenuCartao:
                     [
                         ft.Text("Gerenciamento de Cartão de Crédito", size=24, color=ft.colors.PINK, weight=ft.FontWeight.BOLD),
                         ft.Text(mensagem_status, size=16, color=ft.colors.WHITE),
-                        ft.ElevatedButton("Solicitar Cartão de Crédito", on_click=ao_clicar_solicitar_cartao, visible=status_cartao == 'nenhum'),
-                        ft.ElevatedButton("Ver Detalhes do Cartão", on_click=ao_clicar_detalhes_cartao, visible=status_cartao == 'aprovado'),
-                        ft.ElevatedButton("Fazer Compra", on_click=ao_clicar_fazer_compra, visible=status_cartao == 'aprovado'),
-                        ft.ElevatedButton("Pagar Fatura", on_click=ao_clicar_pagar_fatura, visible=status_cartao == 'aprovado'),
-                        ft.ElevatedButton("Solicitar Aumento de Limite", on_click=ao_clicar_solicitar_aumento, visible=status_cartao == 'aprovado'),
+                        ft.ElevatedButton("Solicitar Cartão de Crédito", on_click=ao_clicar_solicitar_cartao, visible=status_cartao == StatusCartao.NENHUM),
+                        ft.ElevatedButton("Ver Detalhes do Cartão", on_click=ao_clicar_detalhes_cartao, visible=status_cartao == StatusCartao.APROVADO),
+                        ft.ElevatedButton("Fazer Compra", on_click=ao_clicar_fazer_compra, visible=status_cartao == StatusCartao.APROVADO),
+                        ft.ElevatedButton("Pagar Fatura", on_click=ao_clicar_pagar_fatura, visible=status_cartao == StatusCartao.APROVADO),
+                        ft.ElevatedButton("Solicitar Aumento de Limite", on_click=ao_clicar_solicitar_aumento, visible=status_cartao == StatusCartao.APROVADO),
                         ft.ElevatedButton("Voltar", on_click=self.app.menu_cliente.mostrar),
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -1098,40 +1191,56 @@ class MenuCartao:
         '''
         self.app.pagina.controls.clear()
 
-        cartao_credito = self.app.sistema.sessao_atual.cartao_credito
-        divida_atual = self.app.sistema.sessao_atual.divida_cartao
+        cartao_credito = self.app.sessao_atual.cartao_credito
+        gerenciador = self.app.sistema.gerenciador
+        email = self.app.sessao_atual.get_email()
+        fatura = {'total': 0}
 
-        detalhes_fatura = [
-            ft.Text(f"Valor da Fatura: R${divida_atual:.2f}", size=18, color=ft.colors.WHITE),
-        ]
+        detalhes_fatura = ft.Column(
+            [self.app.indicador_carregamento("Carregando fatura...")],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
 
-        pasta_faturas = "faturas"
-        arquivo_fatura = os.path.join(pasta_faturas, f"fatura_{self.app.sistema.sessao_atual.get_email().replace('@', '_').replace('.', '_')}.txt")
-        fatura_encontrada = False
-        try:
-            with open(arquivo_fatura, 'r') as fatura:
-                compras = fatura.readlines()
-                if compras:
-                    detalhes_fatura.append(ft.Text("\nItens na Fatura:", size=18, color=ft.colors.WHITE))
-                    for compra in compras:
-                        detalhes_fatura.append(ft.Text(compra.strip(), size=16, color=ft.colors.WHITE))
-                    fatura_encontrada = True
-                else:
-                    detalhes_fatura.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
-        except FileNotFoundError:
-            detalhes_fatura.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
+        def ler_fatura():
+            '''
+            Lê o resumo e as compras da fatura (executada em segundo plano).
+            '''
+            faturas = gerenciador.faturas  # abre o banco das faturas no primeiro acesso
+            return faturas.resumo(email), faturas.listar(email)
+
+        def exibir_fatura(lida):
+            '''
+            Exibe as compras lidas e habilita o pagamento se houver fatura.
+            '''
+            (total_fatura, quantidade), compras = lida
+            fatura['total'] = total_fatura
+            botao_confirmar.visible = quantidade > 0
+            itens = [ft.Text(f"Valor da Fatura: R${formatar_reais(total_fatura)} ({quantidade} compras)", size=18, color=ft.colors.WHITE)]
+            if compras:
+                itens.append(ft.Text("\nItens na Fatura:", size=18, color=ft.colors.WHITE))
+                for compra in compras:
+                    itens.append(ft.Text(str(compra), size=16, color=ft.colors.WHITE))
+            else:
+                itens.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
+            detalhes_fatura.controls = itens
+            self.app.pagina.update()
 
         def ao_clicar_confirmar(e):
             '''
             Trata o clique no botão de confirmar pagamento da fatura.
             '''
-            if divida_atual > self.app.sistema.sessao_atual.get_saldo():
+            if fatura['total'] > self.app.sessao_atual.get_saldo_centavos():
                 self.app.mostrar_snackbar("Saldo insuficiente.")
                 return
 
-            self.app.sistema.sessao_atual.cartao_credito.pagar_fatura()
-            self.app.mostrar_snackbar("Fatura paga com sucesso.")
-            self.mostrar()
+            def concluir(paga):
+                self.app.mostrar_snackbar("Fatura paga com sucesso." if paga else "Não foi possível pagar a fatura.")
+                if self.app.sessao_atual is not None:
+                    self.mostrar()
+
+            self.app.executar_em_segundo_plano(cartao_credito.pagar_fatura, concluir, controle=e.control)
+
+        botao_confirmar = ft.ElevatedButton("Confirmar Pagamento", on_click=ao_clicar_confirmar, visible=False)
 
         self.app.pagina.add(
             ft.Container(
@@ -1146,8 +1255,8 @@ class MenuCartao:
                 content=ft.Column(
                     [
                         ft.Text("Pagar Fatura", size=24, color=ft.colors.PINK, weight=ft.FontWeight.BOLD),
-                        *detalhes_fatura,
-                        ft.ElevatedButton("Confirmar Pagamento", on_click=ao_clicar_confirmar, visible=fatura_encontrada),
+                        detalhes_fatura,
+                        botao_confirmar,
                         ft.ElevatedButton("Voltar", on_click=self.mostrar),
                     ],
                     alignment=ft.MainAxisAlignment.CENTER,
@@ -1159,6 +1268,7 @@ class MenuCartao:
             )
         )
         self.app.pagina.update()
+        self.app.executar_em_segundo_plano(ler_fatura, exibir_fatura, mensagem_pendente=None)
 
     def mostrar_compra_interface(self):
         '''
@@ -1166,7 +1276,7 @@ class MenuCartao:
         '''
         self.app.pagina.controls.clear()
 
-        limite_disponivel = self.app.sistema.sessao_atual.limite_cartao - self.app.sistema.sessao_atual.divida_cartao
+        limite_disponivel = self.app.sessao_atual.limite_cartao_centavos - self.app.sessao_atual.divida_cartao_centavos
 
         valor_compra = ft.TextField(label="Valor da Compra", width=300, prefix_text="R$", value="0,00")
         loja = ft.TextField(label="Loja", width=300)
@@ -1176,18 +1286,7 @@ class MenuCartao:
             '''
             Formata o valor da compra para o padrão monetário.
             '''
-            input_value = valor_compra.value
-            input_value = ''.join(filter(str.isdigit, input_value))
-
-            if not input_value:
-                input_value = "0"
-
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"{int(input_value[:-2]):,}.{input_value[-2:]}"
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            valor_compra.value = formatted_value
+            valor_compra.value = formatar_digitacao(valor_compra.value)
             self.app.pagina.update()
 
         def formatar_texto(text):
@@ -1218,12 +1317,12 @@ class MenuCartao:
             Trata o clique no botão de confirmar compra.
             '''
             try:
-                valor_float = float(valor_compra.value.replace(".", "").replace(",", "."))
-                if valor_float <= 0:
+                valor_centavos = ler_reais(valor_compra.value)
+                if valor_centavos <= 0:
                     self.app.mostrar_snackbar("O valor da compra deve ser maior que zero.")
                     return
 
-                if valor_float > limite_disponivel:
+                if valor_centavos > limite_disponivel:
                     self.app.mostrar_snackbar("Valor da compra excede o limite disponível.")
                     return
 
@@ -1231,9 +1330,18 @@ class MenuCartao:
                     self.app.mostrar_snackbar("Por favor, preencha todos os campos.")
                     return
 
-                self.app.sistema.sessao_atual.cartao_credito.registrar_compra(valor_float, loja.value, descricao_item.value)
-                self.app.mostrar_snackbar("Compra realizada com sucesso.")
-                self.mostrar()
+                cartao_credito = self.app.sessao_atual.cartao_credito
+                nome_loja, descricao = loja.value, descricao_item.value
+
+                def realizar():
+                    return cartao_credito.registrar_compra(para_reais(valor_centavos), nome_loja, descricao)
+
+                def concluir(aprovada):
+                    self.app.mostrar_snackbar("Compra realizada com sucesso." if aprovada else "Compra não aprovada. Verifique o limite disponível.")
+                    if self.app.sessao_atual is not None:
+                        self.mostrar()
+
+                self.app.executar_em_segundo_plano(realizar, concluir, controle=e.control)
             except ValueError:
                 self.app.mostrar_snackbar("Por favor, insira um valor válido.")
 
@@ -1252,7 +1360,7 @@ class MenuCartao:
                 content=ft.Column(
                     [
                         ft.Text("Fazer Compra", size=24, color=ft.colors.PINK, weight=ft.FontWeight.BOLD),
-                        ft.Text(f"Limite Disponível: R${limite_disponivel:.2f}", size=18, color=ft.colors.WHITE),
+                        ft.Text(f"Limite Disponível: R${formatar_reais(limite_disponivel)}", size=18, color=ft.colors.WHITE),
                         valor_compra,
                         loja,
                         descricao_item,
@@ -1276,8 +1384,8 @@ class MenuCartao:
         '''
         self.app.pagina.controls.clear()
 
-        limite_atual = self.app.sistema.sessao_atual.limite_cartao
-        limite_formatado = f"{limite_atual:.2f}".replace(".", ",")
+        limite_atual = self.app.sessao_atual.limite_cartao_centavos
+        limite_formatado = formatar_reais(limite_atual)
 
         valor_aumento = ft.TextField(label="Valor do Aumento", width=300, prefix_text="R$", value="0,00")
 
@@ -1285,18 +1393,7 @@ class MenuCartao:
             '''
             Formata o valor do aumento de limite para o padrão monetário.
             '''
-            input_value = valor_aumento.value
-            input_value = ''.join(filter(str.isdigit, input_value))
-
-            if not input_value:
-                input_value = "0"
-
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"{int(input_value[:-2]):,}.{input_value[-2:]}"
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            valor_aumento.value = formatted_value
+            valor_aumento.value = formatar_digitacao(valor_aumento.value)
             self.app.pagina.update()
 
         def ao_clicar_solicitar(e):
@@ -1304,12 +1401,12 @@ class MenuCartao:
             Trata o clique no botão de solicitar aumento de limite.
             '''
             try:
-                valor_float = float(valor_aumento.value.replace(".", "").replace(",", "."))
-                if valor_float <= limite_atual:
+                valor_centavos = ler_reais(valor_aumento.value)
+                if valor_centavos <= limite_atual:
                     self.app.mostrar_snackbar(f"Solicitação de aumento recusada. O valor solicitado R${valor_aumento.value} deve ser maior que o limite atual de R${limite_formatado}.")
                 else:
-                    self.app.sistema.sessao_atual.cartao_credito.solicitar_aumento_limite(valor_float)
-                    self.app.sistema.sessao_atual.limite_requerido = valor_float
+                    self.app.sessao_atual.cartao_credito.solicitar_aumento_limite(para_reais(valor_centavos))
+                    self.app.sessao_atual.limite_requerido_centavos = valor_centavos
                     self.app.mostrar_snackbar("Solicitação de aumento de limite enviada.")
                     self.mostrar()
             except ValueError:
@@ -1359,30 +1456,56 @@ class MenuCartao:
             )
         )
 
-        cartao_credito = self.app.sistema.sessao_atual.cartao_credito
-        limite_total = self.app.sistema.sessao_atual.limite_cartao
-        limite_disponivel = self.app.sistema.sessao_atual.limite_cartao - self.app.sistema.sessao_atual.divida_cartao
-        divida_atual = self.app.sistema.sessao_atual.divida_cartao
+        cartao_credito = self.app.sessao_atual.cartao_credito
+        limite_total = self.app.sessao_atual.limite_cartao_centavos
+        limite_disponivel = self.app.sessao_atual.limite_cartao_centavos - self.app.sessao_atual.divida_cartao_centavos
+        divida_atual = self.app.sessao_atual.divida_cartao_centavos
 
         detalhes_cartao = [
-            ft.Text(f"Limite Total: R${limite_total:.2f}", size=18, color=ft.colors.WHITE),
-            ft.Text(f"Limite Disponível: R${limite_disponivel:.2f}", size=18, color=ft.colors.WHITE),
-            ft.Text(f"Dívida Atual: R${divida_atual:.2f}", size=18, color=ft.colors.WHITE),
+            ft.Text(f"Limite Total: R${formatar_reais(limite_total)}", size=18, color=ft.colors.WHITE),
+            ft.Text(f"Limite Disponível: R${formatar_reais(limite_disponivel)}", size=18, color=ft.colors.WHITE),
+            ft.Text(f"Dívida Atual: R${formatar_reais(divida_atual)}", size=18, color=ft.colors.WHITE),
         ]
 
-        pasta_faturas = "faturas"
-        arquivo_fatura = os.path.join(pasta_faturas, f"fatura_{self.app.sistema.sessao_atual.get_email().replace('@', '_').replace('.', '_')}.txt")
-        try:
-            with open(arquivo_fatura, 'r') as fatura:
-                compras = fatura.readlines()
-                if compras:
-                    detalhes_cartao.append(ft.Text("\nItens na Fatura:", size=18, color=ft.colors.WHITE))
-                    for compra in compras:
-                        detalhes_cartao.append(ft.Text(compra.strip(), size=16, color=ft.colors.WHITE))
-                else:
-                    detalhes_cartao.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
-        except FileNotFoundError:
-            detalhes_cartao.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
+        gerenciador = self.app.sistema.gerenciador
+        email = self.app.sessao_atual.get_email()
+        detalhes_fatura = ft.Column(
+            [self.app.indicador_carregamento("Carregando fatura...")],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+        detalhes_cartao.append(detalhes_fatura)
+
+        def ler_fatura():
+            '''
+            Lê o resumo, o último extrato fechado e as compras da fatura (executada em segundo plano).
+            '''
+            faturas = gerenciador.faturas  # abre o banco das faturas no primeiro acesso
+            total_fatura, quantidade = faturas.resumo(email)
+            extratos = faturas.extratos(email, limite=1)
+            compras = faturas.listar(email) if quantidade else []
+            return total_fatura, quantidade, extratos, compras
+
+        def exibir_fatura(fatura):
+            '''
+            Exibe a fatura em aberto, o último extrato fechado e as compras lidas.
+            '''
+            total_fatura, quantidade, extratos, compras = fatura
+            itens = [ft.Text(f"Fatura em Aberto: R${formatar_reais(total_fatura)} ({quantidade} compras)", size=18, color=ft.colors.WHITE)]
+            for extrato in extratos:
+                situacao = "paga" if extrato['paga'] else f"vencimento em {extrato['vencimento']}"
+                itens.append(ft.Text(
+                    f"Última Fatura Fechada ({extrato['ciclo']}): R${formatar_reais(extrato['total'])}, "
+                    f"mínimo R${formatar_reais(extrato['pagamento_minimo'])}, {situacao}",
+                    size=18, color=ft.colors.WHITE
+                ))
+            if compras:
+                itens.append(ft.Text("\nItens na Fatura:", size=18, color=ft.colors.WHITE))
+                for compra in compras:
+                    itens.append(ft.Text(str(compra), size=16, color=ft.colors.WHITE))
+            else:
+                itens.append(ft.Text("Nenhuma fatura disponível.", size=18, color=ft.colors.WHITE))
+            detalhes_fatura.controls = itens
+            self.app.pagina.update()
 
         self.app.pagina.add(
             ft.Container(
@@ -1401,6 +1524,7 @@ class MenuCartao:
             )
         )
         self.app.pagina.update()
+        self.app.executar_em_segundo_plano(ler_fatura, exibir_fatura, mensagem_pendente=None)
 
 
 class MenuAdmin:
@@ -1449,7 +1573,7 @@ class MenuAdmin:
             '''
             Trata o clique no botão de logout.
             '''
-            mensagem_logout = self.app.sistema.logout()
+            mensagem_logout = self.app.encerrar_sessao()
             self.app.mostrar_snackbar(mensagem_logout)
             self.app.tela_inicial.mostrar()
 
@@ -1477,9 +1601,31 @@ class MenuAdmin:
     def exibir_aprovacao_cartoes(self):
         '''
         Exibe a interface para aprovação de cartões de crédito.
+
+        A busca das solicitações pendentes percorre todos os usuários e roda em segundo
+        plano; enquanto isso a tela mostra um indicador de carregamento.
+        '''
+        self.app.pagina.controls.clear()
+        self.app.pagina.add(self.app.indicador_carregamento("Carregando solicitações..."))
+        self.app.pagina.update()
+
+        gerenciador = self.app.sistema.gerenciador
+
+        def buscar_pendentes():
+            return [cliente for cliente in gerenciador.usuarios if isinstance(cliente, Cliente) and cliente.status_cartao == StatusCartao.PENDENTE]
+
+        self.app.executar_em_segundo_plano(buscar_pendentes, self._mostrar_aprovacao_cartoes, mensagem_pendente=None)
+
+    def _mostrar_aprovacao_cartoes(self, pendentes):
+        '''
+        Exibe as solicitações de cartão pendentes para aprovação.
+
+        Parâmetros
+        ----------
+        pendentes : list of Cliente
+            Clientes com cartão pendente.
         '''
         self.app.pagina.controls.clear()
-        pendentes = [cliente for cliente in self.app.sistema.gerenciador.usuarios if isinstance(cliente, Cliente) and cliente.status_cartao == 'pendente']
 
         if not pendentes:
             self.app.pagina.add(ft.Text("Nenhum cartão pendente para aprovação.", size=18, color=ft.colors.RED, text_align=ft.TextAlign.CENTER))
@@ -1507,14 +1653,21 @@ class MenuAdmin:
                 indice = int(selecao) - 1
                 cliente_selecionado = pendentes[indice]
                 try:
-                    limite_formatado = limite_inicial.value.replace("R$", "").replace(".", "").replace(",", ".").strip()
-                    limite = float(limite_formatado)
-                    cliente_selecionado.limite_cartao = limite
-                    cliente_selecionado.divida_cartao = 0.0  
-                    cliente_selecionado.status_cartao = 'aprovado'
-                    self.app.sistema.gerenciador.salvar_usuarios()
-                    self.app.mostrar_snackbar(f"Cartão de {cliente_selecionado.get_nome()} aprovado com sucesso.")
-                    self.mostrar()
+                    limite_centavos = ler_reais(limite_inicial.value)
+                    gerenciador = self.app.sistema.gerenciador
+
+                    def aprovar():
+                        with gerenciador.travar_contas(cliente_selecionado):
+                            cliente_selecionado.limite_cartao_centavos = limite_centavos
+                            cliente_selecionado.divida_cartao_centavos = 0
+                            cliente_selecionado.status_cartao = StatusCartao.APROVADO
+                        gerenciador.salvar_usuarios(cliente_selecionado)
+
+                    def concluir(_):
+                        self.app.mostrar_snackbar(f"Cartão de {cliente_selecionado.get_nome()} aprovado com sucesso.")
+                        self.mostrar()
+
+                    self.app.executar_em_segundo_plano(aprovar, concluir, controle=e.control)
                 except ValueError:
                     self.app.mostrar_snackbar("Por favor, insira um valor de limite válido.")
             else:
@@ -1524,18 +1677,7 @@ class MenuAdmin:
             '''
             Formata o valor do limite inicial do cartão.
             '''
-            input_value = limite_inicial.value.replace("R$", "").strip()
-            input_value = ''.join(filter(str.isdigit, input_value))
-
-            if not input_value:
-                input_value = "0"
-
-            while len(input_value) < 3:
-                input_value = "0" + input_value
-
-            formatted_value = f"R${int(input_value[:-2]):,}.{input_value[-2:]}"
-            formatted_value = formatted_value.replace(",", "X").replace(".", ",").replace("X", ".")
-            limite_inicial.value = formatted_value
+            limite_inicial.value = "R$" + formatar_digitacao(limite_inicial.value)
             self.app.pagina.update()
 
         limite_inicial.on_change = formatar_valor
@@ -1575,7 +1717,7 @@ class MenuAdmin:
 
         radios = []
         for i, cliente in enumerate(solicitacoes, start=1):
-            radios.append(ft.Radio(value=str(i), label=f"{cliente.get_nome()} (Email: {cliente.get_email()}, Solicitação: R${cliente.limite_requerido:.2f})"))
+            radios.append(ft.Radio(value=str(i), label=f"{cliente.get_nome()} (Email: {cliente.get_email()}, Solicitação: R${formatar_reais(cliente.limite_requerido_centavos)})"))
 
         grupo_opcoes = ft.RadioGroup(
             value="1", 
@@ -1590,11 +1732,19 @@ class MenuAdmin:
             if selecao is not None:
                 indice = int(selecao) - 1
                 cliente_selecionado = solicitacoes[indice]
-                cliente_selecionado.limite_cartao = cliente_selecionado.limite_requerido
-                cliente_selecionado.limite_requerido = 0  
-                self.app.sistema.gerenciador.salvar_usuarios() 
-                self.app.mostrar_snackbar(f"Limite de {cliente_selecionado.get_nome()} aprovado com sucesso.")
-                self.mostrar()
+                gerenciador = self.app.sistema.gerenciador
+
+                def aprovar():
+                    with gerenciador.travar_contas(cliente_selecionado):
+                        cliente_selecionado.limite_cartao_centavos = cliente_selecionado.limite_requerido_centavos
+                        cliente_selecionado.limite_requerido_centavos = 0
+                    gerenciador.salvar_usuarios(cliente_selecionado)
+
+                def concluir(_):
+                    self.app.mostrar_snackbar(f"Limite de {cliente_selecionado.get_nome()} aprovado com sucesso.")
+                    self.mostrar()
+
+                self.app.executar_em_segundo_plano(aprovar, concluir, controle=e.control)
             else:
                 self.app.mostrar_snackbar("Nenhum cliente selecionado.")
 
@@ -1647,9 +1797,11 @@ class MenuAdmin:
             if selecao is not None:
                 indice = int(selecao) - 1
                 cliente_selecionado = solicitacoes[indice]
-                cliente_selecionado.solicitar_encerramento = False
-                self.app.sistema.gerenciador.usuarios.remove(cliente_selecionado)  
-                self.app.sistema.gerenciador.salvar_usuarios()  
+                gerenciador = self.app.sistema.gerenciador
+                with gerenciador.travar_contas(cliente_selecionado):
+                    cliente_selecionado.solicitar_encerramento = False
+                    gerenciador.remover_usuario(cliente_selecionado)
+                self.app.sistema.sessoes.encerrar_do_usuario(cliente_selecionado.get_email())
                 self.app.mostrar_snackbar(f"Encerramento da conta de {cliente_selecionado.get_nome()} aprovado com sucesso.")
                 self.mostrar()
             else:
@@ -1732,10 +1884,10 @@ class MenuAdmin:
         '''
         self.app.pagina.controls.clear()
 
-        saldo_formatado = f"{cliente.get_saldo():,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        limite_cartao_formatado = f"{cliente.limite_cartao:.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        divida_cartao_formatada = f"{cliente.divida_cartao:.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-        limite_requerido_formatado = f"{cliente.limite_requerido:.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        saldo_formatado = formatar_reais(cliente.get_saldo_centavos())
+        limite_cartao_formatado = formatar_reais(cliente.limite_cartao_centavos)
+        divida_cartao_formatada = formatar_reais(cliente.divida_cartao_centavos)
+        limite_requerido_formatado = formatar_reais(cliente.limite_requerido_centavos)
 
         self.app.pagina.add(
             ft.Container(
@@ -1765,23 +1917,83 @@ class MenuAdmin:
 
 
 class BliBankApp:
-    def __init__(self):
-        '''
-        Inicializa a aplicação BliBank.
+    def __init__(self, sistema: SistemaBliBank = None, tarefas=None):
         '''
-        self.sistema = SistemaBliBank()
+        Inicializa a aplicação BliBank para uma página.
+
+        Parâmetros
+        ----------
+        sistema : SistemaBliBank, opcional
+            Sistema compartilhado pelas páginas abertas no processo. Se omitido, um novo
+            sistema é criado.
+        tarefas : ExecutorTarefas, opcional
+            Executor das tarefas em segundo plano. Se omitido, usa o executor
+            compartilhado do processo.
+        '''
+        self.sistema = sistema or SistemaBliBank()
+        self.tarefas = tarefas or executor_padrao()
+        self.token = None
         self.saldo_texto = None
-        self.tela_inicial = TelaInicial(self)
-        self.tela_login = TelaLogin(self)
-        self.tela_cadastro = TelaCadastro(self)
-        self.menu_cliente = MenuCliente(self)
-        self.menu_operacoes = MenuOperacoes(self)
-        self.tela_valor = TelaValor(self)
-        self.tela_transferencia = TelaTransferencia(self)
-        self.tela_investimento = TelaInvestimento(self)
-        self.resultado_operacao = ResultadoOperacao(self)
-        self.menu_cartao = MenuCartao(self)
-        self.menu_admin = MenuAdmin(self)
+
+    @property
+    def sessao_atual(self):
+        '''
+        Usuário logado nesta página, ou None se não houver sessão ou ela tiver expirado.
+        '''
+        if self.token is None:
+            return None
+        usuario = self.sistema.usuario_da_sessao(self.token)
+        if usuario is None:
+            self.token = None
+        return usuario
+
+    def encerrar_sessao(self) -> str:
+        '''
+        Encerra a sessão desta página, se houver.
+
+        Retorna
+        -------
+        str
+            Mensagem de logout.
+        '''
+        token, self.token = self.token, None
+        return self.sistema.logout(token)
+
+    _TELAS = {
+        'tela_inicial': TelaInicial,
+        'tela_login': TelaLogin,
+        'tela_cadastro': TelaCadastro,
+        'menu_cliente': MenuCliente,
+        'menu_operacoes': MenuOperacoes,
+        'tela_valor': TelaValor,
+        'tela_transferencia': TelaTransferencia,
+        'tela_investimento': TelaInvestimento,
+        'resultado_operacao': ResultadoOperacao,
+        'tela_extrato': TelaExtrato,
+        'menu_cartao': MenuCartao,
+        'menu_admin': MenuAdmin,
+    }
+
+    def __getattr__(self, nome):
+        '''
+        Cria cada tela no primeiro acesso, em vez de construir todas na inicialização.
+
+        Parâmetros
+        ----------
+        nome : str
+            Nome do atributo da tela (ex.: 'menu_cliente').
+
+        Retorna
+        -------
+        object
+            A instância da tela, guardada no aplicativo para os próximos acessos.
+        '''
+        tela = BliBankApp._TELAS.get(nome)
+        if tela is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{nome}'")
+        instancia = tela(self)
+        setattr(self, nome, instancia)
+        return instancia
 
     def inicial(self, pagina: ft.Page):
         '''
@@ -1798,8 +2010,8 @@ class BliBankApp:
         self.pagina.vertical_alignment = ft.MainAxisAlignment.CENTER
         self.pagina.horizontal_alignment = ft.CrossAxisAlignment.CENTER
 
-        saldo_inicial = self.sistema.sessao_atual.get_saldo() if self.sistema.sessao_atual else 0.0
-        saldo_formatado = f"{saldo_inicial:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        saldo_inicial = self.sessao_atual.get_saldo_centavos() if self.sessao_atual else 0
+        saldo_formatado = formatar_reais(saldo_inicial)
 
         self.saldo_texto = ft.Text(f"Saldo: R${saldo_formatado}", size=18, color=ft.colors.WHITE, weight=ft.FontWeight.BOLD)
         self.pagina.add(self.saldo_texto)
@@ -1809,8 +2021,8 @@ class BliBankApp:
         '''
         Atualiza o saldo exibido na interface.
         '''
-        if self.sistema.sessao_atual:
-            saldo_formatado = f"{self.sistema.sessao_atual.get_saldo():,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        if self.sessao_atual:
+            saldo_formatado = formatar_reais(self.sessao_atual.get_saldo_centavos())
             self.saldo_texto.value = f"Saldo: R${saldo_formatado}"
             if self.saldo_texto.page:  
                 self.saldo_texto.update()
@@ -1828,6 +2040,62 @@ class BliBankApp:
         self.pagina.snack_bar.open = True
         self.pagina.update()
 
+    def executar_em_segundo_plano(self, tarefa, ao_concluir, controle=None, mensagem_pendente="Processando..."):
+        '''
+        Executa o trabalho com acesso a disco de uma tela em segundo plano.
+
+        A tela mostra o estado pendente imediatamente (o controle clicado é desabilitado e
+        uma mensagem é exibida) e é atualizada por ao_concluir quando a tarefa termina.
+
+        Parâmetros
+        ----------
+        tarefa : callable
+            Função sem argumentos com a leitura ou gravação.
+        ao_concluir : callable
+            Chamada com o retorno da tarefa para atualizar a tela.
+        controle : ft.Control, opcional
+            Controle desabilitado enquanto a tarefa não termina (ex.: o botão clicado).
+        mensagem_pendente : str, opcional
+            Mensagem exibida enquanto a tarefa roda; None para não exibir.
+        '''
+        if controle is not None:
+            controle.disabled = True
+        if mensagem_pendente:
+            self.mostrar_snackbar(mensagem_pendente)
+        elif controle is not None:
+            self.pagina.update()
+
+        def concluir(resultado):
+            if controle is not None:
+                controle.disabled = False
+            ao_concluir(resultado)
+
+        def falhar(erro):
+            if controle is not None:
+                controle.disabled = False
+            self.mostrar_snackbar(f"Erro ao processar a operação: {erro}")
+
+        self.tarefas.executar(tarefa, concluir, falhar)
+
+    def indicador_carregamento(self, mensagem):
+        '''
+        Cria o indicador exibido enquanto os dados de uma tela são carregados.
+
+        Parâmetros
+        ----------
+        mensagem : str
+            Texto exibido abaixo do indicador.
+
+        Retorna
+        -------
+        ft.Column
+            Coluna com o indicador de progresso e a mensagem.
+        '''
+        return ft.Column(
+            [ft.ProgressRing(), ft.Text(mensagem, size=18, color=ft.colors.WHITE)],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
     def mostrar_resultado_operacao(self, mensagem):
         '''
         Exibe o resultado de uma operação.
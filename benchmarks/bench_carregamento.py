@@ -0,0 +1,134 @@
+'''
+Benchmark do carregamento de usuários na inicialização.
+
+Gera um CSV sintético com o formato de usuarios_BliBank.csv e mede o tempo de
+GerenciadorUsuarios.carregar_usuarios. Se o pandas estiver instalado, mede também
+a leitura antiga (pd.read_csv + iterrows) para comparação. Com --snapshot, grava o
+snapshot binário e mede a inicialização no modo 'sob_demanda' a partir do CSV e do
+snapshot.
+
+Uso: python benchmarks/bench_carregamento.py [--linhas 1000000] [--snapshot]
+'''
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositorioUsuarios import COLUNAS_USUARIO, RepositorioCSV
+from gerenciadorUsuario import GerenciadorUsuarios
+
+
+def gerar_csv(nome_arquivo: str, linhas: int) -> None:
+    '''
+    Gera um CSV de usuários sintético.
+
+    Parâmetros
+    ----------
+    nome_arquivo : str
+        Arquivo a ser criado.
+    linhas : int
+        Quantidade de clientes.
+    '''
+    with open(nome_arquivo, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(COLUNAS_USUARIO)
+        for i in range(linhas):
+            cpf = f"{i:011d}"
+            escritor.writerow([
+                f"Nome{i}", f"Sobrenome{i}", f"cliente{i}@blibank.com", "12345678",
+                f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}", "cliente", f"{i % 10000}.25",
+                "aprovado" if i % 3 == 0 else "nenhum", "1000.00", "12.50", "0.00", "False"
+            ])
+
+
+def medir_pandas(nome_arquivo: str) -> float:
+    '''
+    Mede a leitura antiga com pd.read_csv + iterrows, quando o pandas está disponível.
+
+    Retorna
+    -------
+    float
+        Tempo em segundos, ou None sem pandas.
+    '''
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    inicio = time.perf_counter()
+    usuarios_df = pd.read_csv(nome_arquivo, dtype={'senha': str}).fillna('')
+    for _, row in usuarios_df.iterrows():
+        float(row['saldo']), float(row['limite_cartao']), float(row['divida_cartao'])
+    return time.perf_counter() - inicio
+
+
+def medir_gerenciador(nome_arquivo: str) -> float:
+    '''
+    Mede a criação do GerenciadorUsuarios com o carregador em streaming.
+
+    Retorna
+    -------
+    float
+        Tempo em segundos.
+    '''
+    inicio = time.perf_counter()
+    gerenciador = GerenciadorUsuarios(
+        repositorio=RepositorioCSV(nome_arquivo, usar_journal=False, usar_snapshot=False), durabilidade='sincrono'
+    )
+    duracao = time.perf_counter() - inicio
+    assert len(gerenciador.indice_email) > 0
+    return duracao
+
+
+def medir_sob_demanda(nome_arquivo: str, usar_snapshot: bool) -> float:
+    '''
+    Mede a criação do GerenciadorUsuarios no modo 'sob_demanda', com ou sem o snapshot.
+
+    Retorna
+    -------
+    float
+        Tempo em segundos.
+    '''
+    inicio = time.perf_counter()
+    gerenciador = GerenciadorUsuarios(
+        repositorio=RepositorioCSV(nome_arquivo, usar_journal=False, usar_snapshot=usar_snapshot),
+        durabilidade='sincrono', carregamento='sob_demanda'
+    )
+    duracao = time.perf_counter() - inicio
+    assert gerenciador.buscar_por_email("cliente0@blibank.com") is not None
+    gerenciador.encerrar()
+    return duracao
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=1_000_000)
+    parser.add_argument('--snapshot', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        nome_arquivo = os.path.join(pasta, 'usuarios.csv')
+        gerar_csv(nome_arquivo, args.linhas)
+
+        tempo_pandas = medir_pandas(nome_arquivo)
+        if tempo_pandas is None:
+            print("pandas + iterrows: pandas não instalado")
+        else:
+            print(f"pandas + iterrows: {tempo_pandas:.2f} s ({args.linhas / tempo_pandas:,.0f} linhas/s, só leitura)")
+
+        tempo = medir_gerenciador(nome_arquivo)
+        print(f"carregar_usuarios: {tempo:.2f} s ({args.linhas / tempo:,.0f} linhas/s, com objetos Cliente)")
+
+        if args.snapshot:
+            print(f"sob_demanda pelo CSV: {medir_sob_demanda(nome_arquivo, False):.3f} s")
+            inicio = time.perf_counter()
+            RepositorioCSV(nome_arquivo, usar_journal=False).gravar_snapshot()
+            print(f"gravar_snapshot: {time.perf_counter() - inicio:.2f} s")
+            print(f"sob_demanda pelo snapshot: {medir_sob_demanda(nome_arquivo, True):.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+'''
+Benchmark de transferências simultâneas.
+
+Gera um CSV sintético com N contas e executa transferências aleatórias entre elas
+durante alguns segundos com 1, 2, 4, 8 e 16 threads, informando as operações por
+segundo. Ao final de
+cada rodada confere que o total de dinheiro do banco não mudou e que nenhum saldo
+ficou negativo. Com --travas 1 todas as contas usam a mesma trava, o que equivale
+a uma trava global.
+
+Uso: python benchmarks/bench_concorrencia.py [--contas 10000] [--segundos 5] [--travas 1024] [--durabilidade grupo]
+'''
+import os
+import io
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_carregamento import gerar_csv
+from repositorioUsuarios import RepositorioCSV
+from gerenciadorUsuario import GerenciadorUsuarios
+from travasContas import TravasContas
+
+
+def transferir(gerenciador: GerenciadorUsuarios, contas: int, prazo: float, semente: int, realizadas: list) -> None:
+    '''
+    Executa transferências aleatórias entre as contas até o prazo.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com as contas carregadas.
+    contas : int
+        Quantidade de contas.
+    prazo : float
+        Instante (time.perf_counter) em que a thread para.
+    semente : int
+        Semente do gerador aleatório da thread.
+    realizadas : list of int
+        Lista em que a thread registra quantas transferências executou.
+    '''
+    aleatorio = random.Random(semente)
+    quantidade = 0
+    while time.perf_counter() < prazo:
+        origem, destino = aleatorio.sample(range(contas), 2)
+        cliente = gerenciador.buscar_por_email(f"cliente{origem}@blibank.com")
+        cliente.gestao_conta.transferir(aleatorio.randint(1, 5000) / 100, f"cliente{destino}@blibank.com")
+        quantidade += 1
+    realizadas.append(quantidade)
+
+
+def medir(gerenciador: GerenciadorUsuarios, contas: int, segundos: float, threads: int) -> float:
+    '''
+    Mede as transferências por segundo com uma quantidade de threads.
+
+    Retorna
+    -------
+    float
+        Operações por segundo.
+    '''
+    total_antes = gerenciador.tabela_contas.total('saldo')
+    realizadas = []
+    inicio = time.perf_counter()
+    trabalhadores = [
+        threading.Thread(target=transferir, args=(gerenciador, contas, inicio + segundos, semente, realizadas))
+        for semente in range(threads)
+    ]
+    with redirect_stdout(io.StringIO()):
+        for trabalhador in trabalhadores:
+            trabalhador.start()
+        for trabalhador in trabalhadores:
+            trabalhador.join()
+        duracao = time.perf_counter() - inicio
+
+    assert gerenciador.tabela_contas.total('saldo') == total_antes, "O total de dinheiro mudou."
+    assert min(gerenciador.tabela_contas.coluna('saldo')) >= 0, "Há saldo negativo."
+    return sum(realizadas) / duracao
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contas', type=int, default=10_000)
+    parser.add_argument('--segundos', type=float, default=5.0)
+    parser.add_argument('--travas', type=int, default=1024)
+    parser.add_argument('--durabilidade', choices=['sincrono', 'grupo', 'assincrono'], default='grupo')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        nome_arquivo = os.path.join(pasta, 'usuarios.csv')
+        gerar_csv(nome_arquivo, args.contas)
+        gerenciador = GerenciadorUsuarios(repositorio=RepositorioCSV(nome_arquivo), durabilidade=args.durabilidade)
+        gerenciador.travas = TravasContas(args.travas)
+        try:
+            for threads in args.threads:
+                por_segundo = medir(gerenciador, args.contas, args.segundos, threads)
+                print(f"{threads:>3d} threads ({args.travas} travas, {args.durabilidade}): {por_segundo:10,.0f} transferências/s")
+        finally:
+            gerenciador.encerrar()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+'''
+Benchmark do fechamento do ciclo das faturas.
+
+Gera um banco de faturas sintético com N cartões e algumas compras por cartão e mede
+o tempo de fechamentoFaturas.fechar_ciclo. Com --interromper, o primeiro fechamento
+é abortado após alguns lotes (como em uma queda do processo) e retomado em seguida;
+ao final confere que cada compra foi faturada uma única vez.
+
+Uso: python benchmarks/bench_fechamento.py [--cartoes 1000000] [--compras 3] [--lote 50000] [--interromper 3]
+'''
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from repositorioFaturas import RepositorioFaturas
+from fechamentoFaturas import fechar_ciclo
+
+
+class Interrupcao(Exception):
+    pass
+
+
+def gerar_faturas(faturas: RepositorioFaturas, cartoes: int, compras: int) -> None:
+    '''
+    Insere as compras sintéticas diretamente nas tabelas, em uma transação.
+
+    Parâmetros
+    ----------
+    faturas : RepositorioFaturas
+        Armazenamento de destino.
+    cartoes : int
+        Quantidade de cartões.
+    compras : int
+        Compras por cartão.
+    '''
+    with faturas.conexao:
+        faturas.conexao.executemany(
+            "INSERT INTO compras (email, data, loja, descricao, valor) VALUES (?, ?, 'Loja', 'Item', ?)",
+            ((f"cliente{i}@blibank.com", f"2024-01-{j % 28 + 1:02d} 12:00:00", 1000 + (i + j) % 90000)
+             for i in range(cartoes) for j in range(compras))
+        )
+        faturas.conexao.execute(f"INSERT INTO totais (email, total, quantidade) {faturas.SQL_TOTAIS_DOS_ITENS}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--cartoes', type=int, default=1_000_000)
+    parser.add_argument('--compras', type=int, default=3)
+    parser.add_argument('--lote', type=int, default=50_000)
+    parser.add_argument('--interromper', type=int, default=0, help="Lotes gravados antes da interrupção simulada.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        faturas = RepositorioFaturas(os.path.join(pasta, 'faturas.db'))
+        inicio = time.perf_counter()
+        gerar_faturas(faturas, args.cartoes, args.compras)
+        print(f"Geração: {args.cartoes:,d} cartões, {args.cartoes * args.compras:,d} compras em {time.perf_counter() - inicio:.1f} s")
+        total_esperado = faturas.conexao.execute("SELECT SUM(valor) FROM compras").fetchone()[0]
+
+        inicio = time.perf_counter()
+        if args.interromper:
+            lotes = []
+
+            def interromper(ultimo_email):
+                lotes.append(ultimo_email)
+                if len(lotes) == args.interromper:
+                    raise Interrupcao()
+
+            try:
+                fechar_ciclo(faturas, '2024-02-01', tamanho_lote=args.lote, ao_gravar_lote=interromper)
+            except Interrupcao:
+                print(f"Interrompido após {len(lotes)} lotes (último email: {lotes[-1]}).")
+        resultado = fechar_ciclo(faturas, '2024-02-01', tamanho_lote=args.lote)
+        duracao = time.perf_counter() - inicio
+
+        extratos, total = faturas.conexao.execute("SELECT COUNT(*), SUM(total) FROM extratos").fetchone()
+        abertas = faturas.conexao.execute("SELECT COUNT(*) FROM compras WHERE fatura IS NULL").fetchone()[0]
+        assert extratos == args.cartoes and total == total_esperado and abertas == 0, "Fechamento inconsistente."
+        print(f"Fechamento: {extratos:,d} extratos em {duracao:.1f} s ({extratos / duracao:,.0f} cartões/s)"
+              f"{', retomado' if resultado['retomado'] else ''}")
+        faturas.fechar()
+
+
+if __name__ == '__main__':
+    main()
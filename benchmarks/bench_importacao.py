@@ -0,0 +1,74 @@
+'''
+Benchmark do tempo de importação (partida a frio) dos módulos do BliBank.
+
+Cada módulo é importado em um interpretador novo com "python -X importtime"; o
+tempo cumulativo informado pelo interpretador é registrado, assim como a presença
+de pandas e flet após a importação.
+
+Uso: python benchmarks/bench_importacao.py [--repeticoes 5] [modulo ...]
+'''
+import os
+import sys
+import argparse
+import subprocess
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULOS = ['gerenciadorUsuario', 'cliente', 'administrador', 'sistema', 'app', 'main']
+
+
+def medir(modulo: str) -> tuple:
+    '''
+    Importa o módulo em um processo novo e lê o tempo cumulativo do -X importtime.
+
+    Parâmetros
+    ----------
+    modulo : str
+        Nome do módulo a importar.
+
+    Retorna
+    -------
+    tuple
+        (tempo em ms, módulos pesados carregados), ou (None, mensagem de erro).
+    '''
+    codigo = (
+        f"import {modulo}, sys; "
+        "print(','.join(m for m in ('pandas', 'flet', 'numpy') if m in sys.modules))"
+    )
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=RAIZ, capture_output=True, text=True
+    )
+    if processo.returncode != 0:
+        return None, processo.stderr.strip().splitlines()[-1]
+
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith('import time:'):
+            continue
+        partes = [parte.strip() for parte in linha[len('import time:'):].split('|')]
+        if partes[2] == modulo:
+            return int(partes[1]) / 1000, processo.stdout.strip()
+    return None, "módulo não encontrado na saída do -X importtime"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('modulos', nargs='*', default=MODULOS)
+    args = parser.parse_args()
+
+    for modulo in args.modulos:
+        tempos = []
+        for _ in range(args.repeticoes):
+            tempo, detalhe = medir(modulo)
+            if tempo is None:
+                break
+            tempos.append(tempo)
+        if not tempos:
+            print(f"{modulo:20s} erro: {detalhe}")
+        else:
+            pesados = detalhe or 'nenhum'
+            print(f"{modulo:20s} {min(tempos):8.1f} ms (mínimo de {len(tempos)})   dependências pesadas: {pesados}")
+
+
+if __name__ == '__main__':
+    main()
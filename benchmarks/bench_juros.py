@@ -0,0 +1,77 @@
+'''
+Benchmark dos juros diários do rotativo.
+
+Gera um CSV sintético com N contas (todas com dívida no cartão) e mede
+jurosCartao.acumular_juros, que calcula os juros de todas as contas de uma vez e
+grava as alterações em um lote. Com --comparar M, mede também o laço antigo (um
+cálculo e um salvar_usuarios por cliente) em M contas e estima o tempo para N.
+
+Uso: python benchmarks/bench_juros.py [--contas 1000000] [--comparar 2000]
+'''
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_carregamento import gerar_csv
+from repositorioUsuarios import RepositorioCSV
+from repositorioFaturas import RepositorioFaturas
+from gerenciadorUsuario import GerenciadorUsuarios
+from jurosCartao import acumular_juros, taxa_diaria
+import configuracao
+
+
+def medir_laco(gerenciador: GerenciadorUsuarios, contas: int) -> float:
+    '''
+    Mede o laço por cliente, com uma gravação por conta.
+
+    Retorna
+    -------
+    float
+        Segundos por conta.
+    '''
+    taxa = taxa_diaria(configuracao.JUROS_ROTATIVO_MENSAL)
+    clientes = [gerenciador.buscar_por_email(f"cliente{i}@blibank.com") for i in range(contas)]
+    inicio = time.perf_counter()
+    for cliente in clientes:
+        cliente.divida_cartao_centavos += round(cliente.divida_cartao_centavos * taxa)
+        gerenciador.salvar_usuarios(cliente)
+    return (time.perf_counter() - inicio) / contas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contas', type=int, default=1_000_000)
+    parser.add_argument('--comparar', type=int, default=0)
+    parser.add_argument('--durabilidade', choices=['sincrono', 'grupo', 'assincrono'], default='sincrono')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        nome_arquivo = os.path.join(pasta, 'usuarios.csv')
+        gerar_csv(nome_arquivo, args.contas)
+        gerenciador = GerenciadorUsuarios(
+            repositorio=RepositorioCSV(nome_arquivo), durabilidade=args.durabilidade,
+            faturas=RepositorioFaturas(os.path.join(pasta, 'faturas.db'))
+        )
+        try:
+            divida_antes = gerenciador.tabela_contas.total('divida_cartao')
+            inicio = time.perf_counter()
+            resultado = acumular_juros(gerenciador, '2024-01-01')
+            duracao = time.perf_counter() - inicio
+            assert gerenciador.tabela_contas.total('divida_cartao') == divida_antes + resultado['total']
+            assert gerenciador.faturas.conciliar() == []
+            print(f"Em lote: {resultado['contas']:,d} contas em {duracao:.2f} s")
+            assert acumular_juros(gerenciador, '2024-01-01')['ja_lancado']
+
+            if args.comparar:
+                por_conta = medir_laco(gerenciador, min(args.comparar, args.contas))
+                print(f"Laço por cliente: {por_conta * 1000:.3f} ms por conta, cerca de {por_conta * args.contas:,.0f} s para {args.contas:,d} contas")
+        finally:
+            gerenciador.encerrar()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+'''
+Benchmark da memória ocupada por cliente carregado.
+
+Cria N clientes com campos distintos, como os montados a partir do CSV, e mede
+com tracemalloc a memória alocada por eles (objetos, strings e números),
+informando os bytes por cliente.
+
+Uso: python benchmarks/bench_memoria.py [--contas 100000 1000000]
+'''
+import os
+import sys
+import gc
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cliente import Cliente, StatusCartao
+
+
+def medir(contas: int) -> float:
+    '''
+    Mede a memória alocada por uma quantidade de clientes.
+
+    Parâmetros
+    ----------
+    contas : int
+        Quantidade de clientes a criar.
+
+    Retorna
+    -------
+    float
+        Bytes alocados por cliente.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    clientes = [
+        Cliente(
+            None, nome=f"Nome{i}", sobrenome=f"Sobrenome{i}", email=f"cliente{i}@blibank.com",
+            senha="12345678", cpf=f"{i:011d}", saldo=float(i % 10000), status_cartao=StatusCartao.APROVADO,
+            limite_cartao=1000.0, divida_cartao=float(i % 500), limite_requerido=0.0
+        )
+        for i in range(contas)
+    ]
+    fim, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(clientes) == contas
+    return (fim - inicio) / contas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contas', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for contas in args.contas:
+        por_cliente = medir(contas)
+        print(f"{contas:>10,d} contas: {por_cliente:7.1f} bytes por cliente ({por_cliente * contas / 2**20:8.1f} MiB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+'''
+Benchmark das transferências em lote (folha de pagamento).
+
+Gera um CSV sintético com N contas e mede transferenciasLote.transferir_em_lote
+pagando todas as contas a partir da primeira, com uma única gravação. Com --comparar
+M, mede também o laço antigo (GestaoConta.transferir, com uma gravação por
+transferência) em M pagamentos e estima o tempo para N.
+
+Uso: python benchmarks/bench_transferencias.py [--contas 10000] [--comparar 200] [--durabilidade grupo]
+'''
+import io
+import os
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_carregamento import gerar_csv
+from repositorioUsuarios import RepositorioCSV
+from repositorioLancamentos import RepositorioLancamentos
+from gerenciadorUsuario import GerenciadorUsuarios
+from transferenciasLote import transferir_em_lote
+
+
+def medir_laco(gerenciador: GerenciadorUsuarios, pagador, pagamentos: int) -> float:
+    '''
+    Mede o laço de transferências individuais, com uma gravação por transferência.
+
+    Retorna
+    -------
+    float
+        Segundos por transferência.
+    '''
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(1, pagamentos + 1):
+            pagador.gestao_conta.transferir(10.0, f"cliente{i}@blibank.com")
+    return (time.perf_counter() - inicio) / pagamentos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contas', type=int, default=10_000)
+    parser.add_argument('--comparar', type=int, default=0)
+    parser.add_argument('--durabilidade', choices=['sincrono', 'grupo', 'assincrono'], default='grupo')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        nome_arquivo = os.path.join(pasta, 'usuarios.csv')
+        gerar_csv(nome_arquivo, args.contas)
+        gerenciador = GerenciadorUsuarios(
+            repositorio=RepositorioCSV(nome_arquivo), durabilidade=args.durabilidade,
+            lancamentos=RepositorioLancamentos(os.path.join(pasta, 'lancamentos.db'))
+        )
+        try:
+            pagador = gerenciador.buscar_por_email("cliente0@blibank.com")
+            pagador.set_saldo_centavos(100 * 100 * (args.contas + args.comparar))
+            saldo_antes = gerenciador.tabela_contas.total('saldo')
+            folha = ((pagador.get_email(), f"cliente{i}@blibank.com", 100.0) for i in range(1, args.contas))
+
+            inicio = time.perf_counter()
+            resultado = transferir_em_lote(gerenciador, folha)
+            duracao = time.perf_counter() - inicio
+            assert not resultado['falhas'] and resultado['aplicadas'] == args.contas - 1
+            assert gerenciador.tabela_contas.total('saldo') == saldo_antes
+            print(f"Em lote: {resultado['aplicadas']:,d} transferências em {duracao:.2f} s")
+
+            if args.comparar:
+                por_transferencia = medir_laco(gerenciador, pagador, min(args.comparar, args.contas - 1))
+                print(f"Laço por transferência: {por_transferencia * 1000:.3f} ms cada, cerca de "
+                      f"{por_transferencia * args.contas:,.0f} s para {args.contas:,d} transferências")
+        finally:
+            gerenciador.encerrar()
+
+
+if __name__ == '__main__':
+    main()
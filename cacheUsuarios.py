@@ -0,0 +1,80 @@
+import weakref
+from collections import OrderedDict
+
+
+class CacheUsuarios:
+    def __init__(self, tamanho: int = None) -> None:
+        '''
+        Inicializa o cache de usuários já montados (hidratados).
+
+        Parâmetros
+        ----------
+        tamanho : int, opcional
+            Quantidade máxima de usuários mantidos pelo cache; os usados há mais tempo são
+            descartados primeiro (LRU). None mantém todos os usuários.
+        '''
+        self.tamanho = tamanho
+        self._recentes = OrderedDict()
+        # Usuários descartados pelo LRU mas ainda referenciados (ex.: sessão aberta)
+        # continuam acessíveis, para que nunca existam dois objetos da mesma conta.
+        self._em_uso = weakref.WeakValueDictionary()
+
+    def obter(self, email: str):
+        '''
+        Busca um usuário no cache, marcando-o como usado recentemente.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado do usuário.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário, ou None se ele não estiver no cache.
+        '''
+        usuario = self._recentes.get(email)
+        if usuario is not None:
+            if self.tamanho is not None:
+                self._recentes.move_to_end(email)
+            return usuario
+        if self.tamanho is None:
+            return None
+        usuario = self._em_uso.get(email)
+        if usuario is not None:
+            self.guardar(email, usuario)
+        return usuario
+
+    def guardar(self, email: str, usuario) -> None:
+        '''
+        Inclui um usuário no cache, descartando os menos usados se o limite for excedido.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado do usuário.
+        usuario : Cliente ou Administrador
+            Usuário a ser guardado.
+        '''
+        self._recentes[email] = usuario
+        if self.tamanho is None:
+            return
+        self._recentes.move_to_end(email)
+        self._em_uso[email] = usuario
+        while len(self._recentes) > self.tamanho:
+            self._recentes.popitem(last=False)
+
+    def remover(self, email: str) -> None:
+        '''
+        Retira um usuário do cache.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado do usuário.
+        '''
+        self._recentes.pop(email, None)
+        self._em_uso.pop(email, None)
+
+    def __len__(self) -> int:
+        return len(self._recentes)
@@ -1,10 +1,47 @@
 from interfaceUsuario import Usuario
-import datetime
+from tabelaContas import tabela_avulsa
+from dinheiro import ler_centavos, para_centavos, para_reais, formatar_decimal, formatar_reais
+from enum import Enum
 import random
-import os
+import sqlite3
+
+
+class StatusCartao(str, Enum):
+    '''
+    Situação do cartão de crédito de um cliente.
+
+    Os membros são instâncias únicas compartilhadas por todas as contas e comparam
+    igual às strings gravadas no armazenamento ('nenhum', 'pendente', 'aprovado').
+    '''
+    NENHUM = 'nenhum'
+    PENDENTE = 'pendente'
+    APROVADO = 'aprovado'
+
+    @classmethod
+    def _missing_(cls, valor):
+        if valor is None or str(valor).strip() == '':
+            return cls.NENHUM
+        valor = str(valor).strip().lower()
+        for membro in cls:
+            if membro.value == valor:
+                return membro
+        return None
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, especificacao: str) -> str:
+        return format(self.value, especificacao)
+
 
 class Cliente(Usuario):
-    def __init__(self, gerenciador, nome, sobrenome, email, senha, cpf, saldo=0.0, status_cartao='nenhum', limite_cartao=0.0, divida_cartao=0.0, limite_requerido=0.0, solicitar_encerramento=False):
+    # Os valores numéricos ficam na TabelaContas do gerenciador; o cliente guarda apenas
+    # o id da sua linha.
+    __slots__ = (
+        '__gerenciador', '_tabela', '_id_conta', '_status_cartao', 'solicitar_encerramento'
+    )
+
+    def __init__(self, gerenciador, nome, sobrenome, email, senha, cpf, saldo=0.0, status_cartao=StatusCartao.NENHUM, limite_cartao=0.0, divida_cartao=0.0, limite_requerido=0.0, solicitar_encerramento=False):
         '''
         Inicializa um objeto Cliente.
 
@@ -22,52 +59,193 @@ class Cliente(Usuario):
             Senha do cliente.
         cpf : str
             CPF do cliente.
-        saldo : float, opcional
-            Saldo inicial do cliente.
-        status_cartao : str, opcional
+        saldo : float ou str, opcional
+            Saldo inicial do cliente, em reais.
+        status_cartao : StatusCartao ou str, opcional
             Status do cartão de crédito do cliente.
-        limite_cartao : float, opcional
-            Limite do cartão de crédito do cliente.
-        divida_cartao : float, opcional
-            Dívida atual do cartão de crédito do cliente.
-        limite_requerido : float, opcional
-            Limite de crédito requerido pelo cliente.
+        limite_cartao : float ou str, opcional
+            Limite do cartão de crédito do cliente, em reais.
+        divida_cartao : float ou str, opcional
+            Dívida atual do cartão de crédito do cliente, em reais.
+        limite_requerido : float ou str, opcional
+            Limite de crédito requerido pelo cliente, em reais.
         solicitar_encerramento : bool, opcional
             Indica se o cliente solicitou o encerramento da conta.
         '''
         super().__init__(nome, sobrenome, email, senha, cpf)
         self.__gerenciador = gerenciador
-        self.__saldo = saldo
+        self._tabela = getattr(gerenciador, 'tabela_contas', None)
+        if self._tabela is None:
+            self._tabela = tabela_avulsa()
+        self._id_conta = self._tabela.alocar(
+            saldo=para_centavos(saldo), limite_cartao=para_centavos(limite_cartao),
+            divida_cartao=para_centavos(divida_cartao), limite_requerido=para_centavos(limite_requerido)
+        )
         self.status_cartao = status_cartao
-        self.limite_cartao = limite_cartao
-        self.divida_cartao = divida_cartao
-        self.limite_requerido = limite_requerido
         self.solicitar_encerramento = solicitar_encerramento
-        self.cartao_credito = CartaoCredito(self)
-        self.gestao_conta = GestaoConta(self)  
-        self.investimentos = Investimentos(self)  
+
+    def __del__(self) -> None:
+        tabela = getattr(self, '_tabela', None)
+        if tabela is not None:
+            tabela.liberar(self._id_conta)
+
+    def get_id_conta(self) -> int:
+        '''
+        Retorna o id da linha do cliente na tabela de contas.
+
+        Retorna
+        -------
+        int
+            Id da conta, válido enquanto o objeto Cliente existir.
+        '''
+        return self._id_conta
+
+    @property
+    def limite_cartao(self) -> float:
+        '''
+        Limite do cartão de crédito do cliente, em reais.
+        '''
+        return para_reais(self._tabela.obter(self._id_conta, 'limite_cartao'))
+
+    @limite_cartao.setter
+    def limite_cartao(self, valor: float) -> None:
+        self._tabela.definir(self._id_conta, 'limite_cartao', para_centavos(valor))
+
+    @property
+    def limite_cartao_centavos(self) -> int:
+        '''
+        Limite do cartão de crédito do cliente, em centavos.
+        '''
+        return self._tabela.obter(self._id_conta, 'limite_cartao')
+
+    @limite_cartao_centavos.setter
+    def limite_cartao_centavos(self, centavos: int) -> None:
+        self._tabela.definir(self._id_conta, 'limite_cartao', centavos)
+
+    @property
+    def divida_cartao(self) -> float:
+        '''
+        Dívida atual do cartão de crédito do cliente, em reais.
+        '''
+        return para_reais(self._tabela.obter(self._id_conta, 'divida_cartao'))
+
+    @divida_cartao.setter
+    def divida_cartao(self, valor: float) -> None:
+        self._tabela.definir(self._id_conta, 'divida_cartao', para_centavos(valor))
+
+    @property
+    def divida_cartao_centavos(self) -> int:
+        '''
+        Dívida atual do cartão de crédito do cliente, em centavos.
+        '''
+        return self._tabela.obter(self._id_conta, 'divida_cartao')
+
+    @divida_cartao_centavos.setter
+    def divida_cartao_centavos(self, centavos: int) -> None:
+        self._tabela.definir(self._id_conta, 'divida_cartao', centavos)
+
+    @property
+    def limite_requerido(self) -> float:
+        '''
+        Limite de crédito requerido pelo cliente, em reais.
+        '''
+        return para_reais(self._tabela.obter(self._id_conta, 'limite_requerido'))
+
+    @limite_requerido.setter
+    def limite_requerido(self, valor: float) -> None:
+        self._tabela.definir(self._id_conta, 'limite_requerido', para_centavos(valor))
+
+    @property
+    def limite_requerido_centavos(self) -> int:
+        '''
+        Limite de crédito requerido pelo cliente, em centavos.
+        '''
+        return self._tabela.obter(self._id_conta, 'limite_requerido')
+
+    @limite_requerido_centavos.setter
+    def limite_requerido_centavos(self, centavos: int) -> None:
+        self._tabela.definir(self._id_conta, 'limite_requerido', centavos)
+
+    @property
+    def status_cartao(self) -> StatusCartao:
+        '''
+        Status do cartão de crédito do cliente.
+
+        Aceita atribuição de StatusCartao ou da string correspondente.
+        '''
+        return self._status_cartao
+
+    @status_cartao.setter
+    def status_cartao(self, status) -> None:
+        self._status_cartao = StatusCartao(status)
+
+    @property
+    def cartao_credito(self) -> 'CartaoCredito':
+        '''
+        Operações de cartão de crédito do cliente.
+
+        Os objetos de operações não guardam estado além do cliente, por isso são criados
+        a cada acesso em vez de ocuparem memória em todas as contas carregadas.
+        '''
+        return CartaoCredito(self)
+
+    @property
+    def gestao_conta(self) -> 'GestaoConta':
+        '''
+        Operações de movimentação da conta do cliente.
+        '''
+        return GestaoConta(self)
+
+    @property
+    def investimentos(self) -> 'Investimentos':
+        '''
+        Operações de investimento do cliente.
+        '''
+        return Investimentos(self)
 
     def get_saldo(self) -> float:
         '''
-        Retorna o saldo do cliente, arredondando para sempre manter a formatação monetária.
+        Retorna o saldo do cliente em reais.
 
         Retorna
         -------
         float
             Saldo do cliente.
         '''
-        return round(self.__saldo,2)
+        return para_reais(self._tabela.obter(self._id_conta, 'saldo'))
 
     def set_saldo(self, novo_saldo: float) -> None:
         '''
-        Define o saldo do cliente.
+        Define o saldo do cliente, arredondado para o centavo.
 
         Parâmetros
         ----------
         novo_saldo : float
+            Novo saldo do cliente, em reais.
+        '''
+        self._tabela.definir(self._id_conta, 'saldo', para_centavos(novo_saldo))
+
+    def get_saldo_centavos(self) -> int:
+        '''
+        Retorna o saldo do cliente em centavos.
+
+        Retorna
+        -------
+        int
+            Saldo do cliente.
+        '''
+        return self._tabela.obter(self._id_conta, 'saldo')
+
+    def set_saldo_centavos(self, centavos: int) -> None:
+        '''
+        Define o saldo do cliente em centavos.
+
+        Parâmetros
+        ----------
+        centavos : int
             Novo saldo do cliente.
         '''
-        self.__saldo = novo_saldo
+        self._tabela.definir(self._id_conta, 'saldo', centavos)
 
     def get_gerenciador(self):
         '''
@@ -102,15 +280,17 @@ class Cliente(Usuario):
             'senha': self.get_senha(),
             'cpf': self.get_cpf(),
             'tipo': 'cliente',  
-            'saldo': f"{self.__saldo:.2f}",
-            'status_cartao': self.status_cartao,
-            'limite_cartao': f"{self.limite_cartao:.2f}",
-            'divida_cartao': f"{self.divida_cartao:.2f}",
-            'limite_requerido': f"{self.limite_requerido:.2f}",
+            'saldo': formatar_decimal(self.get_saldo_centavos()),
+            'status_cartao': self._status_cartao.value,
+            'limite_cartao': formatar_decimal(self.limite_cartao_centavos),
+            'divida_cartao': formatar_decimal(self.divida_cartao_centavos),
+            'limite_requerido': formatar_decimal(self.limite_requerido_centavos),
             'solicitar_encerramento': self.solicitar_encerramento
         }
 
 class GestaoConta:
+    __slots__ = ('cliente',)
+
     def __init__(self, cliente: Cliente) -> None:
         '''
         Inicializa um objeto GestaoConta.
@@ -131,58 +311,103 @@ class GestaoConta:
         valor : float
             Valor a ser depositado.
         '''
-        if valor > 0:
-            novo_saldo = self.cliente.get_saldo() + valor
-            self.cliente.set_saldo(novo_saldo)
-            print(f"\nDepósito de R${valor:.2f} realizado com sucesso.")
-            self.cliente.get_gerenciador().salvar_usuarios() 
+        centavos = ler_centavos(valor)
+        if centavos is not None and centavos > 0:
+            gerenciador = self.cliente.get_gerenciador()
+            with gerenciador.travar_contas(self.cliente):
+                saldo = self.cliente.get_saldo_centavos() + centavos
+                self.cliente.set_saldo_centavos(saldo)
+            print(f"\nDepósito de R${formatar_reais(centavos)} realizado com sucesso.")
+            gerenciador.lancamentos.registrar(self.cliente.get_email(), 'deposito', centavos, saldo)
+            gerenciador.salvar_usuarios(self.cliente)
         else:
             print("Valor de depósito inválido.")
 
-    def sacar(self, valor: float) -> None:
+    def sacar(self, valor: float) -> bool:
         '''
         Realiza um saque na conta do cliente.
 
+        A verificação do saldo e o débito são feitos com a conta travada, de modo que
+        saques simultâneos não deixam o saldo negativo.
+
         Parâmetros
         ----------
         valor : float
             Valor a ser sacado.
+
+        Retorna
+        -------
+        bool
+            True se o saque foi realizado, False caso contrário.
         '''
-        if valor <= 0:
+        centavos = ler_centavos(valor)
+        if centavos is None or centavos <= 0:
             print("O valor de saque não pode ser negativo ou zero.")
-        elif self.cliente.get_saldo() < valor:
+            return False
+
+        gerenciador = self.cliente.get_gerenciador()
+        with gerenciador.travar_contas(self.cliente):
+            saldo = self.cliente.get_saldo_centavos()
+            if saldo >= centavos:
+                self.cliente.set_saldo_centavos(saldo - centavos)
+        if saldo < centavos:
             print("\nSaldo insuficiente.")
-        else:
-            novo_saldo = self.cliente.get_saldo() - valor
-            self.cliente.set_saldo(novo_saldo)
-            print(f"Saque de R${valor:.2f} realizado com sucesso. \nSaldo atual: R${self.cliente.get_saldo():.2f}")
-            self.cliente.get_gerenciador().salvar_usuarios()
+            return False
 
-    def transferir(self, valor: float, email_destinatario: str) -> None:
+        print(f"Saque de R${formatar_reais(centavos)} realizado com sucesso. \nSaldo atual: R${formatar_reais(saldo - centavos)}")
+        gerenciador.lancamentos.registrar(self.cliente.get_email(), 'saque', -centavos, saldo - centavos)
+        gerenciador.salvar_usuarios(self.cliente)
+        return True
+
+    def transferir(self, valor: float, email_destinatario: str) -> bool:
         '''
         Realiza uma transferência para outro cliente.
 
+        O débito e o crédito são feitos juntos, com as duas contas travadas (em ordem
+        determinística), e gravados no mesmo lote.
+
         Parâmetros
         ----------
         valor : float
             Valor a ser transferido.
         email_destinatario : str
             Email do destinatário da transferência.
+
+        Retorna
+        -------
+        bool
+            True se a transferência foi realizada, False caso contrário.
         '''
-        destinatario = next((usuario for usuario in self.cliente.get_gerenciador().usuarios if usuario.get_email() == email_destinatario), None)
-        if isinstance(destinatario, Cliente) and valor > 0 and self.cliente.get_saldo() >= valor:
-            novo_saldo_remetente = self.cliente.get_saldo() - valor
-            self.cliente.set_saldo(novo_saldo_remetente)
-    
-            novo_saldo_destinatario = destinatario.get_saldo() + valor
-            destinatario.set_saldo(novo_saldo_destinatario)
-    
-            print(f"Seu saldo atual: R${self.cliente.get_saldo():.2f}")
-    
-            self.cliente.get_gerenciador().salvar_usuarios()
-            destinatario.get_gerenciador().salvar_usuarios()
-        else:
+        gerenciador = self.cliente.get_gerenciador()
+        destinatario = gerenciador.buscar_por_email(email_destinatario)
+        centavos = ler_centavos(valor)
+        if not isinstance(destinatario, Cliente):
             print("Destinatário não é um cliente BliBank.")
+            return False
+        if centavos is None or centavos <= 0:
+            print("Valor de transferência inválido.")
+            return False
+
+        with gerenciador.travar_contas(self.cliente, destinatario):
+            saldo = self.cliente.get_saldo_centavos()
+            if saldo >= centavos:
+                self.cliente.set_saldo_centavos(saldo - centavos)
+                destinatario.set_saldo_centavos(destinatario.get_saldo_centavos() + centavos)
+                saldo -= centavos
+                saldo_destinatario = destinatario.get_saldo_centavos()
+            else:
+                saldo = None
+        if saldo is None:
+            print("\nSaldo insuficiente.")
+            return False
+
+        print(f"Seu saldo atual: R${formatar_reais(saldo)}")
+        gerenciador.lancamentos.registrar_varios([
+            (self.cliente.get_email(), 'transferencia_enviada', -centavos, saldo, destinatario.get_email(), None),
+            (destinatario.get_email(), 'transferencia_recebida', centavos, saldo_destinatario, self.cliente.get_email(), None),
+        ])
+        gerenciador.salvar_usuarios(self.cliente, destinatario)
+        return True
 
     def solicitar_encerramento_conta(self) -> None:
         '''
@@ -192,29 +417,26 @@ class GestaoConta:
             print("Uma solicitação de encerramento de conta já foi feita anteriormente.")
             return
 
-        if self.cliente.get_saldo() != 0:
+        if self.cliente.get_saldo_centavos() != 0:
             print("Não é possível encerrar a conta: o saldo deve ser zero.")
             return
 
-        if self.cliente.divida_cartao != 0:
+        if self.cliente.divida_cartao_centavos != 0:
             print("\nNão é possível encerrar a conta: há dívidas pendentes no cartão de crédito.")
             return
 
-        arquivo_fatura = f"fatura_{self.cliente.get_email().replace('@', '_').replace('.', '_')}.txt"
-        try:
-            with open(arquivo_fatura, 'r') as fatura:
-                if fatura.read().strip():
-                    print("\nNão é possível encerrar a conta: há faturas em aberto.")
-                    return
-        except FileNotFoundError:
-            pass
+        if self.cliente.get_gerenciador().faturas.possui_compras(self.cliente.get_email()):
+            print("\nNão é possível encerrar a conta: há faturas em aberto.")
+            return
 
         self.cliente.solicitar_encerramento = True
-        self.cliente.get_gerenciador().salvar_usuarios()
+        self.cliente.get_gerenciador().salvar_usuarios(self.cliente)
         print("\nSua solicitação de encerramento de conta foi recebida e será processada em breve.")
 
 
 class CartaoCredito:
+    __slots__ = ('cliente',)
+
     def __init__(self, cliente: Cliente) -> None:
         '''
         Inicializa um objeto CartaoCredito.
@@ -235,12 +457,12 @@ class CartaoCredito:
         bool
             True se a solicitação foi enviada, False caso contrário.
         '''
-        if self.cliente.status_cartao == 'nenhum':
-            self.cliente.status_cartao = 'pendente'
+        if self.cliente.status_cartao == StatusCartao.NENHUM:
+            self.cliente.status_cartao = StatusCartao.PENDENTE
             print("Solicitação de cartão de crédito enviada. Aguarde aprovação.")
-            self.cliente.get_gerenciador().salvar_usuarios()
+            self.cliente.get_gerenciador().salvar_usuarios(self.cliente)
             return True
-        elif self.cliente.status_cartao == 'pendente':
+        elif self.cliente.status_cartao == StatusCartao.PENDENTE:
             print("Já há uma solicitação pendente.")
             return False
         else:
@@ -251,26 +473,30 @@ class CartaoCredito:
         '''
         Exibe os detalhes do cartão de crédito do cliente.
         '''
-        if self.cliente.status_cartao == 'aprovado':
-            print(f"\nLimite Total: R${self.cliente.limite_cartao:.2f}")
-            saldo_disponivel = self.cliente.limite_cartao - self.cliente.divida_cartao
-            print(f"Limite Disponível: R${saldo_disponivel:.2f}")
-            print(f"Dívida Atual: R${self.cliente.divida_cartao:.2f}")
+        if self.cliente.status_cartao == StatusCartao.APROVADO:
+            print(f"\nLimite Total: R${formatar_reais(self.cliente.limite_cartao_centavos)}")
+            saldo_disponivel = self.cliente.limite_cartao_centavos - self.cliente.divida_cartao_centavos
+            print(f"Limite Disponível: R${formatar_reais(saldo_disponivel)}")
+            print(f"Dívida Atual: R${formatar_reais(self.cliente.divida_cartao_centavos)}")
     
-            pasta_faturas = "faturas"
-            arquivo_fatura = os.path.join(pasta_faturas, f"fatura_{self.cliente.get_email().replace('@', '_').replace('.', '_')}.txt")
-            try:
-                with open(arquivo_fatura, 'r') as fatura:
-                    compras = fatura.readlines()
-                    print("\nItens na Fatura:")
-                    for compra in compras:
-                        print(compra.strip())
-            except FileNotFoundError:
+            faturas = self.cliente.get_gerenciador().faturas
+            total_fatura, quantidade = faturas.resumo(self.cliente.get_email())
+            print(f"Fatura em Aberto: R${formatar_reais(total_fatura)} ({quantidade} compras)")
+            for extrato in faturas.extratos(self.cliente.get_email(), limite=1):
+                situacao = "paga" if extrato['paga'] else f"vencimento em {extrato['vencimento']}"
+                print(f"Última Fatura Fechada ({extrato['ciclo']}): R${formatar_reais(extrato['total'])}, "
+                      f"pagamento mínimo R${formatar_reais(extrato['pagamento_minimo'])}, {situacao}")
+            compras = faturas.listar(self.cliente.get_email()) if quantidade else []
+            if compras:
+                print("\nItens na Fatura:")
+                for compra in compras:
+                    print(compra)
+            else:
                 print("Nenhuma fatura disponível.")
         else:
             print("Você ainda não possui um cartão de crédito aprovado.")
 
-    def registrar_compra(self, valor: float, loja: str, descricao: str) -> None:
+    def registrar_compra(self, valor: float, loja: str, descricao: str) -> bool:
         '''
         Registra uma compra no cartão de crédito do cliente.
 
@@ -282,75 +508,81 @@ class CartaoCredito:
             Nome da loja onde a compra foi realizada.
         descricao : str
             Descrição da compra.
+
+        Retorna
+        -------
+        bool
+            True se a compra foi aprovada, False caso contrário.
         '''
-        if self.cliente.status_cartao != 'aprovado':
+        if self.cliente.status_cartao != StatusCartao.APROVADO:
             print("Você não possui um cartão de crédito aprovado.")
-            return
+            return False
 
-        if not isinstance(valor, (int, float)) or valor <= 0:
+        centavos = ler_centavos(valor) if isinstance(valor, (int, float)) else None
+        if centavos is None or centavos <= 0:
             print("Valor inválido. Por favor, insira um valor numérico positivo.")
-            return
-
-        if valor > (self.cliente.limite_cartao - self.cliente.divida_cartao):
-            print("Limite de crédito insuficiente.")
-            return
-
-        self.cliente.divida_cartao += valor
+            return False
 
-        pasta_faturas = "faturas"
-        if not os.path.exists(pasta_faturas):
-            os.makedirs(pasta_faturas)
+        gerenciador = self.cliente.get_gerenciador()
+        with gerenciador.travar_contas(self.cliente):
+            if centavos > (self.cliente.limite_cartao_centavos - self.cliente.divida_cartao_centavos):
+                print("Limite de crédito insuficiente.")
+                return False
 
-        arquivo_fatura = os.path.join(pasta_faturas, f"fatura_{self.cliente.get_email().replace('@', '_').replace('.', '_')}.txt")
-        data_hora_atual = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                compra = gerenciador.faturas.registrar(self.cliente.get_email(), loja, descricao, centavos)
+            except sqlite3.Error as e:
+                print(f"Erro ao registrar a compra na fatura: {e}")
+                return False
 
-        try:
-            with open(arquivo_fatura, 'a') as fatura:
-                fatura.write(f"{data_hora_atual},{loja},{descricao},{valor:.2f}\n")
-            print(f"Compra de R${valor:.2f} aprovada na loja {loja} para {descricao}. Data: {data_hora_atual}")
-        except IOError as e:
-            print(f"Erro ao registrar a compra no arquivo: {e}")
+            self.cliente.divida_cartao_centavos += centavos
+            print(f"Compra de R${formatar_reais(centavos)} aprovada na loja {loja} para {descricao}. Data: {compra.data}")
 
-        self.cliente.get_gerenciador().salvar_usuarios()
+        gerenciador.salvar_usuarios(self.cliente)
+        return True
 
-    def pagar_fatura(self) -> None:
+    def pagar_fatura(self) -> bool:
         '''
         Paga a fatura do cartão de crédito do cliente.
+
+        Retorna
+        -------
+        bool
+            True se a fatura foi paga, False caso contrário.
         '''
-        if self.cliente.status_cartao != 'aprovado':
+        if self.cliente.status_cartao != StatusCartao.APROVADO:
             print("Você não possui um cartão de crédito aprovado para pagar faturas.")
-            return
+            return False
 
-        pasta_faturas = "faturas"
-        arquivo_fatura = os.path.join(pasta_faturas, f"fatura_{self.cliente.get_email().replace('@', '_').replace('.', '_')}.txt")
+        gerenciador = self.cliente.get_gerenciador()
+        email = self.cliente.get_email()
         try:
-            with open(arquivo_fatura, 'r') as fatura:
-                compras = fatura.readlines()
+            with gerenciador.travar_contas(self.cliente):
+                total_fatura, quantidade = gerenciador.faturas.resumo(email)
+                if not quantidade:
+                    print("Nenhuma fatura encontrada para ser paga.")
+                    return False
             
-            total_fatura = sum(float(compra.split(',')[3]) for compra in compras)
+                if self.cliente.get_saldo_centavos() < total_fatura:
+                    print("Saldo insuficiente para pagar a fatura.")
+                    print(f"Saldo atual: R${formatar_reais(self.cliente.get_saldo_centavos())}, Total da fatura: R${formatar_reais(total_fatura)}")
+                    return False
             
-            if self.cliente.get_saldo() < total_fatura:
-                print("Saldo insuficiente para pagar a fatura.")
-                print(f"Saldo atual: R${self.cliente.get_saldo():.2f}, Total da fatura: R${total_fatura:.2f}")
-                return
+                print(f"\nFatura a ser Paga: {quantidade} compras, total de R${formatar_reais(total_fatura)}.")
             
-            print("\nDetalhes da Fatura a ser Paga:")
-            for compra in compras:
-                data, loja, descricao, valor = compra.split(',')
-                print(f"{data} - {descricao} na loja {loja} - R$ {valor.strip()}")
+                gerenciador.faturas.quitar(email)
+                print(f"\nFatura paga com sucesso. Total pago: R${formatar_reais(total_fatura)}. Todos os registros de compra foram limpos.")
             
-            os.remove(arquivo_fatura)
-            print(f"\nFatura paga com sucesso. Total pago: R${total_fatura:.2f}. Todos os registros de compra foram limpos.")
-            
-            novo_saldo = self.cliente.get_saldo() - total_fatura
-            self.cliente.set_saldo(novo_saldo)
-            self.cliente.divida_cartao = 0.0
-            self.cliente.get_gerenciador().salvar_usuarios()
+                saldo = self.cliente.get_saldo_centavos() - total_fatura
+                self.cliente.set_saldo_centavos(saldo)
+                self.cliente.divida_cartao_centavos = 0
+            gerenciador.lancamentos.registrar(email, 'pagamento_fatura', -total_fatura, saldo)
+            gerenciador.salvar_usuarios(self.cliente)
+            return True
 
-        except FileNotFoundError:
-            print("Nenhuma fatura encontrada para ser paga.")
         except Exception as e:
             print(f"Erro ao pagar a fatura: {e}")
+        return False
 
     def solicitar_aumento_limite(self, valor: float) -> None:
         '''
@@ -361,19 +593,29 @@ class CartaoCredito:
         valor : float
             Valor do novo limite solicitado.
         '''
-        if self.cliente.status_cartao != 'aprovado':
+        if self.cliente.status_cartao != StatusCartao.APROVADO:
             print("Você não possui um cartão de crédito aprovado para solicitar um aumento de limite.")
             return
 
-        if valor <= self.cliente.limite_cartao:
-            print(f"Solicitação de aumento recusada. O valor solicitado R${valor:.2f} deve ser maior que o limite atual de R${self.cliente.limite_cartao:.2f}.")
+        centavos = ler_centavos(valor)
+        if centavos is None or centavos <= 0:
+            print("Valor de limite inválido.")
+            return
+
+        with self.cliente.get_gerenciador().travar_contas(self.cliente):
+            limite_atual = self.cliente.limite_cartao_centavos
+            if centavos > limite_atual:
+                self.cliente.limite_requerido_centavos = centavos
+        if centavos <= limite_atual:
+            print(f"Solicitação de aumento recusada. O valor solicitado R${formatar_reais(centavos)} deve ser maior que o limite atual de R${formatar_reais(limite_atual)}.")
             return
 
-        self.cliente.limite_requerido = valor
-        self.cliente.get_gerenciador().salvar_usuarios()
-        print(f"Solicitação de aumento de limite para R${valor:.2f} enviada. Aguarde aprovação.")
+        self.cliente.get_gerenciador().salvar_usuarios(self.cliente)
+        print(f"Solicitação de aumento de limite para R${formatar_reais(centavos)} enviada. Aguarde aprovação.")
 
 class Investimentos:
+    __slots__ = ('cliente',)
+
     def __init__(self, cliente: Cliente) -> None:
         '''
         Inicializa um objeto Investimentos.
@@ -410,19 +652,24 @@ class Investimentos:
         }
         tipo_investimento = tipo_investimento.lower()  
         
-        if valor > 0 and valor <= self.cliente.get_saldo():
-            if tipo_investimento in rendimentos:
-                min_rend, max_rend = rendimentos[tipo_investimento]
-                rendimento_percentual = random.uniform(min_rend, max_rend)
-                rendimento_valor = valor * (rendimento_percentual / 100)
-                valor_final = valor + rendimento_valor
-
-                novo_saldo = self.cliente.get_saldo() - valor + valor_final
-                self.cliente.set_saldo(novo_saldo)
-
-                self.cliente.get_gerenciador().salvar_usuarios()
-                return rendimento_percentual, rendimento_valor, valor_final
+        centavos = ler_centavos(valor)
+        if centavos is None:
+            raise ValueError("Valor de investimento inválido.")
+        gerenciador = self.cliente.get_gerenciador()
+        with gerenciador.travar_contas(self.cliente):
+            if centavos > 0 and centavos <= self.cliente.get_saldo_centavos():
+                if tipo_investimento in rendimentos:
+                    min_rend, max_rend = rendimentos[tipo_investimento]
+                    rendimento_percentual = random.uniform(min_rend, max_rend)
+                    rendimento_centavos = round(centavos * rendimento_percentual / 100)
+
+                    saldo = self.cliente.get_saldo_centavos() + rendimento_centavos
+                    self.cliente.set_saldo_centavos(saldo)
+                else:
+                    raise ValueError("Tipo de investimento inválido.")
             else:
-                raise ValueError("Tipo de investimento inválido.")
-        else:
-            raise ValueError("Saldo insuficiente.")
+                raise ValueError("Saldo insuficiente.")
+
+        gerenciador.lancamentos.registrar(self.cliente.get_email(), 'investimento', rendimento_centavos, saldo, descricao=tipo_investimento)
+        gerenciador.salvar_usuarios(self.cliente)
+        return rendimento_percentual, para_reais(rendimento_centavos), para_reais(centavos + rendimento_centavos)
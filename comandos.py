@@ -0,0 +1,270 @@
+'''
+Comandos de manutenção do BliBank.
+
+Uso: python comandos.py <comando> [opções]
+'''
+import argparse
+import configuracao
+from dinheiro import formatar_reais
+
+
+def comando_migrar_sqlite(args) -> None:
+    '''
+    Converte o CSV de usuários em um banco SQLite.
+    '''
+    from repositorioUsuarios import migrar_csv_para_sqlite
+    total = migrar_csv_para_sqlite(args.csv, args.db)
+    print(f"{total} usuários migrados de {args.csv} para {args.db}.")
+
+
+def comando_migrar_faturas(args) -> None:
+    '''
+    Importa as faturas em arquivos de texto (uma por cliente) para o banco de faturas.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    from repositorioFaturas import RepositorioFaturas, migrar_faturas
+    gerenciador = GerenciadorUsuarios(carregamento='sob_demanda', durabilidade='sincrono')
+    faturas = RepositorioFaturas(args.db)
+    try:
+        total = migrar_faturas(list(gerenciador.indice_email), faturas, args.pasta)
+    finally:
+        faturas.fechar()
+        gerenciador.encerrar()
+    print(f"{total} compras migradas de {args.pasta} para {args.db}.")
+
+
+def comando_conciliar_faturas(args) -> None:
+    '''
+    Confere os totais das faturas com os itens e com a dívida de cada cartão.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    gerenciador = GerenciadorUsuarios(carregamento='sob_demanda', durabilidade='sincrono')
+    try:
+        divergencias = gerenciador.faturas.conciliar(corrigir=args.corrigir)
+        for email, total_mantido, total_itens, quantidade_mantida, quantidade_itens in divergencias:
+            print(f"{email}: total mantido R${formatar_reais(total_mantido)} ({quantidade_mantida} compras), "
+                  f"itens R${formatar_reais(total_itens)} ({quantidade_itens} compras)")
+        dividas = 0
+        for usuario in gerenciador.usuarios:
+            if isinstance(usuario, gerenciador.Cliente):
+                total_fatura = gerenciador.faturas.total(usuario.get_email())
+                if usuario.divida_cartao_centavos != total_fatura:
+                    dividas += 1
+                    print(f"{usuario.get_email()}: dívida do cartão R${formatar_reais(usuario.divida_cartao_centavos)}, "
+                          f"fatura R${formatar_reais(total_fatura)}")
+    finally:
+        gerenciador.encerrar()
+    situacao = " (totais corrigidos)" if args.corrigir and divergencias else ""
+    print(f"{len(divergencias)} totais divergentes dos itens{situacao}; {dividas} dívidas divergentes da fatura.")
+
+
+def comando_fechar_ciclo(args) -> None:
+    '''
+    Fecha o ciclo das faturas de todos os cartões, retomando um fechamento interrompido.
+    '''
+    from repositorioFaturas import RepositorioFaturas
+    from fechamentoFaturas import fechar_ciclo
+    faturas = RepositorioFaturas(args.db)
+    try:
+        resultado = fechar_ciclo(faturas, args.data, tamanho_lote=args.lote)
+    finally:
+        faturas.fechar()
+    if resultado['ja_fechado']:
+        print(f"Ciclo {resultado['ciclo']} já havia sido fechado.")
+        return
+    retomado = " (retomado)" if resultado['retomado'] else ""
+    print(f"Ciclo {resultado['ciclo']} fechado{retomado}: {resultado['extratos']} extratos em {resultado['lotes']} lotes, "
+          f"total de R${formatar_reais(resultado['total'])}.")
+
+
+def comando_acumular_juros(args) -> None:
+    '''
+    Aplica os juros diários do rotativo à dívida dos cartões.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    from jurosCartao import acumular_juros
+    gerenciador = GerenciadorUsuarios()
+    try:
+        resultado = acumular_juros(gerenciador, args.data)
+    finally:
+        gerenciador.encerrar()
+    if resultado['ja_lancado']:
+        print(f"Os juros de {resultado['data']} já haviam sido lançados.")
+        return
+    if resultado['interrompido']:
+        print(f"Completados os juros de {resultado['data']} interrompidos em uma execução anterior: "
+              f"{resultado['dividas_corrigidas']} dívidas corrigidas.")
+        if resultado['divergentes']:
+            print(f"{resultado['divergentes']} contas tiveram a dívida alterada depois da interrupção "
+                  "e não foram corrigidas; confira-as antes de prosseguir.")
+    print(f"Juros de {resultado['data']}: R${formatar_reais(resultado['total'])} em {resultado['contas']} contas.")
+
+
+def comando_creditar_rendimentos(args) -> None:
+    '''
+    Credita o rendimento diário aos saldos dos clientes.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    from rendimentoSaldo import creditar_rendimentos
+    gerenciador = GerenciadorUsuarios()
+    try:
+        resultado = creditar_rendimentos(gerenciador, args.data)
+    finally:
+        gerenciador.encerrar()
+    if resultado['ja_lancado']:
+        print(f"O rendimento de {resultado['data']} já havia sido creditado.")
+        return
+    if resultado['interrompido']:
+        print(f"Retomado o crédito do rendimento de {resultado['data']} interrompido em uma execução anterior "
+              f"({resultado['saldos_corrigidos']} saldos refeitos pelo extrato).")
+    print(f"Rendimento de {resultado['data']}: R${formatar_reais(resultado['total'])} em {resultado['contas']} contas.")
+
+
+def comando_processar_pagamentos(args) -> None:
+    '''
+    Aplica os arquivos de pagamentos em lote de uma pasta (ou um arquivo específico).
+    '''
+    from sistema import SistemaBliBank
+    from processadorPagamentos import processar_arquivo, processar_pasta
+    sistema = SistemaBliBank()
+    try:
+        if args.arquivo:
+            resultados = [processar_arquivo(sistema, args.arquivo, args.lote)]
+        else:
+            resultados = processar_pasta(sistema, args.pasta, args.lote)
+    finally:
+        sistema.encerrar()
+    if not resultados:
+        print("Nenhum arquivo de pagamentos a processar.")
+    for resultado in resultados:
+        if resultado['ja_processado']:
+            print(f"{resultado['arquivo']}: já processado.")
+            continue
+        corrigidos = f", {resultado['saldos_corrigidos']} saldos refeitos pelo extrato" if resultado['saldos_corrigidos'] else ''
+        print(f"{resultado['arquivo']}: {resultado['aplicadas']} pagamentos aplicados (R${formatar_reais(resultado['total'])}), "
+              f"{resultado['falhas']} com falha{', retomado' if resultado['retomado'] else ''}{corrigidos}. "
+              f"Resultado em {resultado['arquivo']}.resultado.csv")
+
+
+def comando_importar_usuarios(args) -> None:
+    '''
+    Importa clientes de um arquivo CSV em lote.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    from importacaoUsuarios import importar_usuarios
+    gerenciador = GerenciadorUsuarios()
+    try:
+        resultado = importar_usuarios(gerenciador, args.arquivo, args.processos, args.lote)
+    finally:
+        gerenciador.encerrar()
+    print(f"{resultado['lidos']} linhas lidas: {resultado['importados']} clientes importados, "
+          f"{resultado['rejeitados']} rejeitados (motivos em {resultado['arquivo_rejeitados']}).")
+
+
+def comando_exportar_contas(args) -> None:
+    '''
+    Exporta as contas para CSV, Parquet ou Arrow.
+    '''
+    from gerenciadorUsuario import GerenciadorUsuarios
+    from exportacaoContas import exportar_contas, criar_filtro
+    colunas = [coluna.strip() for coluna in args.colunas.split(',')] if args.colunas else None
+    try:
+        filtro = criar_filtro(status_cartao=args.status_cartao, saldo_minimo=args.saldo_minimo, divida_minima=args.divida_minima)
+    except ValueError as e:
+        print(f"Erro na exportação: {e}")
+        return
+    gerenciador = GerenciadorUsuarios()
+    try:
+        resultado = exportar_contas(
+            gerenciador, args.arquivo, formato=args.formato, colunas=colunas, tipo=args.tipo,
+            filtro=filtro, tamanho_lote=args.lote
+        )
+    except (ImportError, ValueError) as e:
+        print(f"Erro na exportação: {e}")
+        return
+    finally:
+        gerenciador.encerrar()
+    print(f"{resultado['linhas']} contas exportadas para {resultado['arquivo']} ({resultado['formato']}).")
+
+
+def comando_gerar_snapshot(args) -> None:
+    '''
+    Grava o snapshot binário do CSV de usuários, lido no lugar do CSV na inicialização.
+    '''
+    from repositorioUsuarios import RepositorioCSV
+    repositorio = RepositorioCSV(args.csv)
+    try:
+        total = repositorio.gravar_snapshot()
+    finally:
+        repositorio.fechar()
+    print(f"Snapshot de {total} usuários gravado em {repositorio.nome_snapshot}.")
+
+
+def main(argv=None) -> None:
+    '''
+    Interpreta a linha de comando e executa o comando escolhido.
+    '''
+    parser = argparse.ArgumentParser(description="Comandos de manutenção do BliBank.")
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    migrar = subparsers.add_parser('migrar-sqlite', help="Converte o CSV de usuários em um banco SQLite.")
+    migrar.add_argument('--csv', default=configuracao.ARQUIVO_USUARIOS_CSV, help="CSV de origem.")
+    migrar.add_argument('--db', default=configuracao.ARQUIVO_USUARIOS_SQLITE, help="Banco SQLite de destino.")
+    migrar.set_defaults(funcao=comando_migrar_sqlite)
+
+    faturas = subparsers.add_parser('migrar-faturas', help="Importa as faturas em arquivos de texto para o banco de faturas.")
+    faturas.add_argument('--pasta', default='faturas', help="Pasta das faturas em texto.")
+    faturas.add_argument('--db', default=configuracao.ARQUIVO_FATURAS, help="Banco de faturas de destino.")
+    faturas.set_defaults(funcao=comando_migrar_faturas)
+
+    conciliar = subparsers.add_parser('conciliar-faturas', help="Confere os totais das faturas com os itens e com as dívidas.")
+    conciliar.add_argument('--corrigir', action='store_true', help="Recalcula os totais divergentes a partir dos itens.")
+    conciliar.set_defaults(funcao=comando_conciliar_faturas)
+
+    fechar = subparsers.add_parser('fechar-ciclo', help="Fecha o ciclo das faturas de todos os cartões.")
+    fechar.add_argument('--data', default=None, help="Data de fechamento (AAAA-MM-DD). Padrão: hoje.")
+    fechar.add_argument('--lote', type=int, default=configuracao.LOTE_FECHAMENTO, help="Contas gravadas por transação.")
+    fechar.add_argument('--db', default=configuracao.ARQUIVO_FATURAS, help="Banco de faturas.")
+    fechar.set_defaults(funcao=comando_fechar_ciclo)
+
+    juros = subparsers.add_parser('acumular-juros', help="Aplica os juros diários do rotativo à dívida dos cartões.")
+    juros.add_argument('--data', default=None, help="Dia dos juros (AAAA-MM-DD). Padrão: hoje.")
+    juros.set_defaults(funcao=comando_acumular_juros)
+
+    rendimento = subparsers.add_parser('creditar-rendimentos', help="Credita o rendimento diário aos saldos dos clientes.")
+    rendimento.add_argument('--data', default=None, help="Dia do rendimento (AAAA-MM-DD). Padrão: hoje.")
+    rendimento.set_defaults(funcao=comando_creditar_rendimentos)
+
+    pagamentos = subparsers.add_parser('processar-pagamentos', help="Aplica os arquivos CSV de pagamentos em lote.")
+    pagamentos.add_argument('--pasta', default=configuracao.PASTA_PAGAMENTOS, help="Pasta dos arquivos de pagamentos.")
+    pagamentos.add_argument('--arquivo', default=None, help="Processa apenas este arquivo.")
+    pagamentos.add_argument('--lote', type=int, default=configuracao.LOTE_PAGAMENTOS, help="Linhas aplicadas por gravação.")
+    pagamentos.set_defaults(funcao=comando_processar_pagamentos)
+
+    importar = subparsers.add_parser('importar-usuarios', help="Importa clientes de um arquivo CSV em lote.")
+    importar.add_argument('arquivo', help="CSV com as colunas nome, sobrenome, email, senha e cpf.")
+    importar.add_argument('--processos', type=int, default=configuracao.PROCESSOS_IMPORTACAO, help="Processos de validação.")
+    importar.add_argument('--lote', type=int, default=configuracao.LOTE_IMPORTACAO, help="Linhas validadas por lote.")
+    importar.set_defaults(funcao=comando_importar_usuarios)
+
+    exportar = subparsers.add_parser('exportar-contas', help="Exporta as contas para CSV, Parquet ou Arrow.")
+    exportar.add_argument('arquivo', help="Arquivo de destino.")
+    exportar.add_argument('--formato', choices=['csv', 'parquet', 'arrow'], default=None, help="Padrão: pela extensão do arquivo.")
+    exportar.add_argument('--colunas', default=None, help="Colunas separadas por vírgula. Padrão: todas menos a senha.")
+    exportar.add_argument('--tipo', choices=['cliente', 'admin'], default=None, help="Exporta apenas um tipo de usuário.")
+    exportar.add_argument('--status-cartao', choices=['nenhum', 'pendente', 'aprovado'], default=None)
+    exportar.add_argument('--saldo-minimo', default=None, help="Saldo mínimo em reais (ex.: 100.00).")
+    exportar.add_argument('--divida-minima', default=None, help="Dívida mínima do cartão em reais.")
+    exportar.add_argument('--lote', type=int, default=configuracao.LOTE_EXPORTACAO, help="Linhas por lote.")
+    exportar.set_defaults(funcao=comando_exportar_contas)
+
+    snapshot = subparsers.add_parser('gerar-snapshot', help="Grava o snapshot binário do CSV de usuários.")
+    snapshot.add_argument('--csv', default=configuracao.ARQUIVO_USUARIOS_CSV, help="CSV de usuários.")
+    snapshot.set_defaults(funcao=comando_gerar_snapshot)
+
+    args = parser.parse_args(argv)
+    args.funcao(args)
+
+
+if __name__ == '__main__':
+    main()
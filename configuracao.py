@@ -0,0 +1,61 @@
+'''
+Configurações do BliBank.
+
+Os valores podem ser alterados por variáveis de ambiente sem modificar o código.
+'''
+import os
+
+# Armazenamento de usuários: 'csv' ou 'sqlite'.
+BACKEND_USUARIOS = os.environ.get('BLIBANK_BACKEND', 'csv').lower()
+ARQUIVO_USUARIOS_CSV = os.environ.get('BLIBANK_ARQUIVO_CSV', 'usuarios_BliBank.csv')
+ARQUIVO_USUARIOS_SQLITE = os.environ.get('BLIBANK_ARQUIVO_SQLITE', 'usuarios_BliBank.db')
+
+# Faturas dos cartões: um banco SQLite com as compras de todas as contas.
+ARQUIVO_FATURAS = os.environ.get('BLIBANK_ARQUIVO_FATURAS', 'faturas_BliBank.db')
+
+# Fechamento das faturas: dias até o vencimento, pagamento mínimo (% do total e piso em
+# centavos) e contas gravadas por transação.
+DIAS_VENCIMENTO = int(os.environ.get('BLIBANK_DIAS_VENCIMENTO', '10'))
+PERCENTUAL_MINIMO = int(os.environ.get('BLIBANK_PERCENTUAL_MINIMO', '15'))
+PISO_MINIMO = int(os.environ.get('BLIBANK_PISO_MINIMO_CENTAVOS', '5000'))
+LOTE_FECHAMENTO = int(os.environ.get('BLIBANK_LOTE_FECHAMENTO', '50000'))
+
+# Juros do rotativo do cartão: taxa mensal (0.12 = 12% ao mês), cobrada por dia.
+JUROS_ROTATIVO_MENSAL = float(os.environ.get('BLIBANK_JUROS_ROTATIVO_MENSAL', '0.12'))
+
+# Lançamentos das contas: um banco SQLite com o registro das rotinas diárias.
+ARQUIVO_LANCAMENTOS = os.environ.get('BLIBANK_ARQUIVO_LANCAMENTOS', 'lancamentos_BliBank.db')
+
+# Rendimento diário dos saldos, no estilo do CDI (0.0005 = 0,05% ao dia).
+RENDIMENTO_DIARIO = float(os.environ.get('BLIBANK_RENDIMENTO_DIARIO', '0.0005'))
+
+# Arquivos de pagamentos em lote: pasta de entrada e linhas aplicadas por gravação.
+PASTA_PAGAMENTOS = os.environ.get('BLIBANK_PASTA_PAGAMENTOS', 'pagamentos')
+LOTE_PAGAMENTOS = int(os.environ.get('BLIBANK_LOTE_PAGAMENTOS', '10000'))
+
+# Importação de usuários em lote: processos de validação e linhas por lote.
+PROCESSOS_IMPORTACAO = int(os.environ.get('BLIBANK_PROCESSOS_IMPORTACAO', str(os.cpu_count() or 1)))
+LOTE_IMPORTACAO = int(os.environ.get('BLIBANK_LOTE_IMPORTACAO', '5000'))
+
+# Exportação das contas: linhas por lote (grupo de linhas no Parquet).
+LOTE_EXPORTACAO = int(os.environ.get('BLIBANK_LOTE_EXPORTACAO', '50000'))
+
+# Journal do backend CSV.
+USAR_JOURNAL = os.environ.get('BLIBANK_JOURNAL', '1') == '1'
+LIMITE_JOURNAL = int(os.environ.get('BLIBANK_LIMITE_JOURNAL', '1000'))
+# Snapshot binário do CSV, gravado a cada compactação e lido na inicialização.
+USAR_SNAPSHOT = os.environ.get('BLIBANK_SNAPSHOT', '1') == '1'
+
+# Gravação das contas: 'sincrono', 'grupo' ou 'assincrono'.
+DURABILIDADE = os.environ.get('BLIBANK_DURABILIDADE', 'grupo').lower()
+JANELA_GRUPO = int(os.environ.get('BLIBANK_JANELA_GRUPO_MS', '50')) / 1000
+
+# Carregamento dos usuários: 'completo' ou 'sob_demanda' (índice + cache LRU).
+CARREGAMENTO = os.environ.get('BLIBANK_CARREGAMENTO', 'completo').lower()
+TAMANHO_CACHE = int(os.environ.get('BLIBANK_TAMANHO_CACHE', '10000'))
+
+# Sessões: minutos sem uso até a sessão expirar.
+TEMPO_SESSAO = int(os.environ.get('BLIBANK_TEMPO_SESSAO_MIN', '15')) * 60
+
+# API assíncrona: threads que executam as operações com acesso a disco.
+TRABALHADORES_IO = int(os.environ.get('BLIBANK_TRABALHADORES_IO', '16'))
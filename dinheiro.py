@@ -0,0 +1,179 @@
+'''
+Valores monetários em centavos.
+
+Saldos, limites e dívidas são guardados como inteiros de centavos, o que torna a
+aritmética exata (sem arredondamentos a cada leitura) e permite operar sobre
+vetores de inteiros. Este módulo converte de e para reais e concentra a
+formatação no padrão brasileiro usada pelas telas.
+'''
+import math
+from decimal import Decimal, ROUND_HALF_UP
+
+
+def para_centavos(valor) -> int:
+    '''
+    Converte um valor em reais para centavos.
+
+    Parâmetros
+    ----------
+    valor : int, float, str ou Decimal
+        Valor em reais. Strings usam ponto como separador decimal ("1234.56"), como no
+        armazenamento; para textos digitados nas telas use ler_reais.
+
+    Retorna
+    -------
+    int
+        Valor em centavos, arredondado para o centavo mais próximo.
+
+    Raises
+    ------
+    ValueError
+        Se o valor não for finito ("nan", "inf").
+    '''
+    if isinstance(valor, bool):
+        raise TypeError("Valor monetário inválido.")
+    if isinstance(valor, int):
+        return valor * 100
+    if isinstance(valor, float):
+        if not math.isfinite(valor):
+            raise ValueError("Valor monetário inválido.")
+        # repr dá o menor texto que identifica o float (0.125 -> '0.125'), e assim
+        # o arredondamento coincide com o do mesmo valor lido como texto.
+        valor = Decimal(repr(valor)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        return int(valor * 100)
+    if isinstance(valor, str):
+        texto = valor.strip()
+        inteiro, separador, fracao = texto.partition('.')
+        if separador and len(fracao) <= 2 and fracao.isdigit() and inteiro.lstrip('-').isdigit():
+            centavos = int(inteiro.lstrip('-')) * 100 + int(fracao.ljust(2, '0'))
+            return -centavos if inteiro.startswith('-') else centavos
+        valor = Decimal(texto or '0')
+    if not Decimal(valor).is_finite():
+        raise ValueError("Valor monetário inválido.")
+    return int((Decimal(valor) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+def ler_centavos(valor):
+    '''
+    Converte um valor em reais para centavos sem lançar exceções.
+
+    É a conversão usada nas operações que recebem valores de fora (depósitos,
+    saques, compras...): valores não numéricos ou não finitos viram None, e cada
+    operação responde com a sua mensagem de falha habitual.
+
+    Parâmetros
+    ----------
+    valor : int, float, str ou Decimal
+        Valor em reais.
+
+    Retorna
+    -------
+    int ou None
+        Valor em centavos, ou None se o valor for inválido.
+    '''
+    try:
+        return para_centavos(valor)
+    except (ArithmeticError, TypeError, ValueError):
+        return None
+
+
+def para_reais(centavos: int) -> float:
+    '''
+    Converte centavos para reais.
+
+    Parâmetros
+    ----------
+    centavos : int
+        Valor em centavos.
+
+    Retorna
+    -------
+    float
+        Valor em reais.
+    '''
+    return centavos / 100
+
+
+def formatar_decimal(centavos: int) -> str:
+    '''
+    Formata centavos no formato do armazenamento ("1234.56").
+
+    Parâmetros
+    ----------
+    centavos : int
+        Valor em centavos.
+
+    Retorna
+    -------
+    str
+        Valor com ponto decimal e duas casas.
+    '''
+    inteiro, fracao = divmod(abs(int(centavos)), 100)
+    sinal = '-' if centavos < 0 else ''
+    return f"{sinal}{inteiro}.{fracao:02d}"
+
+
+def formatar_reais(centavos: int) -> str:
+    '''
+    Formata centavos no padrão brasileiro ("1.234,56"), sem o símbolo R$.
+
+    Parâmetros
+    ----------
+    centavos : int
+        Valor em centavos.
+
+    Retorna
+    -------
+    str
+        Valor com separador de milhar e vírgula decimal.
+    '''
+    inteiro, fracao = divmod(abs(int(centavos)), 100)
+    sinal = '-' if centavos < 0 else ''
+    return f"{sinal}{inteiro:,}".replace(',', '.') + f",{fracao:02d}"
+
+
+def ler_reais(texto: str) -> int:
+    '''
+    Lê um valor digitado no padrão brasileiro ("R$1.234,56", "1234,5" ou "10").
+
+    Parâmetros
+    ----------
+    texto : str
+        Texto digitado.
+
+    Retorna
+    -------
+    int
+        Valor em centavos.
+
+    Raises
+    ------
+    ValueError
+        Se o texto não contiver um valor.
+    '''
+    texto = texto.replace('R$', '').replace('.', '').strip()
+    inteiro, separador, fracao = texto.partition(',')
+    inteiro = inteiro.strip() or '0'
+    if not inteiro.isdigit() or (separador and not fracao.isdigit()) or len(fracao) > 2:
+        raise ValueError(f"Valor inválido: {texto}")
+    return int(inteiro) * 100 + int(fracao.ljust(2, '0') or '0')
+
+
+def formatar_digitacao(texto: str) -> str:
+    '''
+    Formata o conteúdo de um campo de valor enquanto o usuário digita.
+
+    Os dígitos são lidos como centavos: "123456" vira "1.234,56".
+
+    Parâmetros
+    ----------
+    texto : str
+        Conteúdo atual do campo.
+
+    Retorna
+    -------
+    str
+        Valor formatado no padrão brasileiro.
+    '''
+    digitos = ''.join(filter(str.isdigit, texto))
+    return formatar_reais(int(digitos or '0'))
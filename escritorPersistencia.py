@@ -0,0 +1,251 @@
+import atexit
+import threading
+import time
+
+
+class EscritorPersistencia:
+    SINCRONO = 'sincrono'
+    GRUPO = 'grupo'
+    ASSINCRONO = 'assincrono'
+    _REMOVIDO = object()
+
+    def __init__(self, repositorio, gerar_snapshot, durabilidade: str = GRUPO, janela: float = 0.05) -> None:
+        '''
+        Inicializa o escritor que agrupa as gravações de contas em segundo plano.
+
+        Parâmetros
+        ----------
+        repositorio : RepositorioUsuarios
+            Armazenamento onde as alterações são gravadas.
+        gerar_snapshot : callable
+            Função sem argumentos que retorna os registros de todos os usuários,
+            usada quando o armazenamento pede compactação.
+        durabilidade : str, opcional
+            'sincrono' grava na própria chamada; 'grupo' agrupa as alterações da janela
+            em uma gravação e só retorna quando ela estiver em disco; 'assincrono'
+            retorna imediatamente e grava em segundo plano.
+        janela : float, opcional
+            Tempo, em segundos, durante o qual as alterações são acumuladas antes de gravar.
+        '''
+        if durabilidade not in (self.SINCRONO, self.GRUPO, self.ASSINCRONO):
+            raise ValueError(f"Nível de durabilidade inválido: {durabilidade}")
+        self.repositorio = repositorio
+        self.gerar_snapshot = gerar_snapshot
+        self.durabilidade = durabilidade
+        self.janela = janela
+        self._pendentes = {}
+        self._em_gravacao = {}
+        self._snapshot_solicitado = False
+        self._geracao = 0
+        self._geracao_gravada = 0
+        self._geracao_com_erro = 0
+        self._encerrando = False
+        self._condicao = threading.Condition()
+        self._trava_gravacao = threading.Lock()
+        self._thread = None
+        if durabilidade != self.SINCRONO:
+            self._thread = threading.Thread(target=self._executar, name="EscritorPersistencia", daemon=True)
+            self._thread.start()
+            atexit.register(self.encerrar)
+
+    def salvar(self, registros: list, esperar: bool = True) -> int:
+        '''
+        Marca contas como alteradas.
+
+        Parâmetros
+        ----------
+        registros : list of dict
+            Registros das contas alteradas; os de uma mesma chamada são gravados juntos.
+        esperar : bool, opcional
+            Se False, apenas enfileira as alterações, mesmo na durabilidade 'grupo'; a
+            espera é feita depois com aguardar(geracao).
+
+        Retorna
+        -------
+        int
+            Geração das alterações, para uso em aguardar.
+        '''
+        return self._enfileirar({registro['email']: registro for registro in registros}, esperar=esperar)
+
+    def remover(self, email: str) -> None:
+        '''
+        Marca uma conta como removida.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta removida.
+        '''
+        self._enfileirar({email: self._REMOVIDO})
+
+    def registro_pendente(self, email: str):
+        '''
+        Busca uma alteração ainda não gravada de uma conta.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+
+        Retorna
+        -------
+        tuple
+            (True, registro) se houver alteração pendente, sendo registro None para
+            remoções; (False, None) caso contrário.
+        '''
+        with self._condicao:
+            for lote in (self._pendentes, self._em_gravacao):
+                if email in lote:
+                    registro = lote[email]
+                    return True, (None if registro is self._REMOVIDO else registro)
+        return False, None
+
+    def gravar_todos(self) -> None:
+        '''
+        Solicita a gravação completa (compactação) de todas as contas.
+        '''
+        self._enfileirar({}, snapshot=True)
+
+    def descarregar(self) -> None:
+        '''
+        Barreira: aguarda até que todas as alterações solicitadas estejam gravadas.
+        '''
+        if self._thread is None:
+            return
+        with self._condicao:
+            geracao = self._geracao
+            self._condicao.notify_all()
+        self._aguardar(geracao)
+
+    def encerrar(self) -> None:
+        '''
+        Grava as alterações pendentes e encerra a thread de gravação.
+        '''
+        if self._thread is None or not self._thread.is_alive():
+            return
+        self.descarregar()
+        with self._condicao:
+            self._encerrando = True
+            self._condicao.notify_all()
+        self._thread.join()
+
+    def aguardar(self, geracao: int) -> None:
+        '''
+        Aguarda, conforme a durabilidade, a gravação de alterações enfileiradas com esperar=False.
+
+        Parâmetros
+        ----------
+        geracao : int
+            Geração retornada por salvar.
+        '''
+        if self.durabilidade == self.GRUPO:
+            self._aguardar(geracao)
+
+    def _enfileirar(self, alteracoes: dict, snapshot: bool = False, esperar: bool = True) -> int:
+        '''
+        Registra alterações; de acordo com a durabilidade, grava agora, aguarda o grupo ou retorna.
+
+        Parâmetros
+        ----------
+        alteracoes : dict
+            Registros (ou o marcador de remoção) indexados por email.
+        snapshot : bool, opcional
+            Se True, solicita a gravação completa.
+        esperar : bool, opcional
+            Se False, não aguarda a gravação do grupo.
+
+        Retorna
+        -------
+        int
+            Geração das alterações (0 na durabilidade 'sincrono', em que já estão gravadas).
+        '''
+        if self.durabilidade == self.SINCRONO:
+            self._gravar(alteracoes, snapshot)
+            return 0
+
+        with self._condicao:
+            self._pendentes.update(alteracoes)
+            self._snapshot_solicitado = self._snapshot_solicitado or snapshot
+            self._geracao += 1
+            geracao = self._geracao
+            self._condicao.notify_all()
+
+        if esperar and self.durabilidade == self.GRUPO:
+            self._aguardar(geracao)
+        return geracao
+
+    def _aguardar(self, geracao: int) -> None:
+        '''
+        Aguarda a gravação da geração informada.
+
+        Parâmetros
+        ----------
+        geracao : int
+            Geração das alterações a aguardar.
+        '''
+        with self._condicao:
+            while self._geracao_gravada < geracao and self._thread.is_alive():
+                self._condicao.wait()
+            if geracao and self._geracao_com_erro >= geracao:
+                raise OSError("Falha ao gravar as alterações das contas; nova tentativa será feita.")
+
+    def _executar(self) -> None:
+        '''
+        Laço da thread de gravação: acumula as alterações durante a janela e grava o lote.
+        '''
+        while True:
+            with self._condicao:
+                while self._geracao_gravada == self._geracao and not self._encerrando:
+                    self._condicao.wait()
+                if self._encerrando and self._geracao_gravada == self._geracao:
+                    return
+
+            time.sleep(self.janela)
+
+            with self._condicao:
+                lote, self._pendentes = self._pendentes, {}
+                self._em_gravacao = lote
+                snapshot, self._snapshot_solicitado = self._snapshot_solicitado, False
+                geracao = self._geracao
+
+            try:
+                self._gravar(lote, snapshot)
+                erro = False
+            except Exception as e:
+                print(f"Erro ao gravar as contas: {e}")
+                erro = True
+
+            with self._condicao:
+                self._em_gravacao = {}
+                if erro:
+                    for email, registro in lote.items():
+                        self._pendentes.setdefault(email, registro)
+                    self._snapshot_solicitado = self._snapshot_solicitado or snapshot
+                    self._geracao_com_erro = geracao
+                    if self._geracao == geracao:
+                        self._geracao += 1
+                self._geracao_gravada = geracao
+                self._condicao.notify_all()
+            if erro:
+                time.sleep(1)
+
+    def _gravar(self, lote: dict, snapshot: bool) -> None:
+        '''
+        Grava um lote de alterações em uma única operação do armazenamento.
+
+        Parâmetros
+        ----------
+        lote : dict
+            Registros (ou o marcador de remoção) indexados por email.
+        snapshot : bool
+            Se True, grava todas as contas após o lote.
+        '''
+        with self._trava_gravacao:
+            registros = [registro for registro in lote.values() if registro is not self._REMOVIDO]
+            if registros:
+                self.repositorio.salvar(registros)
+            for email, registro in lote.items():
+                if registro is self._REMOVIDO:
+                    self.repositorio.remover(email)
+            if snapshot or self.repositorio.precisa_compactar():
+                self.repositorio.gravar_todos(self.gerar_snapshot())
@@ -0,0 +1,228 @@
+'''
+Exportação das contas para CSV, Parquet ou Arrow.
+
+Os registros são percorridos por um gerador (GerenciadorUsuarios.registros_armazenados,
+que no modo 'sob_demanda' lê o armazenamento sequencialmente), filtrados,
+reduzidos às colunas pedidas e gravados em lotes de tamanho fixo, de modo que a
+memória usada depende do tamanho do lote e não da quantidade de contas. Por padrão a
+senha não é exportada. O arquivo é gravado com outro nome e renomeado no final, para
+que uma exportação interrompida não deixe um arquivo incompleto no destino.
+
+Parquet e Arrow usam o pyarrow, se instalado; os valores em reais são gravados como
+decimais de duas casas.
+'''
+import os
+import csv
+from decimal import Decimal
+
+import configuracao
+from dinheiro import para_centavos
+from repositorioUsuarios import COLUNAS_USUARIO, COLUNAS_VALORES
+
+COLUNAS_PADRAO = tuple(coluna for coluna in COLUNAS_USUARIO if coluna != 'senha')
+FORMATOS = ('csv', 'parquet', 'arrow')
+
+
+def _importar_pyarrow():
+    '''
+    Importa o pyarrow se ele estiver instalado.
+
+    Retorna
+    -------
+    module
+        O módulo pyarrow, ou None se ele não estiver disponível.
+    '''
+    try:
+        import pyarrow
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def criar_filtro(status_cartao: str = None, saldo_minimo=None, divida_minima=None, com_encerramento: bool = None):
+    '''
+    Cria um filtro de registros a partir de critérios simples.
+
+    Parâmetros
+    ----------
+    status_cartao : str, opcional
+        Situação do cartão ('nenhum', 'pendente' ou 'aprovado').
+    saldo_minimo : float ou str, opcional
+        Saldo mínimo, em reais (inclusive).
+    divida_minima : float ou str, opcional
+        Dívida mínima do cartão, em reais (inclusive).
+    com_encerramento : bool, opcional
+        Se informado, apenas contas com (True) ou sem (False) encerramento solicitado.
+
+    Retorna
+    -------
+    callable
+        Função que recebe um registro e retorna True se ele deve ser exportado, ou None
+        se nenhum critério foi informado.
+
+    Raises
+    ------
+    ValueError
+        Se o saldo mínimo ou a dívida mínima não forem valores válidos.
+    '''
+    def minimo(valor, nome):
+        try:
+            return para_centavos(valor)
+        except (ArithmeticError, ValueError):
+            raise ValueError(f"Valor inválido para {nome}: {valor!r} (use o formato 100.00).") from None
+
+    criterios = []
+    if status_cartao is not None:
+        criterios.append(lambda registro: registro.get('status_cartao') == status_cartao)
+    if saldo_minimo is not None:
+        saldo_minimo = minimo(saldo_minimo, "o saldo mínimo")
+        criterios.append(lambda registro: para_centavos(registro.get('saldo') or '0') >= saldo_minimo)
+    if divida_minima is not None:
+        divida_minima = minimo(divida_minima, "a dívida mínima")
+        criterios.append(lambda registro: para_centavos(registro.get('divida_cartao') or '0') >= divida_minima)
+    if com_encerramento is not None:
+        criterios.append(lambda registro: bool(registro.get('solicitar_encerramento')) == com_encerramento)
+    if not criterios:
+        return None
+    return lambda registro: all(criterio(registro) for criterio in criterios)
+
+
+def linhas_exportacao(gerenciador, colunas=COLUNAS_PADRAO, tipo: str = None, filtro=None):
+    '''
+    Percorre as contas já filtradas e reduzidas às colunas pedidas.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os usuários.
+    colunas : sequence of str, opcional
+        Colunas exportadas, na ordem. Padrão: todas menos a senha.
+    tipo : str, opcional
+        Tipo de usuário ('cliente' ou 'admin'), filtrado pelo índice.
+    filtro : callable, opcional
+        Função que recebe o registro e retorna True se ele deve ser exportado.
+
+    Retorna
+    -------
+    generator of tuple
+        Os valores das colunas de cada conta; colunas ausentes (como o saldo de um
+        administrador) vêm como None.
+    '''
+    for registro in gerenciador.registros_armazenados(tipo):
+        if filtro is None or filtro(registro):
+            yield tuple(registro.get(coluna) for coluna in colunas)
+
+
+def _lotes(linhas, tamanho: int):
+    '''
+    Agrupa as linhas em listas de até tamanho linhas.
+    '''
+    lote = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) == tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def _gravar_csv(nome_arquivo: str, colunas, lotes) -> int:
+    with open(nome_arquivo, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(colunas)
+        total = 0
+        for lote in lotes:
+            escritor.writerows(['' if valor is None else valor for valor in linha] for linha in lote)
+            total += len(lote)
+    return total
+
+
+def _esquema_arrow(pa, colunas):
+    '''
+    Monta o esquema Arrow das colunas: decimais para os valores em reais, booleano para
+    o pedido de encerramento e texto para as demais.
+    '''
+    tipos = {coluna: pa.decimal128(18, 2) for coluna in COLUNAS_VALORES}
+    tipos['solicitar_encerramento'] = pa.bool_()
+    return pa.schema([(coluna, tipos.get(coluna, pa.string())) for coluna in colunas])
+
+
+def _gravar_arrow(nome_arquivo: str, colunas, lotes, formato: str) -> int:
+    pa = _importar_pyarrow()
+    if pa is None:
+        raise ImportError(f"A exportação em {formato} requer o pacote pyarrow.")
+    esquema = _esquema_arrow(pa, colunas)
+    valores = [coluna in COLUNAS_VALORES for coluna in colunas]
+    if formato == 'parquet':
+        import pyarrow.parquet as pq
+        escritor = pq.ParquetWriter(nome_arquivo, esquema)
+    else:
+        escritor = pa.ipc.new_file(nome_arquivo, esquema)
+    total = 0
+    try:
+        for lote in lotes:
+            dados = [
+                [Decimal(valor) if valor not in (None, '') else None for valor in coluna] if decimal else list(coluna)
+                for coluna, decimal in zip(zip(*lote), valores)
+            ]
+            escritor.write_table(pa.Table.from_arrays(
+                [pa.array(coluna, type=campo.type) for coluna, campo in zip(dados, esquema)], schema=esquema
+            ))
+            total += len(lote)
+    finally:
+        escritor.close()
+    return total
+
+
+def exportar_contas(gerenciador, nome_arquivo: str, formato: str = None, colunas=None, tipo: str = None,
+                    filtro=None, tamanho_lote: int = None) -> dict:
+    '''
+    Exporta as contas para um arquivo, em lotes.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os usuários.
+    nome_arquivo : str
+        Arquivo de destino.
+    formato : str, opcional
+        'csv', 'parquet' ou 'arrow'. Padrão: deduzido da extensão do arquivo (csv se
+        desconhecida).
+    colunas : sequence of str, opcional
+        Colunas exportadas, na ordem. Padrão: todas menos a senha.
+    tipo : str, opcional
+        Tipo de usuário ('cliente' ou 'admin').
+    filtro : callable, opcional
+        Função que recebe o registro e retorna True se ele deve ser exportado
+        (veja criar_filtro).
+    tamanho_lote : int, opcional
+        Linhas por lote. Padrão: configuracao.LOTE_EXPORTACAO.
+
+    Retorna
+    -------
+    dict
+        Arquivo, formato, colunas e quantidade de linhas exportadas.
+    '''
+    if formato is None:
+        extensao = os.path.splitext(nome_arquivo)[1].lower().lstrip('.')
+        formato = {'parquet': 'parquet', 'arrow': 'arrow', 'feather': 'arrow'}.get(extensao, 'csv')
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de exportação inválido: {formato}")
+    colunas = tuple(colunas or COLUNAS_PADRAO)
+    desconhecidas = [coluna for coluna in colunas if coluna not in COLUNAS_USUARIO]
+    if desconhecidas:
+        raise ValueError(f"Colunas desconhecidas: {', '.join(desconhecidas)}")
+
+    lotes = _lotes(linhas_exportacao(gerenciador, colunas, tipo, filtro), tamanho_lote or configuracao.LOTE_EXPORTACAO)
+    temporario = nome_arquivo + '.tmp'
+    try:
+        if formato == 'csv':
+            linhas = _gravar_csv(temporario, colunas, lotes)
+        else:
+            linhas = _gravar_arrow(temporario, colunas, lotes, formato)
+        os.replace(temporario, nome_arquivo)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return {'arquivo': nome_arquivo, 'formato': formato, 'colunas': colunas, 'linhas': linhas}
@@ -0,0 +1,108 @@
+'''
+Fechamento do ciclo das faturas dos cartões.
+
+O fechamento percorre as contas com compras em aberto em lotes, em ordem de email.
+Para cada lote, soma as compras anteriores à data de fechamento, calcula o pagamento
+mínimo de todas as contas de uma vez (vetores do NumPy, se instalado) e, em uma única
+transação, grava os extratos, congela as compras e avança o ponto de controle. Se o
+processo for interrompido, a próxima execução do mesmo ciclo continua do último lote
+gravado. Compras feitas a partir da data de fechamento ficam no novo ciclo em aberto.
+'''
+import datetime
+from array import array
+
+import configuracao
+from tabelaContas import importar_numpy
+
+
+def calcular_pagamentos_minimos(totais, percentual: int, piso: int):
+    '''
+    Calcula o pagamento mínimo de vários extratos.
+
+    O mínimo é o percentual do total, arredondado para cima, respeitando o piso e sem
+    ultrapassar o próprio total.
+
+    Parâmetros
+    ----------
+    totais : sequence of int
+        Totais dos extratos, em centavos.
+    percentual : int
+        Percentual do total.
+    piso : int
+        Pagamento mínimo absoluto, em centavos.
+
+    Retorna
+    -------
+    sequence of int
+        Pagamento mínimo de cada extrato, em centavos.
+    '''
+    np = importar_numpy()
+    if np is not None:
+        totais = np.asarray(totais, dtype=np.int64)
+        return np.minimum(np.maximum((totais * percentual + 99) // 100, piso), totais)
+    return array('q', (min(max((total * percentual + 99) // 100, piso), total) for total in totais))
+
+
+def fechar_ciclo(faturas, data_fechamento=None, dias_vencimento: int = None, percentual_minimo: int = None,
+                 piso_minimo: int = None, tamanho_lote: int = None, ao_gravar_lote=None) -> dict:
+    '''
+    Fecha o ciclo de faturamento de todos os cartões com compras em aberto.
+
+    Parâmetros
+    ----------
+    faturas : RepositorioFaturas
+        Armazenamento das faturas.
+    data_fechamento : datetime.date ou str, opcional
+        Data de fechamento ("AAAA-MM-DD"); entram as compras anteriores a ela. Padrão: hoje.
+    dias_vencimento : int, opcional
+        Dias entre o fechamento e o vencimento. Padrão: configuracao.DIAS_VENCIMENTO.
+    percentual_minimo : int, opcional
+        Percentual do pagamento mínimo. Padrão: configuracao.PERCENTUAL_MINIMO.
+    piso_minimo : int, opcional
+        Pagamento mínimo absoluto em centavos. Padrão: configuracao.PISO_MINIMO.
+    tamanho_lote : int, opcional
+        Contas gravadas por transação. Padrão: configuracao.LOTE_FECHAMENTO.
+    ao_gravar_lote : callable, opcional
+        Chamada com o último email após a gravação de cada lote (acompanhamento).
+
+    Retorna
+    -------
+    dict
+        Ciclo, extratos gravados, total faturado em centavos, lotes, se a execução
+        retomou um fechamento interrompido e se o ciclo já estava fechado.
+    '''
+    if data_fechamento is None:
+        data_fechamento = datetime.date.today()
+    if isinstance(data_fechamento, str):
+        data_fechamento = datetime.date.fromisoformat(data_fechamento)
+    ciclo = data_fechamento.isoformat()
+    vencimento = (data_fechamento + datetime.timedelta(days=dias_vencimento or configuracao.DIAS_VENCIMENTO)).isoformat()
+    percentual = percentual_minimo if percentual_minimo is not None else configuracao.PERCENTUAL_MINIMO
+    piso = piso_minimo if piso_minimo is not None else configuracao.PISO_MINIMO
+    tamanho_lote = tamanho_lote or configuracao.LOTE_FECHAMENTO
+
+    ultimo_email, concluido = faturas.progresso_fechamento(ciclo)
+    resultado = {'ciclo': ciclo, 'extratos': 0, 'total': 0, 'lotes': 0, 'retomado': bool(ultimo_email) and not concluido, 'ja_fechado': concluido}
+    if concluido:
+        return resultado
+
+    while True:
+        contas = faturas.abertas_por_conta(ciclo, ultimo_email, tamanho_lote)
+        if not contas:
+            break
+        emails, totais, quantidades = zip(*contas)
+        minimos = calcular_pagamentos_minimos(totais, percentual, piso)
+        faturas.gravar_extratos(
+            ciclo, vencimento,
+            list(zip(emails, totais, quantidades, (int(minimo) for minimo in minimos))),
+            ultimo_email
+        )
+        ultimo_email = emails[-1]
+        resultado['extratos'] += len(emails)
+        resultado['total'] += sum(totais)
+        resultado['lotes'] += 1
+        if ao_gravar_lote is not None:
+            ao_gravar_lote(ultimo_email)
+
+    faturas.concluir_fechamento(ciclo)
+    return resultado
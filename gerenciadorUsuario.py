@@ -1,76 +1,556 @@
-import os
-import pandas as pd
+import re
+import sys
+import threading
+import configuracao
+from cacheUsuarios import CacheUsuarios
+from tabelaContas import TabelaContas
+from travasContas import TravasContas
+from repositorioUsuarios import criar_repositorio
+from snapshotUsuarios import IndiceSnapshot
+from escritorPersistencia import EscritorPersistencia
+from dinheiro import formatar_decimal, para_centavos
+
+_NAO_DIGITOS = re.compile(r'\D')
+
+
+def normalizar_email(email) -> str:
+    '''
+    Normaliza um email para uso como chave de busca.
+
+    Parâmetros
+    ----------
+    email : str
+        Email informado.
+
+    Retorna
+    -------
+    str
+        Email sem espaços nas bordas e em minúsculas.
+    '''
+    return str(email).strip().lower()
+
+
+def normalizar_cpf(cpf) -> str:
+    '''
+    Normaliza um CPF para uso como chave de busca, aceitando-o formatado ou não.
+
+    Parâmetros
+    ----------
+    cpf : str ou int
+        CPF informado.
+
+    Retorna
+    -------
+    str
+        Apenas os 11 dígitos do CPF.
+    '''
+    return _NAO_DIGITOS.sub('', str(cpf)).zfill(11)
 
 class GerenciadorUsuarios:
-    def __init__(self, nome_arquivo="usuarios_BliBank.csv"):
+    def __init__(self, nome_arquivo=None, backend=None, repositorio=None, durabilidade=None, carregamento=None, tamanho_cache=None, faturas=None, lancamentos=None):
         '''
-        Inicializa o GerenciadorUsuarios carregando os usuários do arquivo CSV especificado.
+        Inicializa o GerenciadorUsuarios carregando os usuários do armazenamento configurado.
 
         Parâmetros
         ----------
         nome_arquivo : str, opcional
-            Nome do arquivo CSV contendo os dados dos usuários.
+            Nome do arquivo contendo os dados dos usuários.
+        backend : str, opcional
+            Armazenamento a ser usado ('csv' ou 'sqlite'). Padrão: configuracao.BACKEND_USUARIOS.
+        repositorio : RepositorioUsuarios, opcional
+            Armazenamento já criado; tem precedência sobre nome_arquivo e backend.
+        durabilidade : str, opcional
+            Nível de durabilidade das gravações ('sincrono', 'grupo' ou 'assincrono').
+            Padrão: configuracao.DURABILIDADE.
+        carregamento : str, opcional
+            'completo' monta todos os usuários na inicialização; 'sob_demanda' carrega apenas
+            o índice e monta cada usuário no primeiro acesso. Padrão: configuracao.CARREGAMENTO.
+        tamanho_cache : int, opcional
+            Quantidade máxima de usuários montados no modo 'sob_demanda'.
+            Padrão: configuracao.TAMANHO_CACHE.
+        faturas : RepositorioFaturas, opcional
+            Armazenamento das faturas. Padrão: aberto no primeiro uso, no arquivo
+            configuracao.ARQUIVO_FATURAS.
+        lancamentos : RepositorioLancamentos, opcional
+            Armazenamento dos lançamentos das contas. Padrão: aberto no primeiro uso, no
+            arquivo configuracao.ARQUIVO_LANCAMENTOS.
         '''
         from cliente import Cliente
         from administrador import Administrador
         
         self.Cliente = Cliente
         self.Administrador = Administrador
-        self.nome_arquivo = nome_arquivo
-        self.usuarios = []
-        self.sessao_atual = None
+        self.repositorio = repositorio or criar_repositorio(backend, nome_arquivo)
+        self.carregamento = carregamento or configuracao.CARREGAMENTO
+        if self.carregamento not in ('completo', 'sob_demanda'):
+            raise ValueError(f"Modo de carregamento inválido: {self.carregamento}")
+        self.indice_email = {}
+        self.indice_cpf = {}
+        self.tabela_contas = TabelaContas()
+        self.travas = TravasContas()
+        self.cache = CacheUsuarios(
+            (tamanho_cache or configuracao.TAMANHO_CACHE) if self.carregamento == 'sob_demanda' else None
+        )
+        self._trava_cache = threading.RLock()
+        self._faturas = faturas
+        self._lancamentos = lancamentos
         self.carregar_usuarios()
+        self.escritor = EscritorPersistencia(
+            self.repositorio, self.registros,
+            durabilidade=durabilidade or configuracao.DURABILIDADE, janela=configuracao.JANELA_GRUPO
+        )
 
-    def carregar_usuarios(self):
+    @property
+    def faturas(self):
+        '''
+        Armazenamento das faturas dos cartões, aberto no primeiro acesso.
+
+        Retorna
+        -------
+        RepositorioFaturas
+            O armazenamento das faturas.
+        '''
+        if self._faturas is None:
+            with self._trava_cache:
+                if self._faturas is None:
+                    from repositorioFaturas import RepositorioFaturas
+                    self._faturas = RepositorioFaturas(configuracao.ARQUIVO_FATURAS)
+        return self._faturas
+
+    @property
+    def lancamentos(self):
+        '''
+        Armazenamento dos lançamentos das contas, aberto no primeiro acesso.
+
+        Retorna
+        -------
+        RepositorioLancamentos
+            O armazenamento dos lançamentos.
+        '''
+        if self._lancamentos is None:
+            with self._trava_cache:
+                if self._lancamentos is None:
+                    from repositorioLancamentos import RepositorioLancamentos
+                    self._lancamentos = RepositorioLancamentos(configuracao.ARQUIVO_LANCAMENTOS)
+        return self._lancamentos
+
+    @property
+    def usuarios(self):
+        '''
+        Percorre todos os usuários na ordem de cadastro.
+
+        No modo 'sob_demanda' os usuários são montados à medida que são percorridos,
+        passando pelo cache, de modo que a memória continua limitada.
+
+        Retorna
+        -------
+        iterator of Cliente ou Administrador
+            Os usuários do sistema.
         '''
-        Carrega os usuários a partir de um arquivo CSV e os adiciona à lista de usuários.
+        for email in list(self.indice_email):
+            usuario = self._obter(email)
+            if usuario is not None:
+                yield usuario
+
+    def _criar_usuario(self, registro):
+        '''
+        Cria um Cliente ou Administrador a partir de um registro do armazenamento.
+
+        Parâmetros
+        ----------
+        registro : dict
+            Dados do usuário no mesmo formato de to_dict().
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário criado, ou None se o tipo for desconhecido.
         '''
         from cliente import Cliente
         from administrador import Administrador
-        if os.path.exists(self.nome_arquivo):
+        nome = str(registro['nome']).strip()
+        sobrenome = str(registro['sobrenome']).strip()
+        email = str(registro['email']).strip().lower()
+        senha = str(registro['senha']).strip()
+        cpf = str(registro['cpf']).strip()
+        tipo = str(registro['tipo']).strip().lower()
+
+        if tipo == 'cliente':
+            return Cliente(
+                self, nome=nome, sobrenome=sobrenome, email=email, senha=senha, cpf=cpf,
+                saldo=registro['saldo'], status_cartao=registro['status_cartao'],
+                limite_cartao=registro['limite_cartao'], divida_cartao=registro['divida_cartao'],
+                limite_requerido=registro.get('limite_requerido', 0.0), solicitar_encerramento=registro.get('solicitar_encerramento', False)
+            )
+        elif tipo == 'admin':
+            return Administrador(
+                self, nome=nome, sobrenome=sobrenome, email=email, senha=senha, cpf=cpf
+            )
+        print(f"Tipo de usuário desconhecido ou faltando: {tipo}")
+        return None
+
+    def carregar_usuarios(self):
+        '''
+        Carrega os usuários do armazenamento, registro a registro.
+
+        No modo 'completo' todos os usuários são montados; no modo 'sob_demanda' apenas o
+        índice (email, CPF e tipo) é carregado. Se o armazenamento tiver um snapshot
+        binário, no modo 'sob_demanda' os índices são servidos por ele (sem percorrer os
+        usuários) e apenas as alterações posteriores a ele são indexadas.
+        '''
+        if self.carregamento == 'sob_demanda':
+            aberto = self.repositorio.abrir_snapshot()
+            if aberto is not None:
+                self._indexar_snapshot(*aberto)
+                return
+            for email, cpf, tipo in self.repositorio.carregar_indice():
+                self._indexar(email, cpf, tipo)
+            return
+
+        for registro in self.repositorio.carregar():
             try:
-                usuarios_df = pd.read_csv(self.nome_arquivo, dtype={'senha': str}).fillna('')
-
-                for _, row in usuarios_df.iterrows():
-                    try:
-                        nome = str(row['nome']).strip()
-                        sobrenome = str(row['sobrenome']).strip()
-                        email = str(row['email']).strip().lower()
-                        senha = str(row['senha']).strip()
-                        cpf = str(row['cpf']).strip()
-                        tipo = str(row['tipo']).strip().lower()
-
-                        if tipo == 'cliente':
-                            cliente = Cliente(
-                                self, nome=nome, sobrenome=sobrenome, email=email, senha=senha, cpf=cpf,
-                                saldo=float(row['saldo']), status_cartao=row['status_cartao'],
-                                limite_cartao=float(row['limite_cartao']), divida_cartao=float(row['divida_cartao']),
-                                limite_requerido=float(row.get('limite_requerido', 0.0)), solicitar_encerramento=row.get('solicitar_encerramento', False)
-                            )
-                            self.usuarios.append(cliente)
-                        elif tipo == 'admin':
-                            admin = Administrador(
-                                self, nome=nome, sobrenome=sobrenome, email=email, senha=senha, cpf=cpf
-                            )
-                            self.usuarios.append(admin)
-                        else:
-                            print(f"Tipo de usuário desconhecido ou faltando: {tipo}")  
-                    except KeyError as e:
-                        print(f"Erro ao carregar usuário: coluna {e} faltando")
-                    except Exception as e:
-                        print(f"Erro ao carregar usuário: {e}")
-            except Exception as e:
-                print(f"Erro ao ler o arquivo CSV: {e}")
-
-    def salvar_usuarios(self):
-        '''
-        Salva a lista de usuários no arquivo CSV especificado.
-        '''
-        dados_usuarios = []
-        for usuario in self.usuarios:
-            dados_usuarios.append(usuario.to_dict())
-        usuarios_df = pd.DataFrame(dados_usuarios)
-        usuarios_df.to_csv(self.nome_arquivo, index=False)
+                usuario = self._criar_usuario(registro)
+            except KeyError as e:
+                print(f"Erro ao carregar usuário {registro.get('email')}: coluna {e} faltando")
+                continue
+            except (TypeError, ValueError) as e:
+                print(f"Erro ao carregar usuário {registro.get('email')}: {e}")
+                continue
+            if usuario:
+                self._indexar(usuario.get_email(), usuario.get_cpf(), registro['tipo'])
+                self.cache.guardar(usuario.get_email(), usuario)
+
+    def _indexar_snapshot(self, snapshot, alteracoes: dict):
+        '''
+        Passa a servir os índices de email e CPF pelo snapshot e aplica as alterações
+        gravadas depois dele.
+
+        Parâmetros
+        ----------
+        snapshot : SnapshotUsuarios
+            Snapshot aberto pelo armazenamento.
+        alteracoes : dict
+            Registro (ou None, se removido) de cada email alterado depois do snapshot.
+        '''
+        self.indice_email = IndiceSnapshot(snapshot, 'email')
+        self.indice_cpf = IndiceSnapshot(snapshot, 'cpf')
+        for email, registro in alteracoes.items():
+            linha = snapshot.buscar('email', email)
+            cpf_anterior = snapshot.texto('cpf_normalizado', linha) if linha is not None else None
+            if registro is None:
+                self.indice_email.pop(email, None)
+            elif cpf_anterior == normalizar_cpf(registro['cpf']):
+                cpf_anterior = None
+            if cpf_anterior is not None and self.indice_cpf.get(cpf_anterior) == email:
+                del self.indice_cpf[cpf_anterior]
+            if registro is not None:
+                self._indexar(email, registro['cpf'], registro['tipo'])
+
+    def _indexar(self, email, cpf, tipo):
+        '''
+        Inclui o usuário nos índices de email e CPF.
+
+        Parâmetros
+        ----------
+        email : str
+            Email do usuário.
+        cpf : str
+            CPF do usuário, formatado ou não.
+        tipo : str
+            Tipo do usuário ('cliente' ou 'admin').
+        '''
+        email = normalizar_email(email)
+        self.indice_email[email] = sys.intern(str(tipo).strip().lower())
+        self.indice_cpf[normalizar_cpf(cpf)] = email
+
+    def _desindexar(self, usuario):
+        '''
+        Retira o usuário dos índices de email e CPF.
+
+        Parâmetros
+        ----------
+        usuario : Cliente ou Administrador
+            Usuário a ser retirado.
+        '''
+        self.indice_email.pop(normalizar_email(usuario.get_email()), None)
+        self.indice_cpf.pop(normalizar_cpf(usuario.get_cpf()), None)
+
+    def _obter(self, email):
+        '''
+        Retorna o usuário do cache ou o monta a partir do armazenamento.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado de um usuário indexado.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário, ou None se ele não existir.
+        '''
+        with self._trava_cache:
+            usuario = self.cache.obter(email)
+        if usuario is not None or self.carregamento == 'completo':
+            return usuario
+
+        pendente, registro = self.escritor.registro_pendente(email)
+        if not pendente:
+            registro = self.repositorio.ler(email)
+        if registro is None:
+            return None
+
+        with self._trava_cache:
+            usuario = self.cache.obter(email)
+            if usuario is None:
+                usuario = self._criar_usuario(registro)
+                if usuario is not None:
+                    self.cache.guardar(email, usuario)
+        return usuario
+
+    def buscar_por_email(self, email):
+        '''
+        Busca um usuário pelo email em tempo constante.
+
+        Parâmetros
+        ----------
+        email : str
+            Email do usuário.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário encontrado, ou None.
+        '''
+        if not email:
+            return None
+        email = normalizar_email(email)
+        if email not in self.indice_email:
+            return None
+        return self._obter(email)
+
+    def buscar_por_cpf(self, cpf):
+        '''
+        Busca um usuário pelo CPF (formatado ou só dígitos) em tempo constante.
+
+        Parâmetros
+        ----------
+        cpf : str
+            CPF do usuário.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário encontrado, ou None.
+        '''
+        if not cpf:
+            return None
+        email = self.indice_cpf.get(normalizar_cpf(cpf))
+        return self._obter(email) if email else None
+
+    def registros(self, tipo=None):
+        '''
+        Percorre os registros de todos os usuários, para a gravação completa ou exportação.
+
+        Usuários fora do cache são lidos do armazenamento sem entrar no cache.
+
+        Parâmetros
+        ----------
+        tipo : str, opcional
+            Se informado ('cliente' ou 'admin'), percorre apenas os usuários desse tipo,
+            filtrados pelo índice sem ler os demais.
+
+        Retorna
+        -------
+        iterator of dict
+            Registros no formato de to_dict().
+        '''
+        for email, tipo_indexado in list(self.indice_email.items()):
+            if tipo is not None and tipo_indexado != tipo:
+                continue
+            with self._trava_cache:
+                usuario = self.cache.obter(email)
+            if usuario is None:
+                registro = self.repositorio.ler(email)
+                usuario = self._criar_usuario(registro) if registro is not None else None
+            if usuario is not None:
+                yield usuario.to_dict()
+
+    def registros_armazenados(self, tipo=None):
+        '''
+        Percorre os registros de todos os usuários em uma leitura sequencial do armazenamento.
+
+        No modo 'sob_demanda' evita uma leitura avulsa por usuário: as alterações
+        pendentes são gravadas, o armazenamento é lido do início ao fim e, para os
+        usuários presentes no cache, vale a versão em memória. Usuários cadastrados
+        durante a leitura podem ficar de fora. No modo 'completo' equivale a registros().
+
+        Parâmetros
+        ----------
+        tipo : str, opcional
+            Se informado ('cliente' ou 'admin'), percorre apenas os usuários desse tipo.
+
+        Retorna
+        -------
+        iterator of dict
+            Registros no formato de to_dict().
+        '''
+        if self.carregamento == 'completo':
+            yield from self.registros(tipo)
+            return
+
+        from cliente import StatusCartao
+        self.descarregar()
+        for registro in self.repositorio.carregar():
+            email = normalizar_email(registro['email'])
+            tipo_indexado = self.indice_email.get(email)
+            if tipo_indexado is None or (tipo is not None and tipo_indexado != tipo):
+                continue
+            with self._trava_cache:
+                usuario = self.cache.obter(email)
+            if usuario is not None:
+                yield usuario.to_dict()
+                continue
+            registro = dict(registro, email=email, tipo=tipo_indexado)
+            if tipo_indexado != 'cliente':
+                yield {coluna: registro[coluna] for coluna in ('nome', 'sobrenome', 'email', 'senha', 'cpf', 'tipo')}
+                continue
+            for coluna in ('saldo', 'limite_cartao', 'divida_cartao', 'limite_requerido'):
+                registro[coluna] = formatar_decimal(para_centavos(registro[coluna] or 0))
+            registro['status_cartao'] = StatusCartao(registro['status_cartao']).value
+            registro['solicitar_encerramento'] = bool(registro['solicitar_encerramento'])
+            yield registro
+
+    def resumo_carteira(self) -> dict:
+        '''
+        Soma os valores, em centavos, de todas as contas carregadas, coluna a coluna na tabela de contas.
+
+        No modo 'sob_demanda' apenas as contas presentes em memória são consideradas.
+
+        Retorna
+        -------
+        dict
+            Total de cada coluna em centavos (saldo, limite_cartao, divida_cartao, limite_requerido).
+        '''
+        return {nome: self.tabela_contas.total(nome) for nome in TabelaContas.COLUNAS}
+
+    def compactar(self):
+        '''
+        Grava um snapshot completo de todos os usuários no armazenamento.
+        '''
+        self.escritor.gravar_todos()
+
+    def descarregar(self):
+        '''
+        Aguarda até que todas as alterações pendentes estejam gravadas.
+        '''
+        self.escritor.descarregar()
+
+    def encerrar(self):
+        '''
+        Grava as alterações pendentes e libera o armazenamento.
+        '''
+        self.escritor.encerrar()
+        self.repositorio.fechar()
+        if self._faturas is not None:
+            self._faturas.fechar()
+        if self._lancamentos is not None:
+            self._lancamentos.fechar()
+
+    def salvar_usuarios(self, *usuarios):
+        '''
+        Persiste as alterações dos usuários.
+
+        Apenas os usuários informados são enviados ao escritor de persistência, que agrupa
+        as alterações da janela em uma gravação (uma linha do journal no CSV, um UPDATE
+        por conta no SQLite). Sem usuários informados, a lista completa é gravada.
+
+        Os registros são copiados e enfileirados com as contas travadas, para que uma
+        versão antiga nunca seja enfileirada depois de uma mais nova; a espera pela
+        gravação do grupo acontece fora das travas.
+
+        Parâmetros
+        ----------
+        *usuarios : Cliente ou Administrador
+            Usuários alterados pela operação.
+        '''
+        if not usuarios:
+            self.compactar()
+            return
+        with self.travar_contas(*usuarios):
+            geracao = self.escritor.salvar([usuario.to_dict() for usuario in usuarios], esperar=False)
+        self.escritor.aguardar(geracao)
+
+    def refazer_saldos(self, emails, descricoes) -> int:
+        '''
+        Refaz pelo extrato o saldo de contas cujos lançamentos foram gravados sem que o
+        saldo chegasse ao disco (uma rotina interrompida entre as duas gravações).
+
+        O saldo de uma conta só é refeito se o último lançamento do extrato dela tiver
+        uma das descrições informadas, isto é, se nenhuma movimentação posterior foi
+        registrada.
+
+        Parâmetros
+        ----------
+        emails : iterable of str
+            Emails das contas com lançamentos da rotina interrompida.
+        descricoes : set of str
+            Descrições dos lançamentos da rotina interrompida.
+
+        Retorna
+        -------
+        int
+            Quantidade de contas cujo saldo foi corrigido.
+        '''
+        contas = {}
+        for email, lancamento in self.lancamentos.ultimos(emails).items():
+            conta = self.buscar_por_email(email)
+            if lancamento.descricao in descricoes and isinstance(conta, self.Cliente):
+                contas[email] = (conta, lancamento.saldo)
+        if not contas:
+            return 0
+        with self.travar_contas(*(conta for conta, _ in contas.values())):
+            contas = {email: (conta, saldo) for email, (conta, saldo) in contas.items()
+                      if conta.get_saldo_centavos() != saldo}
+            for conta, saldo in contas.values():
+                conta.set_saldo_centavos(saldo)
+        if contas:
+            self.salvar_usuarios(*(conta for conta, _ in contas.values()))
+            self.descarregar()
+        return len(contas)
+
+    def travar_contas(self, *usuarios):
+        '''
+        Trava as contas dos usuários para uma alteração atômica.
+
+        As travas são adquiridas em ordem determinística, de modo que operações
+        simultâneas sobre as mesmas contas não entram em impasse. Use com "with".
+
+        Parâmetros
+        ----------
+        *usuarios : Cliente ou Administrador
+            Usuários cujas contas serão alteradas.
+
+        Retorna
+        -------
+        contextmanager
+            Gerenciador de contexto que mantém as travas adquiridas.
+        '''
+        return self.travas.travar(*(usuario.get_email() for usuario in usuarios))
+
+    def remover_usuario(self, usuario):
+        '''
+        Remove um usuário do sistema e persiste a remoção.
+
+        Parâmetros
+        ----------
+        usuario : Cliente ou Administrador
+            Usuário a ser removido.
+        '''
+        self._desindexar(usuario)
+        with self._trava_cache:
+            self.cache.remover(normalizar_email(usuario.get_email()))
+        self.escritor.remover(usuario.get_email())
 
     def verificar_cpf_existente(self, cpf):
         '''
@@ -79,17 +559,14 @@ class GerenciadorUsuarios:
         Parâmetros
         ----------
         cpf : str
-            CPF a ser verificado.
+            CPF a ser verificado, formatado ou apenas com dígitos.
 
         Retorna
         -------
         bool
             True se o CPF já existir, False caso contrário.
         '''
-        for usuario in self.usuarios:
-            if usuario.get_cpf() == cpf:
-                return True
-        return False
+        return self.buscar_por_cpf(cpf) is not None
 
     def verificar_email_existente(self, email):
         '''
@@ -105,14 +582,11 @@ class GerenciadorUsuarios:
         bool
             True se o email já existir, False caso contrário.
         '''
-        for usuario in self.usuarios:
-            if usuario.get_email() == email:
-                return True
-        return False
+        return self.buscar_por_email(email) is not None
 
     def login(self, email, senha):
         '''
-        Realiza o login de um usuário no sistema.
+        Autentica um usuário.
 
         Parâmetros
         ----------
@@ -124,23 +598,24 @@ class GerenciadorUsuarios:
         Retorna
         -------
         Cliente ou Administrador
-            O usuário logado, ou None se o login falhar.
-        '''
-        for usuario in self.usuarios:
-            if usuario.get_email() == email:
-                if usuario.get_senha() == senha:
-                    self.sessao_atual = usuario
-                    return usuario
-                else:
-                    print("Senha incorreta.")
+            O usuário autenticado, ou None se o login falhar.
+        '''
+        usuario = self.buscar_por_email(email)
+        if usuario:
+            if usuario.get_senha() == senha:
+                return usuario
+            else:
+                print("Senha incorreta.")
         print("Usuário não encontrado ou senha incorreta.")
         return None
 
     def logout(self):
         '''
-        Realiza o logout do usuário atual.
+        Garante que as alterações do usuário que está saindo estejam gravadas.
+
+        As sessões abertas são mantidas pelo SistemaBliBank.
         '''
-        self.sessao_atual = None
+        self.descarregar()
 
     def cadastrar_usuario(self, nome, sobrenome, email, senha, cpf, tipo):
         '''
@@ -175,5 +650,36 @@ class GerenciadorUsuarios:
         else:
             raise ValueError("Tipo de usuário inválido")
         
-        self.usuarios.append(novo_usuario)
-        self.salvar_usuarios()
+        self._indexar(novo_usuario.get_email(), novo_usuario.get_cpf(), novo_usuario.to_dict()['tipo'])
+        with self._trava_cache:
+            self.cache.guardar(novo_usuario.get_email(), novo_usuario)
+        self.salvar_usuarios(novo_usuario)
+
+    def cadastrar_usuarios(self, registros):
+        '''
+        Cadastra vários usuários já validados com uma única gravação.
+
+        Os registros são enfileirados no escritor antes de entrarem nos índices, de modo
+        que no modo 'sob_demanda' um usuário recém-indexado sempre pode ser montado a
+        partir da alteração pendente. Se o armazenamento pedir (muitos registros em uma
+        linha do journal do CSV), a gravação é seguida de uma compactação.
+
+        Parâmetros
+        ----------
+        registros : list of dict
+            Dados dos usuários no mesmo formato de to_dict(), com emails e CPFs ainda
+            não cadastrados.
+        '''
+        usuarios = []
+        if self.carregamento == 'completo':
+            usuarios = [self._criar_usuario(registro) for registro in registros]
+        geracao = self.escritor.salvar(registros, esperar=False)
+        with self._trava_cache:
+            for registro in registros:
+                self._indexar(registro['email'], registro['cpf'], registro['tipo'])
+            for usuario in usuarios:
+                if usuario is not None:
+                    self.cache.guardar(usuario.get_email(), usuario)
+        self.escritor.aguardar(geracao)
+        if self.repositorio.compactar_apos(len(registros)):
+            self.compactar()
@@ -0,0 +1,216 @@
+'''
+Importação de usuários em lote (por exemplo, a base de clientes de um banco parceiro).
+
+O arquivo CSV de entrada (colunas nome, sobrenome, email, senha e cpf) é lido em
+lotes por um gerador. A validação dos campos (nomes, formato do email e dígitos
+verificadores do CPF) de cada lote roda em um conjunto de processos, com um número
+limitado de lotes em andamento. A checagem de duplicidade é feita no processo
+principal, na ordem do arquivo, com os índices do gerenciador (contas existentes) e
+conjuntos dos emails e CPFs já aceitos no arquivo. Os clientes aceitos são
+cadastrados com uma única gravação e as linhas recusadas vão para
+"<arquivo>.rejeitados.csv".
+'''
+import os
+import re
+import csv
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import configuracao
+from gerenciadorUsuario import normalizar_email, normalizar_cpf
+
+COLUNAS = ('nome', 'sobrenome', 'email', 'senha', 'cpf')
+COLUNAS_REJEITADOS = ('linha', 'email', 'cpf', 'motivo')
+_NOME = re.compile(r'^[A-Za-zÀ-ÿ]+$')
+_EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def cpf_valido(cpf: str) -> bool:
+    '''
+    Confere os dois dígitos verificadores de um CPF.
+
+    Parâmetros
+    ----------
+    cpf : str
+        CPF com 11 dígitos, formatado ou não.
+
+    Retorna
+    -------
+    bool
+        True se o CPF tem 11 dígitos, não é uma sequência repetida e os dígitos
+        verificadores conferem.
+    '''
+    digitos = re.sub(r'\D', '', str(cpf))
+    if len(digitos) != 11 or digitos == digitos[0] * 11:
+        return False
+    numeros = [int(digito) for digito in digitos]
+    for posicao in (9, 10):
+        soma = sum(numero * peso for numero, peso in zip(numeros[:posicao], range(posicao + 1, 1, -1)))
+        if (soma * 10 % 11) % 10 != numeros[posicao]:
+            return False
+    return True
+
+
+def validar_registro(campos: dict) -> tuple:
+    '''
+    Valida e normaliza os campos de um cliente a importar.
+
+    Parâmetros
+    ----------
+    campos : dict
+        Colunas lidas do arquivo (nome, sobrenome, email, senha e cpf).
+
+    Retorna
+    -------
+    tuple
+        (registro, None) com o registro no formato de to_dict() se os campos são
+        válidos; (None, motivo) caso contrário.
+    '''
+    nome = ' '.join(str(campos.get('nome') or '').split()).title()
+    sobrenome = ' '.join(str(campos.get('sobrenome') or '').split()).title()
+    email = normalizar_email(campos.get('email') or '')
+    senha = str(campos.get('senha') or '').strip()
+    cpf = re.sub(r'\D', '', str(campos.get('cpf') or ''))
+
+    if not _NOME.match(nome.replace(" ", "")):
+        return None, "Nome inválido. Use apenas letras sem espaços."
+    if not _NOME.match(sobrenome.replace(" ", "")):
+        return None, "Sobrenome inválido. Use apenas letras sem espaços."
+    if not _EMAIL.match(email):
+        return None, "Email inválido."
+    if not cpf_valido(cpf):
+        return None, "CPF inválido."
+    if len(senha) < 8:
+        return None, "A senha deve ter pelo menos 8 caracteres."
+    return {
+        'nome': nome, 'sobrenome': sobrenome, 'email': email, 'senha': senha,
+        'cpf': f"{cpf[:3]}.{cpf[3:6]}.{cpf[6:9]}-{cpf[9:]}", 'tipo': 'cliente',
+        'saldo': '0.00', 'status_cartao': 'nenhum', 'limite_cartao': '0.00',
+        'divida_cartao': '0.00', 'limite_requerido': '0.00', 'solicitar_encerramento': False
+    }, None
+
+
+def validar_lote(lote: list) -> list:
+    '''
+    Valida um lote de linhas; é a unidade de trabalho enviada aos processos.
+
+    Parâmetros
+    ----------
+    lote : list of tuple
+        Tuplas (numero_linha, campos).
+
+    Retorna
+    -------
+    list of tuple
+        Tuplas (numero_linha, campos, registro, motivo), como em validar_registro.
+    '''
+    return [(linha, campos, *validar_registro(campos)) for linha, campos in lote]
+
+
+def ler_lotes(nome_arquivo: str, tamanho_lote: int):
+    '''
+    Lê o arquivo de entrada em lotes, sem carregá-lo inteiro.
+
+    Parâmetros
+    ----------
+    nome_arquivo : str
+        Arquivo CSV com cabeçalho.
+    tamanho_lote : int
+        Linhas por lote.
+
+    Retorna
+    -------
+    generator of list
+        Listas de (numero_linha, campos), sendo campos um dict com as colunas de COLUNAS.
+    '''
+    with open(nome_arquivo, 'r', encoding='utf-8-sig', newline='') as arquivo:
+        leitor = csv.DictReader(arquivo)
+        faltando = [coluna for coluna in COLUNAS if coluna not in (leitor.fieldnames or [])]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de usuários: {', '.join(faltando)}")
+        lote = []
+        for linha in leitor:
+            lote.append((leitor.line_num, {coluna: linha[coluna] for coluna in COLUNAS}))
+            if len(lote) == tamanho_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+
+def _validados(lotes, processos: int):
+    '''
+    Valida os lotes em um conjunto de processos, preservando a ordem do arquivo.
+
+    No máximo 2 * processos lotes ficam em andamento, de modo que a memória usada não
+    depende do tamanho do arquivo. Com um único processo, valida no próprio processo.
+    '''
+    if processos <= 1:
+        for lote in lotes:
+            yield from validar_lote(lote)
+        return
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for lote in lotes:
+            pendentes.append(executor.submit(validar_lote, lote))
+            if len(pendentes) >= 2 * processos:
+                yield from pendentes.popleft().result()
+        while pendentes:
+            yield from pendentes.popleft().result()
+
+
+def importar_usuarios(gerenciador, nome_arquivo: str, processos: int = None, tamanho_lote: int = None) -> dict:
+    '''
+    Importa os clientes de um arquivo CSV com uma única gravação.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador que recebe os novos clientes.
+    nome_arquivo : str
+        Arquivo CSV de entrada.
+    processos : int, opcional
+        Processos de validação. Padrão: configuracao.PROCESSOS_IMPORTACAO.
+    tamanho_lote : int, opcional
+        Linhas enviadas a um processo por vez. Padrão: configuracao.LOTE_IMPORTACAO.
+
+    Retorna
+    -------
+    dict
+        Linhas lidas, clientes importados, linhas rejeitadas e o arquivo com os motivos
+        das rejeições.
+    '''
+    processos = processos or configuracao.PROCESSOS_IMPORTACAO
+    tamanho_lote = tamanho_lote or configuracao.LOTE_IMPORTACAO
+    nome_rejeitados = nome_arquivo + '.rejeitados.csv'
+    emails, cpfs = set(), set()
+    aceitos = []
+    resultado = {'lidos': 0, 'importados': 0, 'rejeitados': 0, 'arquivo_rejeitados': nome_rejeitados}
+
+    with open(nome_rejeitados, 'w', encoding='utf-8', newline='') as arquivo_rejeitados:
+        rejeitados = csv.writer(arquivo_rejeitados)
+        rejeitados.writerow(COLUNAS_REJEITADOS)
+        for linha, campos, registro, motivo in _validados(ler_lotes(nome_arquivo, tamanho_lote), processos):
+            resultado['lidos'] += 1
+            if registro is not None:
+                email, cpf = registro['email'], normalizar_cpf(registro['cpf'])
+                if email in gerenciador.indice_email:
+                    motivo = "Email já cadastrado."
+                elif cpf in gerenciador.indice_cpf:
+                    motivo = "CPF já cadastrado."
+                elif email in emails:
+                    motivo = "Email repetido no arquivo."
+                elif cpf in cpfs:
+                    motivo = "CPF repetido no arquivo."
+                else:
+                    emails.add(email)
+                    cpfs.add(cpf)
+                    aceitos.append(registro)
+                    continue
+            rejeitados.writerow((linha, campos['email'], campos['cpf'], motivo))
+            resultado['rejeitados'] += 1
+
+    if aceitos:
+        gerenciador.cadastrar_usuarios(aceitos)
+    resultado['importados'] = len(aceitos)
+    return resultado
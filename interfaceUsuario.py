@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 
 class Usuario(ABC):
+    # Sem __dict__ por instância: cada conta ocupa apenas os campos abaixo.
+    # __weakref__ permite que o cache de usuários mantenha referências fracas.
+    __slots__ = ('__nome', '__sobrenome', '__email', '__senha', '__cpf', '__weakref__')
+
     def __init__(self, nome: str, sobrenome: str, email: str, senha: str, cpf: int) -> None:
         '''
         Inicializa um objeto Usuario.
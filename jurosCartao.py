@@ -0,0 +1,174 @@
+'''
+Juros diários do rotativo do cartão de crédito.
+
+Os juros de todas as contas são calculados de uma vez sobre a coluna divida_cartao da
+tabela de contas (vetores do NumPy, se instalado), em vez de um laço por cliente com
+uma gravação para cada um. Os lançamentos vão para as faturas em uma transação, as
+dívidas são somadas à tabela em uma operação e as contas alteradas são gravadas em
+uma única chamada a salvar_usuarios. O dia só é marcado como concluído depois que as
+dívidas estão em disco; se a execução for interrompida antes, a próxima execução para
+a mesma data completa as dívidas que ficaram sem os juros.
+'''
+import datetime
+
+import configuracao
+from tabelaContas import importar_numpy
+
+
+def taxa_diaria(taxa_mensal: float) -> float:
+    '''
+    Converte uma taxa de juros mensal na taxa diária equivalente (mês de 30 dias).
+
+    Parâmetros
+    ----------
+    taxa_mensal : float
+        Taxa mensal (0.12 = 12% ao mês).
+
+    Retorna
+    -------
+    float
+        Taxa diária composta.
+    '''
+    return (1 + taxa_mensal) ** (1 / 30) - 1
+
+
+def calcular_juros(dividas, taxa: float):
+    '''
+    Calcula os juros de um dia sobre várias dívidas.
+
+    Parâmetros
+    ----------
+    dividas : sequence of int
+        Dívidas em centavos.
+    taxa : float
+        Taxa diária.
+
+    Retorna
+    -------
+    sequence of int
+        Juros de cada dívida em centavos, arredondados; zero para dívidas não positivas.
+    '''
+    np = importar_numpy()
+    if np is not None:
+        dividas = np.asarray(dividas, dtype=np.int64)
+        return np.where(dividas > 0, np.rint(dividas * taxa), 0).astype(np.int64)
+    return [round(divida * taxa) if divida > 0 else 0 for divida in dividas]
+
+
+def _retomar_juros(gerenciador, data: str, pendentes: list) -> dict:
+    '''
+    Completa um dia de juros lançado nas faturas cuja gravação das dívidas foi interrompida.
+
+    A dívida de cada conta é comparada com a registrada para depois dos juros: se ainda
+    é a de antes dos juros, eles são somados; se já é a registrada, nada muda. Contas com
+    outra dívida (alterada depois da interrupção) não são tocadas e são apenas contadas.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os clientes e o armazenamento das faturas.
+    data : str
+        Dia dos juros ("AAAA-MM-DD").
+    pendentes : list of tuple
+        (email, valor, dívida após os juros) de cada conta, como em juros_em_andamento.
+
+    Retorna
+    -------
+    dict
+        Resultado de acumular_juros para o dia retomado.
+    '''
+    contas = []
+    for email, valor, divida in pendentes:
+        cliente = gerenciador.buscar_por_email(email)
+        if isinstance(cliente, gerenciador.Cliente):
+            contas.append((cliente, valor, divida))
+
+    corrigidas, divergentes = [], 0
+    tabela = gerenciador.tabela_contas
+    with gerenciador.travar_contas(*(cliente for cliente, _, _ in contas)):
+        for cliente, valor, divida in contas:
+            atual = tabela.obter(cliente.get_id_conta(), 'divida_cartao')
+            if atual == divida - valor:
+                corrigidas.append((cliente, valor))
+            elif atual != divida:
+                divergentes += 1
+        if corrigidas:
+            tabela.somar('divida_cartao', [cliente.get_id_conta() for cliente, _ in corrigidas],
+                         [valor for _, valor in corrigidas])
+    if corrigidas:
+        gerenciador.salvar_usuarios(*(cliente for cliente, _ in corrigidas))
+        gerenciador.descarregar()
+    gerenciador.faturas.concluir_juros(data)
+    return {'data': data, 'contas': len(pendentes), 'total': sum(valor for _, valor, _ in pendentes),
+            'ja_lancado': False, 'interrompido': True, 'dividas_corrigidas': len(corrigidas),
+            'divergentes': divergentes}
+
+
+def acumular_juros(gerenciador, data=None, taxa_mensal: float = None) -> dict:
+    '''
+    Aplica os juros do rotativo de um dia à dívida do cartão de todos os clientes.
+
+    O dia é registrado nas faturas junto com os lançamentos, de modo que rodar de novo
+    para a mesma data não cobra juros duas vezes, e concluído depois da gravação das
+    dívidas; um dia interrompido antes disso é completado pela próxima execução. No modo
+    de carregamento 'sob_demanda' todos os clientes são montados durante o cálculo.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os clientes e o armazenamento das faturas.
+    data : datetime.date ou str, opcional
+        Dia dos juros ("AAAA-MM-DD"). Padrão: hoje.
+    taxa_mensal : float, opcional
+        Taxa mensal do rotativo. Padrão: configuracao.JUROS_ROTATIVO_MENSAL.
+
+    Retorna
+    -------
+    dict
+        Data, contas com juros, total de juros em centavos, se o dia já havia sido
+        lançado e se uma execução interrompida foi completada (com as dívidas corrigidas
+        e as divergentes, que não foram alteradas).
+    '''
+    data = (data or datetime.date.today())
+    data = data.isoformat() if isinstance(data, datetime.date) else data
+    taxa = taxa_diaria(configuracao.JUROS_ROTATIVO_MENSAL if taxa_mensal is None else taxa_mensal)
+    pendentes = gerenciador.faturas.juros_em_andamento(data)
+    if pendentes is not None:
+        return _retomar_juros(gerenciador, data, pendentes)
+    np = importar_numpy()
+
+    clientes = [usuario for usuario in gerenciador.usuarios if isinstance(usuario, gerenciador.Cliente)]
+    # As dívidas são lidas, lançadas e somadas com as contas travadas, para que uma
+    # compra ou pagamento simultâneo não fique de fora do valor gravado nas faturas.
+    with gerenciador.travas.travar_todas():
+        if np is not None:
+            ids = np.fromiter((cliente.get_id_conta() for cliente in clientes), dtype=np.intp, count=len(clientes))
+            dividas = gerenciador.tabela_contas.colunas['divida_cartao'][ids]
+            juros = calcular_juros(dividas, taxa)
+            cobrados = np.flatnonzero(juros > 0).tolist()
+            ids, dividas, juros = ids[cobrados], dividas[cobrados], juros[cobrados]
+        else:
+            coluna = gerenciador.tabela_contas.colunas['divida_cartao']
+            ids = [cliente.get_id_conta() for cliente in clientes]
+            dividas = [coluna[id_conta] for id_conta in ids]
+            juros = calcular_juros(dividas, taxa)
+            cobrados = [posicao for posicao, valor in enumerate(juros) if valor > 0]
+            ids, juros = [ids[posicao] for posicao in cobrados], [juros[posicao] for posicao in cobrados]
+            dividas = [dividas[posicao] for posicao in cobrados]
+        clientes = [clientes[posicao] for posicao in cobrados]
+        valores = [int(valor) for valor in juros]
+
+        resultado = {'data': data, 'contas': len(clientes), 'total': sum(valores), 'ja_lancado': False,
+                     'interrompido': False, 'dividas_corrigidas': 0, 'divergentes': 0}
+        lancamentos = [(cliente.get_email(), valor, int(divida) + valor)
+                       for cliente, valor, divida in zip(clientes, valores, dividas)]
+        if not gerenciador.faturas.lancar_juros(data, lancamentos):
+            resultado.update(contas=0, total=0, ja_lancado=True)
+            return resultado
+        if clientes:
+            gerenciador.tabela_contas.somar('divida_cartao', ids, juros)
+    if clientes:
+        gerenciador.salvar_usuarios(*clientes)
+        gerenciador.descarregar()
+    gerenciador.faturas.concluir_juros(data)
+    return resultado
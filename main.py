@@ -1,12 +1,32 @@
+import threading
 import flet as ft
 from app import BliBankApp
+from sistema import SistemaBliBank
+
+_sistema = None
+_trava_sistema = threading.Lock()
+
+
+def obter_sistema() -> SistemaBliBank:
+    '''
+    Retorna o sistema compartilhado por todas as páginas do processo, criando-o no primeiro uso.
+    '''
+    global _sistema
+    with _trava_sistema:
+        if _sistema is None:
+            _sistema = SistemaBliBank()
+        return _sistema
 
 def main(page: ft.Page):
     '''
     Função principal que inicializa o aplicativo BliBank.
+
+    Cada página (janela ou aba do navegador) tem a sua própria sessão, mas todas usam o
+    mesmo sistema e, portanto, os mesmos usuários carregados.
     '''
 
-    app = BliBankApp()
+    app = BliBankApp(obter_sistema())
     app.inicial(page)
 
-ft.app(target=main)
+if __name__ == "__main__":
+    ft.app(target=main)
@@ -0,0 +1,262 @@
+'''
+Processamento de arquivos de pagamentos em lote.
+
+Os arquivos CSV de pagamentos (colunas tipo, origem, destino e valor; tipo 'deposito'
+ou 'transferencia') são lidos linha a linha por um gerador e aplicados em lotes de
+tamanho fixo com transferenciasLote.transferir_em_lote, de modo que a memória usada não
+depende do tamanho do arquivo. O resultado de cada linha vai para um arquivo
+"<arquivo>.resultado.csv" e o progresso para "<arquivo>.progresso".
+
+O progresso é gravado antes de cada lote (marcado como pendente) e depois que o lote
+está em disco. Os lançamentos de cada lote são gravados antes dos saldos. Se o processo
+for interrompido, a próxima execução continua do último lote concluído; as linhas do
+lote pendente que já estão no extrato (cada lançamento leva a descrição
+"<arquivo>:<linha>") não são aplicadas de novo, e o saldo das contas cujo extrato
+termina nesse lote é refeito a partir do extrato, caso a interrupção tenha ocorrido
+antes da gravação dos saldos.
+'''
+import os
+import csv
+import json
+
+import configuracao
+from gerenciadorUsuario import normalizar_email
+from transferenciasLote import transferir_em_lote
+
+COLUNAS = ('tipo', 'origem', 'destino', 'valor')
+TIPOS = ('deposito', 'transferencia')
+COLUNAS_RESULTADO = ('linha', 'tipo', 'origem', 'destino', 'valor', 'situacao', 'motivo')
+
+
+def ler_pagamentos(nome_arquivo: str, posicao: int = 0, linha: int = 1):
+    '''
+    Lê as linhas de um arquivo de pagamentos sem carregá-lo inteiro.
+
+    Cada linha do arquivo é um registro (campos com quebra de linha não são aceitos).
+
+    Parâmetros
+    ----------
+    nome_arquivo : str
+        Arquivo CSV com cabeçalho.
+    posicao : int, opcional
+        Posição (em bytes) a partir da qual ler; 0 lê desde o início.
+    linha : int, opcional
+        Número da última linha antes da posição (o cabeçalho é a linha 1).
+
+    Retorna
+    -------
+    generator of tuple
+        (numero_linha, posicao_apos_a_linha, campos), sendo campos um dict com as
+        colunas de COLUNAS.
+    '''
+    with open(nome_arquivo, 'rb') as arquivo:
+        cabecalho = arquivo.readline()
+        nomes = next(csv.reader([cabecalho.decode('utf-8-sig')]), [])
+        indices = {nome.strip().lower(): indice for indice, nome in enumerate(nomes)}
+        faltando = [coluna for coluna in COLUNAS if coluna not in indices]
+        if faltando:
+            raise ValueError(f"Colunas ausentes no arquivo de pagamentos: {', '.join(faltando)}")
+        if posicao:
+            arquivo.seek(posicao)
+        else:
+            posicao, linha = len(cabecalho), 1
+
+        for bruta in arquivo:
+            posicao += len(bruta)
+            linha += 1
+            texto = bruta.decode('utf-8', errors='replace').strip()
+            if not texto:
+                continue
+            valores = next(csv.reader([texto]))
+            yield linha, posicao, {
+                coluna: (valores[indices[coluna]].strip() if indices[coluna] < len(valores) else '')
+                for coluna in COLUNAS
+            }
+
+
+def _ler_progresso(nome_progresso: str) -> dict:
+    '''
+    Lê o progresso gravado de um arquivo, ou o progresso inicial se não houver.
+
+    lote_inicio e lote_fim guardam a primeira e a última linha do lote em aplicação
+    (pendente); a retomada confere o extrato de todas as linhas desse intervalo.
+    '''
+    progresso = {'posicao': 0, 'linha': 1, 'tamanho_resultado': 0, 'pendente': False,
+                 'lote_inicio': None, 'lote_fim': None,
+                 'aplicadas': 0, 'falhas': 0, 'total': 0, 'concluido': False}
+    if os.path.exists(nome_progresso):
+        with open(nome_progresso, 'r', encoding='utf-8') as arquivo:
+            progresso.update(json.load(arquivo))
+    return progresso
+
+
+def _gravar_progresso(nome_progresso: str, progresso: dict) -> None:
+    '''
+    Grava o progresso de forma atômica (arquivo temporário e substituição).
+    '''
+    temporario = nome_progresso + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(progresso, arquivo)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    os.replace(temporario, nome_progresso)
+
+
+def _lotes(pagamentos, tamanho: int):
+    '''
+    Agrupa as linhas lidas em listas de até tamanho linhas.
+    '''
+    lote = []
+    for pagamento in pagamentos:
+        lote.append(pagamento)
+        if len(lote) == tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def processar_arquivo(sistema, nome_arquivo: str, tamanho_lote: int = None, ao_gravar_lote=None) -> dict:
+    '''
+    Aplica um arquivo de pagamentos em lotes, retomando uma execução interrompida.
+
+    Parâmetros
+    ----------
+    sistema : SistemaBliBank
+        Sistema com os clientes.
+    nome_arquivo : str
+        Arquivo CSV de pagamentos.
+    tamanho_lote : int, opcional
+        Linhas aplicadas por gravação. Padrão: configuracao.LOTE_PAGAMENTOS.
+    ao_gravar_lote : callable, opcional
+        Chamada com o número da última linha após a gravação de cada lote (acompanhamento).
+
+    Retorna
+    -------
+    dict
+        Arquivo, linhas processadas nesta execução, pagamentos aplicados e com falha,
+        total movimentado em centavos (acumulados desde o início do arquivo, sem as
+        linhas do lote interrompido que já estavam aplicadas), lotes, se a execução
+        retomou um processamento interrompido, as contas com saldo refeito pelo extrato
+        na retomada e se o arquivo já estava processado.
+    '''
+    gerenciador = sistema.gerenciador
+    tamanho_lote = tamanho_lote or configuracao.LOTE_PAGAMENTOS
+    nome_resultado = nome_arquivo + '.resultado.csv'
+    nome_progresso = nome_arquivo + '.progresso'
+    identificador = os.path.basename(nome_arquivo)
+
+    progresso = _ler_progresso(nome_progresso)
+    resultado = {'arquivo': nome_arquivo, 'linhas': 0, 'lotes': 0, 'retomado': progresso['posicao'] > 0 or progresso['pendente'],
+                 'saldos_corrigidos': 0, 'ja_processado': progresso['concluido']}
+    if progresso['concluido']:
+        resultado.update(aplicadas=progresso['aplicadas'], falhas=progresso['falhas'], total=progresso['total'])
+        return resultado
+
+    if os.path.exists(nome_resultado):
+        os.truncate(nome_resultado, progresso['tamanho_resultado'])
+    with open(nome_resultado, 'a', encoding='utf-8', newline='') as arquivo_resultado:
+        escritor = csv.writer(arquivo_resultado)
+        if progresso['tamanho_resultado'] == 0:
+            escritor.writerow(COLUNAS_RESULTADO)
+
+        # Linhas do lote interrompido: podem ocupar vários lotes se o tamanho mudou.
+        pendente = (progresso['lote_inicio'], progresso['lote_fim']) if progresso['pendente'] else None
+        for lote in _lotes(ler_pagamentos(nome_arquivo, progresso['posicao'], progresso['linha']), tamanho_lote):
+            if pendente is not None and pendente[1] is None:
+                # Progresso gravado sem o intervalo: confere o primeiro lote.
+                pendente = (lote[0][0], lote[-1][0])
+            fim = max(lote[-1][0], pendente[1]) if pendente is not None else lote[-1][0]
+            progresso.update(pendente=True, lote_inicio=lote[0][0], lote_fim=fim)
+            _gravar_progresso(nome_progresso, progresso)
+
+            situacoes, itens, linhas_itens = {}, [], []
+            for linha, _, campos in lote:
+                chave = f"{identificador}:{linha}"
+                if campos['tipo'] not in TIPOS:
+                    situacoes[linha] = ('falha', "Tipo de pagamento inválido.")
+                    continue
+                origem = normalizar_email(campos['origem']) if campos['tipo'] == 'transferencia' else None
+                if campos['tipo'] == 'transferencia' and not origem:
+                    situacoes[linha] = ('falha', "Transferência sem conta de origem.")
+                    continue
+                itens.append((origem, normalizar_email(campos['destino']), campos['valor'], chave))
+                linhas_itens.append(linha)
+
+            if pendente is not None:
+                inicio, fim = pendente
+                ja_aplicados = gerenciador.lancamentos.registrados(
+                    (item[1], item[3]) for linha, item in zip(linhas_itens, itens) if inicio <= linha <= fim
+                )
+                restantes = [(linha, item) for linha, item in zip(linhas_itens, itens)
+                             if (item[1], item[3]) not in ja_aplicados]
+                for linha in set(linhas_itens) - {linha for linha, _ in restantes}:
+                    situacoes[linha] = ('ja_aplicada', "Aplicada antes da interrupção.")
+                aplicados = [item for item in itens if (item[1], item[3]) in ja_aplicados]
+                resultado['saldos_corrigidos'] += gerenciador.refazer_saldos(
+                    {email for item in aplicados for email in item[:2] if email}, {item[3] for item in aplicados}
+                )
+                linhas_itens, itens = [linha for linha, _ in restantes], [item for _, item in restantes]
+                if lote[-1][0] >= fim:
+                    pendente = None
+
+            aplicacao = transferir_em_lote(gerenciador, itens, extrato_antes=True)
+            gerenciador.descarregar()
+            gerenciador.lancamentos.descarregar()
+            motivos = dict(aplicacao['falhas'])
+            for posicao, linha in enumerate(linhas_itens):
+                situacoes[linha] = ('falha', motivos[posicao]) if posicao in motivos else ('aplicada', '')
+
+            for linha, _, campos in lote:
+                situacao, motivo = situacoes[linha]
+                escritor.writerow((linha, campos['tipo'], campos['origem'], campos['destino'], campos['valor'], situacao, motivo))
+                progresso['aplicadas'] += situacao == 'aplicada'
+                progresso['falhas'] += situacao == 'falha'
+            arquivo_resultado.flush()
+            os.fsync(arquivo_resultado.fileno())
+
+            ultima_linha, ultima_posicao, _ = lote[-1]
+            progresso.update(posicao=ultima_posicao, linha=ultima_linha, pendente=False, lote_inicio=None, lote_fim=None,
+                             tamanho_resultado=arquivo_resultado.tell(), total=progresso['total'] + aplicacao['total'])
+            _gravar_progresso(nome_progresso, progresso)
+            resultado['linhas'] += len(lote)
+            resultado['lotes'] += 1
+            if ao_gravar_lote is not None:
+                ao_gravar_lote(ultima_linha)
+
+    progresso['concluido'] = True
+    _gravar_progresso(nome_progresso, progresso)
+    resultado.update(aplicadas=progresso['aplicadas'], falhas=progresso['falhas'], total=progresso['total'])
+    return resultado
+
+
+def processar_pasta(sistema, pasta: str = None, tamanho_lote: int = None) -> list:
+    '''
+    Aplica todos os arquivos de pagamentos de uma pasta que ainda não foram concluídos.
+
+    Parâmetros
+    ----------
+    sistema : SistemaBliBank
+        Sistema com os clientes.
+    pasta : str, opcional
+        Pasta dos arquivos "*.csv". Padrão: configuracao.PASTA_PAGAMENTOS.
+    tamanho_lote : int, opcional
+        Linhas aplicadas por gravação. Padrão: configuracao.LOTE_PAGAMENTOS.
+
+    Retorna
+    -------
+    list of dict
+        O resultado de processar_arquivo para cada arquivo processado.
+    '''
+    pasta = pasta or configuracao.PASTA_PAGAMENTOS
+    if not os.path.isdir(pasta):
+        return []
+    resultados = []
+    for nome in sorted(os.listdir(pasta)):
+        if not nome.endswith('.csv') or nome.endswith('.resultado.csv'):
+            continue
+        nome_arquivo = os.path.join(pasta, nome)
+        if _ler_progresso(nome_arquivo + '.progresso')['concluido']:
+            continue
+        resultados.append(processar_arquivo(sistema, nome_arquivo, tamanho_lote))
+    return resultados
@@ -0,0 +1,128 @@
+'''
+Rendimento diário dos saldos das contas.
+
+O rendimento de todas as contas é calculado de uma vez sobre a coluna saldo da tabela
+de contas (vetores do NumPy, se instalado), os saldos são somados à tabela em uma
+operação e as contas alteradas são gravadas em uma única chamada a salvar_usuarios;
+os créditos entram no extrato de cada conta em um único lote.
+Cada dia é registrado nos lançamentos antes do crédito e marcado como concluído depois
+da gravação, de modo que rodar de novo para a mesma data não credita duas vezes. O
+crédito de cada conta leva a descrição "rendimento:<data>" no extrato, que é gravado
+antes dos saldos: uma execução interrompida é retomada creditando apenas as contas sem
+esse lançamento (e refazendo pelo extrato o saldo das que o têm).
+'''
+import datetime
+
+import configuracao
+from tabelaContas import importar_numpy
+
+ROTINA = 'rendimento'
+
+
+def calcular_rendimentos(saldos, taxa: float):
+    '''
+    Calcula o rendimento de um dia sobre vários saldos.
+
+    Parâmetros
+    ----------
+    saldos : sequence of int
+        Saldos em centavos.
+    taxa : float
+        Taxa diária (0.0005 = 0,05% ao dia).
+
+    Retorna
+    -------
+    sequence of int
+        Rendimento de cada saldo em centavos, arredondado para baixo; zero para saldos
+        não positivos.
+    '''
+    np = importar_numpy()
+    if np is not None:
+        saldos = np.asarray(saldos, dtype=np.int64)
+        return np.where(saldos > 0, np.floor(saldos * taxa), 0).astype(np.int64)
+    return [int(saldo * taxa) if saldo > 0 else 0 for saldo in saldos]
+
+
+def creditar_rendimentos(gerenciador, data=None, taxa: float = None) -> dict:
+    '''
+    Credita o rendimento de um dia ao saldo de todos os clientes.
+
+    Ficam de fora as contas com encerramento solicitado. Se uma execução anterior para a
+    mesma data foi interrompida, ela é retomada: as contas que já têm o lançamento do dia
+    no extrato não são creditadas de novo e, se o saldo delas não chegou a ser gravado,
+    ele é refeito a partir do extrato.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os clientes e o armazenamento dos lançamentos.
+    data : datetime.date ou str, opcional
+        Dia do rendimento ("AAAA-MM-DD"). Padrão: hoje.
+    taxa : float, opcional
+        Taxa diária. Padrão: configuracao.RENDIMENTO_DIARIO.
+
+    Retorna
+    -------
+    dict
+        Data, contas creditadas e total creditado em centavos no dia (incluindo as de uma
+        execução interrompida), se o dia já havia sido creditado, se uma execução
+        anterior interrompida foi retomada e quantos saldos foram refeitos pelo extrato.
+    '''
+    data = (data or datetime.date.today())
+    data = data.isoformat() if isinstance(data, datetime.date) else data
+    taxa = configuracao.RENDIMENTO_DIARIO if taxa is None else taxa
+    lancamentos = gerenciador.lancamentos
+    descricao = f"{ROTINA}:{data}"
+
+    resultado = {'data': data, 'contas': 0, 'total': 0, 'ja_lancado': False, 'interrompido': False,
+                 'saldos_corrigidos': 0}
+    estado = lancamentos.iniciar_rotina(ROTINA, data)
+    if estado == lancamentos.CONCLUIDA:
+        resultado['ja_lancado'] = True
+        return resultado
+    anteriores = {}
+    if estado == lancamentos.EM_ANDAMENTO:
+        resultado['interrompido'] = True
+        anteriores = lancamentos.por_descricao(descricao)
+        resultado['saldos_corrigidos'] = gerenciador.refazer_saldos(anteriores, {descricao})
+
+    np = importar_numpy()
+    clientes = [
+        usuario for usuario in gerenciador.usuarios
+        if isinstance(usuario, gerenciador.Cliente) and not usuario.solicitar_encerramento
+        and usuario.get_email() not in anteriores
+    ]
+    # Os saldos são lidos com as contas travadas: o rendimento é calculado sobre o
+    # mesmo saldo a que é somado, sem perder um depósito ou saque simultâneo.
+    with gerenciador.travas.travar_todas():
+        if np is not None:
+            ids = np.fromiter((cliente.get_id_conta() for cliente in clientes), dtype=np.intp, count=len(clientes))
+            rendimentos = calcular_rendimentos(gerenciador.tabela_contas.colunas['saldo'][ids], taxa)
+            creditados = np.flatnonzero(rendimentos > 0).tolist()
+            ids, rendimentos = ids[creditados], rendimentos[creditados]
+        else:
+            coluna = gerenciador.tabela_contas.colunas['saldo']
+            ids = [cliente.get_id_conta() for cliente in clientes]
+            rendimentos = calcular_rendimentos([coluna[id_conta] for id_conta in ids], taxa)
+            creditados = [posicao for posicao, valor in enumerate(rendimentos) if valor > 0]
+            ids, rendimentos = [ids[posicao] for posicao in creditados], [rendimentos[posicao] for posicao in creditados]
+        clientes = [clientes[posicao] for posicao in creditados]
+        total = sum(int(valor) for valor in rendimentos)
+        if clientes:
+            gerenciador.tabela_contas.somar('saldo', ids, rendimentos)
+            saldos = [gerenciador.tabela_contas.obter(int(id_conta), 'saldo') for id_conta in ids]
+
+    if clientes:
+        lancamentos.registrar_varios(
+            (cliente.get_email(), 'rendimento', valor, saldo, None, descricao)
+            for cliente, valor, saldo in zip(clientes, rendimentos, saldos)
+        )
+        try:
+            lancamentos.descarregar()
+        finally:
+            gerenciador.salvar_usuarios(*clientes)
+        gerenciador.descarregar()
+    contas, total = len(clientes) + len(anteriores), total + sum(anteriores.values())
+    lancamentos.concluir_rotina(ROTINA, data, contas, total)
+    resultado.update(contas=contas, total=total)
+    return resultado
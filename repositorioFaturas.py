@@ -0,0 +1,616 @@
+import os
+import datetime
+import threading
+from collections import namedtuple
+
+from dinheiro import formatar_decimal, para_centavos
+from repositorioUsuarios import abrir_conexao
+
+
+class Compra(namedtuple('Compra', ['data', 'loja', 'descricao', 'valor'])):
+    '''
+    Compra registrada na fatura de um cartão. O valor está em centavos e a data no
+    formato "AAAA-MM-DD HH:MM:SS".
+    '''
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f"{self.data},{self.loja},{self.descricao},{formatar_decimal(self.valor)}"
+
+
+class RepositorioFaturas:
+    SQL_CRIAR = '''
+        CREATE TABLE IF NOT EXISTS compras (
+            id INTEGER PRIMARY KEY,
+            email TEXT NOT NULL,
+            data TEXT NOT NULL,
+            loja TEXT NOT NULL,
+            descricao TEXT NOT NULL,
+            valor INTEGER NOT NULL,
+            fatura INTEGER
+        )
+    '''
+    SQL_INDICE = "CREATE INDEX IF NOT EXISTS compras_email_data ON compras (email, data, id)"
+    SQL_INDICE_ABERTAS = '''
+        CREATE INDEX IF NOT EXISTS compras_abertas ON compras (email, data, valor) WHERE fatura IS NULL
+    '''
+    SQL_CRIAR_EXTRATOS = '''
+        CREATE TABLE IF NOT EXISTS extratos (
+            id INTEGER PRIMARY KEY,
+            email TEXT NOT NULL,
+            ciclo TEXT NOT NULL,
+            vencimento TEXT NOT NULL,
+            total INTEGER NOT NULL,
+            quantidade INTEGER NOT NULL,
+            pagamento_minimo INTEGER NOT NULL,
+            paga INTEGER NOT NULL DEFAULT 0,
+            UNIQUE (email, ciclo)
+        )
+    '''
+    SQL_CRIAR_JUROS = '''
+        CREATE TABLE IF NOT EXISTS lancamentos_juros (
+            data TEXT PRIMARY KEY,
+            contas INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            concluido INTEGER NOT NULL DEFAULT 0
+        )
+    '''
+    SQL_CRIAR_JUROS_CONTAS = '''
+        CREATE TABLE IF NOT EXISTS juros_contas (
+            data TEXT NOT NULL,
+            email TEXT NOT NULL,
+            valor INTEGER NOT NULL,
+            divida INTEGER NOT NULL,
+            PRIMARY KEY (data, email)
+        )
+    '''
+    SQL_CRIAR_FECHAMENTOS = '''
+        CREATE TABLE IF NOT EXISTS fechamentos (
+            ciclo TEXT PRIMARY KEY,
+            ultimo_email TEXT NOT NULL,
+            concluido INTEGER NOT NULL DEFAULT 0
+        )
+    '''
+    SQL_CRIAR_TOTAIS = '''
+        CREATE TABLE IF NOT EXISTS totais (
+            email TEXT PRIMARY KEY,
+            total INTEGER NOT NULL,
+            quantidade INTEGER NOT NULL
+        )
+    '''
+    SQL_SOMAR_TOTAL = '''
+        INSERT INTO totais (email, total, quantidade) VALUES (?, ?, ?)
+        ON CONFLICT(email) DO UPDATE SET
+            total = total + excluded.total, quantidade = quantidade + excluded.quantidade
+    '''
+    SQL_TOTAIS_DOS_ITENS = "SELECT email, SUM(valor), COUNT(*) FROM compras GROUP BY email"
+
+    def __init__(self, nome_arquivo: str) -> None:
+        '''
+        Inicializa o armazenamento das faturas em uma tabela SQLite.
+
+        Todas as compras ficam em uma única tabela, indexada por conta e data: registrar
+        uma compra é uma inserção, e as leituras de uma conta (inteiras ou por período)
+        percorrem apenas o trecho do índice dessa conta, sem um arquivo por cliente.
+
+        O total e a quantidade de compras de cada conta ficam na tabela totais e são
+        atualizados na mesma transação que insere ou remove as compras, de modo que
+        consultá-los não exige somar os itens.
+
+        O fechamento do ciclo (veja fechamentoFaturas) congela as compras em aberto em
+        um extrato: as compras passam a apontar para o extrato (coluna fatura) e
+        continuam devidas até o pagamento.
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Nome do arquivo do banco de dados.
+        '''
+        self.nome_arquivo = nome_arquivo
+        self.conexao = abrir_conexao(nome_arquivo)
+        self._trava = threading.RLock()
+        with self.conexao:
+            existiam_totais = self.conexao.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'totais'"
+            ).fetchone() is not None
+            self.conexao.execute(self.SQL_CRIAR)
+            colunas = {linha['name'] for linha in self.conexao.execute("PRAGMA table_info(compras)")}
+            if 'fatura' not in colunas:
+                self.conexao.execute("ALTER TABLE compras ADD COLUMN fatura INTEGER")
+            self.conexao.execute(self.SQL_INDICE)
+            self.conexao.execute(self.SQL_INDICE_ABERTAS)
+            self.conexao.execute(self.SQL_CRIAR_TOTAIS)
+            self.conexao.execute(self.SQL_CRIAR_EXTRATOS)
+            self.conexao.execute(self.SQL_CRIAR_FECHAMENTOS)
+            self.conexao.execute(self.SQL_CRIAR_JUROS)
+            colunas = {linha['name'] for linha in self.conexao.execute("PRAGMA table_info(lancamentos_juros)")}
+            if 'concluido' not in colunas:
+                self.conexao.execute("ALTER TABLE lancamentos_juros ADD COLUMN concluido INTEGER NOT NULL DEFAULT 1")
+            self.conexao.execute(self.SQL_CRIAR_JUROS_CONTAS)
+            if not existiam_totais:
+                self.conexao.execute(f"INSERT INTO totais (email, total, quantidade) {self.SQL_TOTAIS_DOS_ITENS}")
+
+    @staticmethod
+    def _data(valor) -> str:
+        '''
+        Converte uma data para o formato armazenado.
+
+        Parâmetros
+        ----------
+        valor : datetime.datetime, datetime.date ou str
+            Data a converter.
+
+        Retorna
+        -------
+        str
+            Data no formato "AAAA-MM-DD HH:MM:SS" (ou o texto recebido).
+        '''
+        if isinstance(valor, datetime.datetime):
+            return valor.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(valor, datetime.date):
+            return valor.strftime("%Y-%m-%d")
+        return valor
+
+    def registrar(self, email: str, loja: str, descricao: str, valor: int, data=None) -> Compra:
+        '''
+        Registra uma compra na fatura de uma conta.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+        loja : str
+            Nome da loja.
+        descricao : str
+            Descrição da compra.
+        valor : int
+            Valor da compra em centavos.
+        data : datetime.datetime ou str, opcional
+            Data da compra (padrão: agora).
+
+        Retorna
+        -------
+        Compra
+            A compra registrada.
+        '''
+        compra = Compra(self._data(data or datetime.datetime.now()), loja, descricao, int(valor))
+        with self._trava, self.conexao:
+            self.conexao.execute(
+                "INSERT INTO compras (email, data, loja, descricao, valor) VALUES (?, ?, ?, ?, ?)",
+                (email, *compra)
+            )
+            self.conexao.execute(self.SQL_SOMAR_TOTAL, (email, compra.valor, 1))
+        return compra
+
+    def listar(self, email: str, inicio=None, fim=None, limite: int = None) -> list:
+        '''
+        Lê as compras de uma conta em ordem cronológica, opcionalmente de um período.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+        inicio : datetime.datetime, datetime.date ou str, opcional
+            Data inicial (inclusive).
+        fim : datetime.datetime, datetime.date ou str, opcional
+            Data final (exclusive).
+        limite : int, opcional
+            Quantidade máxima de compras.
+
+        Retorna
+        -------
+        list of Compra
+            As compras encontradas.
+        '''
+        condicoes, parametros = ["email = ?"], [email]
+        if inicio is not None:
+            condicoes.append("data >= ?")
+            parametros.append(self._data(inicio))
+        if fim is not None:
+            condicoes.append("data < ?")
+            parametros.append(self._data(fim))
+        sql = f"SELECT data, loja, descricao, valor FROM compras WHERE {' AND '.join(condicoes)} ORDER BY data, id"
+        if limite is not None:
+            sql += " LIMIT ?"
+            parametros.append(int(limite))
+        with self._trava:
+            linhas = self.conexao.execute(sql, parametros).fetchall()
+        return [Compra(*linha) for linha in linhas]
+
+    def resumo(self, email: str) -> tuple:
+        '''
+        Retorna o total e a quantidade de compras em aberto de uma conta, sem ler os itens.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+
+        Retorna
+        -------
+        tuple
+            (total em centavos, quantidade de compras).
+        '''
+        with self._trava:
+            linha = self.conexao.execute("SELECT total, quantidade FROM totais WHERE email = ?", (email,)).fetchone()
+        return (linha[0], linha[1]) if linha else (0, 0)
+
+    def total(self, email: str) -> int:
+        '''
+        Retorna o total das compras em aberto de uma conta.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+
+        Retorna
+        -------
+        int
+            Total da fatura em centavos.
+        '''
+        return self.resumo(email)[0]
+
+    def possui_compras(self, email: str) -> bool:
+        '''
+        Informa se a conta tem compras na fatura.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+
+        Retorna
+        -------
+        bool
+            True se houver ao menos uma compra.
+        '''
+        return self.resumo(email)[1] > 0
+
+    def quitar(self, email: str) -> int:
+        '''
+        Remove todas as compras da fatura de uma conta e marca os seus extratos como pagos.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+
+        Retorna
+        -------
+        int
+            Quantidade de compras removidas.
+        '''
+        with self._trava, self.conexao:
+            self.conexao.execute("DELETE FROM totais WHERE email = ?", (email,))
+            self.conexao.execute("UPDATE extratos SET paga = 1 WHERE email = ? AND paga = 0", (email,))
+            return self.conexao.execute("DELETE FROM compras WHERE email = ?", (email,)).rowcount
+
+    def importar_arquivo(self, email: str, arquivo: str) -> int:
+        '''
+        Importa uma fatura no formato antigo (um arquivo de texto por cliente, com
+        linhas "data,loja,descricao,valor").
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta dona da fatura.
+        arquivo : str
+            Caminho do arquivo de texto.
+
+        Retorna
+        -------
+        int
+            Quantidade de compras importadas.
+        '''
+        with open(arquivo, 'r') as fatura:
+            linhas = [linha.rstrip('\n').split(',') for linha in fatura if linha.strip()]
+        parametros = [
+            (email, campos[0], campos[1], ','.join(campos[2:-1]), para_centavos(campos[-1]))
+            for campos in linhas
+        ]
+        with self._trava, self.conexao:
+            self.conexao.executemany(
+                "INSERT INTO compras (email, data, loja, descricao, valor) VALUES (?, ?, ?, ?, ?)", parametros
+            )
+            if parametros:
+                self.conexao.execute(
+                    self.SQL_SOMAR_TOTAL, (email, sum(linha[-1] for linha in parametros), len(parametros))
+                )
+        return len(parametros)
+
+    def conciliar(self, corrigir: bool = False) -> list:
+        '''
+        Confere os totais mantidos de cada conta com a soma dos itens da fatura.
+
+        Parâmetros
+        ----------
+        corrigir : bool, opcional
+            Se True, os totais divergentes são substituídos pelos valores dos itens.
+
+        Retorna
+        -------
+        list of tuple
+            Divergências encontradas, como (email, total mantido, total dos itens,
+            quantidade mantida, quantidade de itens). Lista vazia se tudo confere.
+        '''
+        with self._trava:
+            mantidos = {
+                email: (total, quantidade)
+                for email, total, quantidade in self.conexao.execute("SELECT email, total, quantidade FROM totais")
+            }
+            itens = {
+                email: (total, quantidade)
+                for email, total, quantidade in self.conexao.execute(self.SQL_TOTAIS_DOS_ITENS)
+            }
+            divergencias = []
+            for email in mantidos.keys() | itens.keys():
+                total_mantido, quantidade_mantida = mantidos.get(email, (0, 0))
+                total_itens, quantidade_itens = itens.get(email, (0, 0))
+                if (total_mantido, quantidade_mantida) != (total_itens, quantidade_itens):
+                    divergencias.append((email, total_mantido, total_itens, quantidade_mantida, quantidade_itens))
+            if corrigir and divergencias:
+                with self.conexao:
+                    self.conexao.execute("DELETE FROM totais")
+                    self.conexao.execute(f"INSERT INTO totais (email, total, quantidade) {self.SQL_TOTAIS_DOS_ITENS}")
+        return sorted(divergencias)
+
+    def lancar_juros(self, data: str, lancamentos: list) -> bool:
+        '''
+        Lança os juros do rotativo de um dia nas faturas, em uma única transação.
+
+        Cada lançamento vira uma compra "Juros do rotativo" da conta e soma ao total
+        mantido. O dia fica registrado, de modo que lançá-lo de novo não tem efeito, mas
+        em andamento até concluir_juros: a dívida esperada de cada conta após os juros é
+        guardada para que uma execução interrompida antes da gravação das dívidas possa
+        ser completada (veja juros_em_andamento).
+
+        Parâmetros
+        ----------
+        data : str
+            Dia dos juros ("AAAA-MM-DD").
+        lancamentos : list of tuple
+            (email, valor em centavos, dívida após os juros em centavos) de cada conta.
+
+        Retorna
+        -------
+        bool
+            True se os juros foram lançados, False se o dia já havia sido lançado.
+        '''
+        with self._trava, self.conexao:
+            if self.conexao.execute("SELECT 1 FROM lancamentos_juros WHERE data = ?", (data,)).fetchone():
+                return False
+            self.conexao.executemany(
+                "INSERT INTO compras (email, data, loja, descricao, valor) VALUES (?, ?, 'BliBank', 'Juros do rotativo', ?)",
+                [(email, f"{data} 00:00:00", valor) for email, valor, _ in lancamentos]
+            )
+            self.conexao.executemany(self.SQL_SOMAR_TOTAL, [(email, valor, 1) for email, valor, _ in lancamentos])
+            self.conexao.executemany(
+                "INSERT INTO juros_contas (data, email, valor, divida) VALUES (?, ?, ?, ?)",
+                [(data, email, valor, divida) for email, valor, divida in lancamentos]
+            )
+            self.conexao.execute(
+                "INSERT INTO lancamentos_juros (data, contas, total, concluido) VALUES (?, ?, ?, 0)",
+                (data, len(lancamentos), sum(valor for _, valor, _ in lancamentos))
+            )
+        return True
+
+    def juros_em_andamento(self, data: str) -> list:
+        '''
+        Busca os lançamentos de um dia de juros lançado e ainda não concluído.
+
+        Parâmetros
+        ----------
+        data : str
+            Dia dos juros ("AAAA-MM-DD").
+
+        Retorna
+        -------
+        list of tuple
+            (email, valor, dívida após os juros) de cada conta, em centavos, ou None se
+            o dia não foi lançado ou já foi concluído.
+        '''
+        with self._trava:
+            linha = self.conexao.execute("SELECT concluido FROM lancamentos_juros WHERE data = ?", (data,)).fetchone()
+            if linha is None or linha['concluido']:
+                return None
+            return [tuple(linha) for linha in self.conexao.execute(
+                "SELECT email, valor, divida FROM juros_contas WHERE data = ?", (data,)
+            )]
+
+    def concluir_juros(self, data: str) -> None:
+        '''
+        Marca um dia de juros como concluído (dívidas gravadas).
+
+        Parâmetros
+        ----------
+        data : str
+            Dia dos juros ("AAAA-MM-DD").
+        '''
+        with self._trava, self.conexao:
+            self.conexao.execute("UPDATE lancamentos_juros SET concluido = 1 WHERE data = ?", (data,))
+            self.conexao.execute("DELETE FROM juros_contas WHERE data = ?", (data,))
+
+    def extratos(self, email: str, limite: int = None) -> list:
+        '''
+        Lê os extratos fechados de uma conta, do mais recente para o mais antigo.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+        limite : int, opcional
+            Quantidade máxima de extratos.
+
+        Retorna
+        -------
+        list of dict
+            Extratos com ciclo, vencimento, total, quantidade, pagamento_minimo e paga.
+        '''
+        sql = '''
+            SELECT ciclo, vencimento, total, quantidade, pagamento_minimo, paga
+            FROM extratos WHERE email = ? ORDER BY ciclo DESC
+        '''
+        parametros = [email]
+        if limite is not None:
+            sql += " LIMIT ?"
+            parametros.append(int(limite))
+        with self._trava:
+            linhas = self.conexao.execute(sql, parametros).fetchall()
+        return [dict(linha, paga=bool(linha['paga'])) for linha in linhas]
+
+    def progresso_fechamento(self, ciclo: str) -> tuple:
+        '''
+        Lê o ponto de controle do fechamento de um ciclo.
+
+        Parâmetros
+        ----------
+        ciclo : str
+            Data de fechamento do ciclo ("AAAA-MM-DD").
+
+        Retorna
+        -------
+        tuple
+            (último email processado ou '', True se o fechamento terminou).
+        '''
+        with self._trava:
+            linha = self.conexao.execute(
+                "SELECT ultimo_email, concluido FROM fechamentos WHERE ciclo = ?", (ciclo,)
+            ).fetchone()
+        return (linha['ultimo_email'], bool(linha['concluido'])) if linha else ('', False)
+
+    def abertas_por_conta(self, ciclo: str, apos_email: str, limite: int) -> list:
+        '''
+        Soma as compras em aberto anteriores ao fechamento, por conta, em ordem de email.
+
+        Parâmetros
+        ----------
+        ciclo : str
+            Data de fechamento; entram as compras anteriores a ela.
+        apos_email : str
+            Considera apenas as contas com email maior que este.
+        limite : int
+            Quantidade máxima de contas.
+
+        Retorna
+        -------
+        list of tuple
+            (email, total em centavos, quantidade de compras) de cada conta.
+        '''
+        with self._trava:
+            return [tuple(linha) for linha in self.conexao.execute(
+                '''
+                SELECT email, SUM(valor), COUNT(*) FROM compras INDEXED BY compras_abertas
+                WHERE fatura IS NULL AND email > ? AND data < ?
+                GROUP BY email ORDER BY email LIMIT ?
+                ''', (apos_email, ciclo, int(limite))
+            )]
+
+    def gravar_extratos(self, ciclo: str, vencimento: str, extratos: list, apos_email: str) -> None:
+        '''
+        Grava os extratos de um lote de contas, congela as suas compras e avança o ponto de
+        controle do ciclo, tudo na mesma transação.
+
+        Parâmetros
+        ----------
+        ciclo : str
+            Data de fechamento do ciclo.
+        vencimento : str
+            Data de vencimento dos extratos.
+        extratos : list of tuple
+            (email, total, quantidade, pagamento mínimo) de cada conta, em ordem de email.
+        apos_email : str
+            Último email do lote anterior; o lote cobre os emails maiores que ele até o
+            último email de extratos.
+        '''
+        if not extratos:
+            return
+        ultimo_email = extratos[-1][0]
+        with self._trava, self.conexao:
+            self.conexao.executemany(
+                '''
+                INSERT INTO extratos (email, ciclo, vencimento, total, quantidade, pagamento_minimo)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ''',
+                [(email, ciclo, vencimento, total, quantidade, minimo) for email, total, quantidade, minimo in extratos]
+            )
+            self.conexao.execute(
+                '''
+                UPDATE compras SET fatura = (
+                    SELECT id FROM extratos WHERE extratos.email = compras.email AND extratos.ciclo = ?
+                )
+                WHERE fatura IS NULL AND email > ? AND email <= ? AND data < ?
+                ''', (ciclo, apos_email, ultimo_email, ciclo)
+            )
+            self.conexao.execute(
+                '''
+                INSERT INTO fechamentos (ciclo, ultimo_email) VALUES (?, ?)
+                ON CONFLICT(ciclo) DO UPDATE SET ultimo_email = excluded.ultimo_email
+                ''', (ciclo, ultimo_email)
+            )
+
+    def concluir_fechamento(self, ciclo: str) -> None:
+        '''
+        Marca o fechamento de um ciclo como concluído.
+
+        Parâmetros
+        ----------
+        ciclo : str
+            Data de fechamento do ciclo.
+        '''
+        with self._trava, self.conexao:
+            self.conexao.execute(
+                '''
+                INSERT INTO fechamentos (ciclo, ultimo_email, concluido) VALUES (?, '', 1)
+                ON CONFLICT(ciclo) DO UPDATE SET concluido = 1
+                ''', (ciclo,)
+            )
+
+    def fechar(self) -> None:
+        self.conexao.close()
+
+
+def arquivo_fatura_antigo(email: str, pasta: str = "faturas") -> str:
+    '''
+    Retorna o caminho do arquivo de fatura usado antes do armazenamento em SQLite.
+
+    Parâmetros
+    ----------
+    email : str
+        Email da conta.
+    pasta : str, opcional
+        Pasta das faturas antigas.
+
+    Retorna
+    -------
+    str
+        Caminho do arquivo.
+    '''
+    return os.path.join(pasta, f"fatura_{email.replace('@', '_').replace('.', '_')}.txt")
+
+
+def migrar_faturas(emails, repositorio: RepositorioFaturas, pasta: str = "faturas") -> int:
+    '''
+    Importa as faturas em arquivos de texto das contas informadas e remove os arquivos.
+
+    Parâmetros
+    ----------
+    emails : iterable of str
+        Emails das contas.
+    repositorio : RepositorioFaturas
+        Armazenamento de destino.
+    pasta : str, opcional
+        Pasta das faturas antigas.
+
+    Retorna
+    -------
+    int
+        Quantidade de compras importadas.
+    '''
+    total = 0
+    for email in emails:
+        arquivo = arquivo_fatura_antigo(email, pasta)
+        if os.path.exists(arquivo):
+            total += repositorio.importar_arquivo(email, arquivo)
+            os.remove(arquivo)
+    return total
@@ -0,0 +1,426 @@
+import atexit
+import datetime
+import threading
+import time
+from collections import namedtuple
+
+from dinheiro import formatar_decimal
+from repositorioUsuarios import abrir_conexao
+
+
+class Lancamento(namedtuple('Lancamento', ['id', 'data', 'tipo', 'valor', 'saldo', 'contraparte', 'descricao'])):
+    '''
+    Movimentação registrada no extrato de uma conta. O valor (positivo para entradas,
+    negativo para saídas) e o saldo após a movimentação estão em centavos, e a data no
+    formato "AAAA-MM-DD HH:MM:SS".
+    '''
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        contraparte = f" ({self.contraparte})" if self.contraparte else ""
+        return f"{self.data},{self.tipo}{contraparte},{formatar_decimal(self.valor)},{formatar_decimal(self.saldo)}"
+
+
+class RepositorioLancamentos:
+    SQL_CRIAR = '''
+        CREATE TABLE IF NOT EXISTS lancamentos (
+            id INTEGER PRIMARY KEY,
+            email TEXT NOT NULL,
+            data TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            valor INTEGER NOT NULL,
+            saldo INTEGER NOT NULL,
+            contraparte TEXT,
+            descricao TEXT
+        )
+    '''
+    SQL_INDICE = "CREATE INDEX IF NOT EXISTS lancamentos_email_data ON lancamentos (email, data, id)"
+    SQL_INDICE_DESCRICAO = "CREATE INDEX IF NOT EXISTS lancamentos_descricao ON lancamentos (descricao)"
+    SQL_SOMENTE_INSERCAO = '''
+        CREATE TRIGGER IF NOT EXISTS lancamentos_sem_{operacao} BEFORE {operacao} ON lancamentos
+        BEGIN SELECT RAISE(ABORT, 'O extrato não pode ser alterado.'); END
+    '''
+    SQL_INSERIR = '''
+        INSERT INTO lancamentos (email, data, tipo, valor, saldo, contraparte, descricao)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    SQL_CRIAR_ROTINAS = '''
+        CREATE TABLE IF NOT EXISTS rotinas_diarias (
+            rotina TEXT NOT NULL,
+            data TEXT NOT NULL,
+            estado TEXT NOT NULL,
+            contas INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (rotina, data)
+        )
+    '''
+    JANELA = 0.01
+    EM_ANDAMENTO = 'em_andamento'
+    CONCLUIDA = 'concluida'
+
+    def __init__(self, nome_arquivo: str) -> None:
+        '''
+        Inicializa o armazenamento dos lançamentos das contas em SQLite.
+
+        O extrato de todas as contas fica em uma única tabela, indexada por conta e data,
+        na qual só são permitidas inserções (gatilhos recusam alterações e remoções). As
+        movimentações são enfileiradas e inseridas em lote por uma thread própria, de
+        modo que registrar um lançamento não acrescenta uma gravação em disco ao
+        depósito, ao saque ou à transferência.
+
+        Também guarda o registro das rotinas diárias em lote (como o rendimento dos
+        saldos), que permite rodar uma rotina de novo para a mesma data sem repetir os
+        créditos.
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Nome do arquivo do banco de dados.
+        '''
+        self.nome_arquivo = nome_arquivo
+        self.conexao = abrir_conexao(nome_arquivo)
+        self._trava = threading.RLock()
+        with self.conexao:
+            self.conexao.execute(self.SQL_CRIAR)
+            self.conexao.execute(self.SQL_INDICE)
+            self.conexao.execute(self.SQL_INDICE_DESCRICAO)
+            for operacao in ('UPDATE', 'DELETE'):
+                self.conexao.execute(self.SQL_SOMENTE_INSERCAO.format(operacao=operacao))
+            self.conexao.execute(self.SQL_CRIAR_ROTINAS)
+
+        self._pendentes = []
+        self._geracao = 0
+        self._geracao_gravada = 0
+        self._geracao_com_erro = 0
+        self._encerrando = False
+        self._ocioso = False
+        self._segundo = None
+        self._data_segundo = None
+        self._condicao = threading.Condition()
+        self._thread = threading.Thread(target=self._executar, name="RepositorioLancamentos", daemon=True)
+        self._thread.start()
+        atexit.register(self.fechar)
+
+    @staticmethod
+    def _data(valor) -> str:
+        '''
+        Converte uma data para o formato armazenado.
+
+        Parâmetros
+        ----------
+        valor : datetime.datetime, datetime.date ou str
+            Data a converter.
+
+        Retorna
+        -------
+        str
+            Data no formato "AAAA-MM-DD HH:MM:SS" (ou o texto recebido).
+        '''
+        if isinstance(valor, datetime.datetime):
+            return valor.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(valor, datetime.date):
+            return valor.strftime("%Y-%m-%d")
+        return valor
+
+    def _agora(self) -> str:
+        '''
+        Data e hora atuais no formato armazenado, formatadas uma vez por segundo.
+
+        Retorna
+        -------
+        str
+            Data no formato "AAAA-MM-DD HH:MM:SS".
+        '''
+        segundo = int(time.time())
+        if segundo != self._segundo:
+            self._data_segundo = self._data(datetime.datetime.fromtimestamp(segundo))
+            self._segundo = segundo
+        return self._data_segundo
+
+    def registrar(self, email: str, tipo: str, valor: int, saldo: int, contraparte: str = None, descricao: str = None) -> None:
+        '''
+        Enfileira uma movimentação no extrato de uma conta; retorna sem esperar a gravação.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+        tipo : str
+            Tipo da movimentação (ex.: 'deposito', 'saque', 'transferencia').
+        valor : int
+            Valor em centavos; negativo para saídas.
+        saldo : int
+            Saldo da conta após a movimentação, em centavos.
+        contraparte : str, opcional
+            Email da outra conta envolvida (transferências).
+        descricao : str, opcional
+            Descrição livre da movimentação.
+        '''
+        self._enfileirar([(email, self._agora(), tipo, int(valor), int(saldo), contraparte, descricao)])
+
+    def registrar_varios(self, movimentacoes) -> None:
+        '''
+        Enfileira várias movimentações com a mesma data; retorna sem esperar a gravação.
+
+        Parâmetros
+        ----------
+        movimentacoes : iterable of tuple
+            Tuplas (email, tipo, valor, saldo, contraparte, descricao), como em registrar.
+        '''
+        data = self._agora()
+        linhas = [(email, data, tipo, int(valor), int(saldo), contraparte, descricao)
+                  for email, tipo, valor, saldo, contraparte, descricao in movimentacoes]
+        if linhas:
+            self._enfileirar(linhas)
+
+    def _enfileirar(self, linhas: list) -> None:
+        '''
+        Acrescenta linhas à fila de gravação, acordando a thread apenas se ela estiver parada.
+
+        Parâmetros
+        ----------
+        linhas : list of tuple
+            Linhas no formato da tabela lancamentos (sem o id).
+        '''
+        with self._condicao:
+            self._pendentes.extend(linhas)
+            self._geracao += 1
+            if self._ocioso:
+                self._ocioso = False
+                self._condicao.notify_all()
+
+    def descarregar(self) -> None:
+        '''
+        Barreira: aguarda até que todas as movimentações enfileiradas estejam gravadas.
+        '''
+        with self._condicao:
+            geracao = self._geracao
+            while self._geracao_gravada < geracao and self._thread.is_alive():
+                self._condicao.wait()
+            if geracao and self._geracao_com_erro >= geracao:
+                raise OSError("Falha ao gravar o extrato; nova tentativa será feita.")
+
+    def _executar(self) -> None:
+        '''
+        Laço da thread de gravação: espera a janela e insere em uma transação tudo o que
+        foi enfileirado.
+        '''
+        while True:
+            with self._condicao:
+                while not self._pendentes and not self._encerrando:
+                    self._ocioso = True
+                    self._condicao.wait()
+                self._ocioso = False
+                if not self._pendentes:
+                    return
+
+            if not self._encerrando:
+                time.sleep(self.JANELA)
+
+            with self._condicao:
+                lote, self._pendentes = self._pendentes, []
+                geracao = self._geracao
+
+            try:
+                with self._trava, self.conexao:
+                    self.conexao.executemany(self.SQL_INSERIR, lote)
+                erro = False
+            except Exception as e:
+                print(f"Erro ao gravar o extrato: {e}")
+                erro = True
+
+            with self._condicao:
+                if erro:
+                    self._pendentes[:0] = lote
+                    self._geracao_com_erro = geracao
+                self._geracao_gravada = geracao
+                self._condicao.notify_all()
+                if erro and self._encerrando:
+                    return
+            if erro:
+                time.sleep(1)
+
+    def extrato(self, email: str, inicio=None, fim=None, limite: int = 50, apos: Lancamento = None) -> list:
+        '''
+        Lê uma página do extrato de uma conta em ordem cronológica.
+
+        A consulta percorre apenas o trecho do índice (email, data, id) da conta a partir
+        do início do período ou do último lançamento da página anterior, de modo que o
+        custo depende do tamanho da página e não do histórico da conta.
+
+        Parâmetros
+        ----------
+        email : str
+            Email da conta.
+        inicio : datetime.datetime, datetime.date ou str, opcional
+            Data inicial (inclusive).
+        fim : datetime.datetime, datetime.date ou str, opcional
+            Data final (exclusive).
+        limite : int, opcional
+            Tamanho da página.
+        apos : Lancamento, opcional
+            Último lançamento da página anterior; a página começa logo depois dele.
+
+        Retorna
+        -------
+        list of Lancamento
+            Os lançamentos da página; menos que limite quando não há mais lançamentos.
+        '''
+        self.descarregar()
+        condicoes, parametros = ["email = ?"], [email]
+        if inicio is not None:
+            condicoes.append("data >= ?")
+            parametros.append(self._data(inicio))
+        if fim is not None:
+            condicoes.append("data < ?")
+            parametros.append(self._data(fim))
+        if apos is not None:
+            condicoes.append("(data, id) > (?, ?)")
+            parametros.extend((apos.data, apos.id))
+        parametros.append(int(limite))
+        with self._trava:
+            linhas = self.conexao.execute(
+                f"SELECT id, data, tipo, valor, saldo, contraparte, descricao FROM lancamentos "
+                f"WHERE {' AND '.join(condicoes)} ORDER BY data, id LIMIT ?",
+                parametros
+            ).fetchall()
+        return [Lancamento(*linha) for linha in linhas]
+
+    def registrados(self, pares) -> set:
+        '''
+        Verifica quais lançamentos com uma descrição já estão no extrato das contas.
+
+        Cada consulta usa o índice da conta, de modo que o custo depende dos lançamentos
+        das contas consultadas e não do extrato inteiro.
+
+        Parâmetros
+        ----------
+        pares : iterable of tuple
+            Tuplas (email, descricao).
+
+        Retorna
+        -------
+        set of tuple
+            Os pares encontrados.
+        '''
+        self.descarregar()
+        encontrados = set()
+        with self._trava:
+            for email, descricao in pares:
+                if self.conexao.execute(
+                    "SELECT 1 FROM lancamentos WHERE email = ? AND descricao = ? LIMIT 1", (email, descricao)
+                ).fetchone() is not None:
+                    encontrados.add((email, descricao))
+        return encontrados
+
+    def por_descricao(self, descricao: str) -> dict:
+        '''
+        Busca os lançamentos com uma descrição (por exemplo, os de uma rotina diária).
+
+        Parâmetros
+        ----------
+        descricao : str
+            Descrição dos lançamentos.
+
+        Retorna
+        -------
+        dict
+            Valor em centavos de cada lançamento, indexado pelo email da conta.
+        '''
+        self.descarregar()
+        with self._trava:
+            linhas = self.conexao.execute(
+                "SELECT email, valor FROM lancamentos WHERE descricao = ?", (descricao,)
+            ).fetchall()
+        return {email: valor for email, valor in linhas}
+
+    def ultimos(self, emails) -> dict:
+        '''
+        Busca o lançamento mais recente do extrato de cada conta.
+
+        Parâmetros
+        ----------
+        emails : iterable of str
+            Emails das contas.
+
+        Retorna
+        -------
+        dict
+            Último Lancamento de cada conta com extrato, indexado por email.
+        '''
+        self.descarregar()
+        ultimos = {}
+        with self._trava:
+            for email in emails:
+                linha = self.conexao.execute(
+                    "SELECT id, data, tipo, valor, saldo, contraparte, descricao FROM lancamentos "
+                    "WHERE email = ? ORDER BY data DESC, id DESC LIMIT 1", (email,)
+                ).fetchone()
+                if linha is not None:
+                    ultimos[email] = Lancamento(*linha)
+        return ultimos
+
+    def iniciar_rotina(self, rotina: str, data: str) -> str:
+        '''
+        Registra o início de uma rotina diária, se ela ainda não foi iniciada para a data.
+
+        Parâmetros
+        ----------
+        rotina : str
+            Nome da rotina (ex.: 'rendimento').
+        data : str
+            Dia da rotina ("AAAA-MM-DD").
+
+        Retorna
+        -------
+        str
+            None se a rotina foi iniciada agora; senão, o estado anterior
+            (EM_ANDAMENTO, se uma execução foi interrompida, ou CONCLUIDA).
+        '''
+        with self._trava, self.conexao:
+            linha = self.conexao.execute(
+                "SELECT estado FROM rotinas_diarias WHERE rotina = ? AND data = ?", (rotina, data)
+            ).fetchone()
+            if linha is not None:
+                return linha['estado']
+            self.conexao.execute(
+                "INSERT INTO rotinas_diarias (rotina, data, estado) VALUES (?, ?, ?)", (rotina, data, self.EM_ANDAMENTO)
+            )
+        return None
+
+    def concluir_rotina(self, rotina: str, data: str, contas: int, total: int) -> None:
+        '''
+        Marca uma rotina diária como concluída.
+
+        Parâmetros
+        ----------
+        rotina : str
+            Nome da rotina.
+        data : str
+            Dia da rotina ("AAAA-MM-DD").
+        contas : int
+            Contas alteradas.
+        total : int
+            Valor total lançado, em centavos.
+        '''
+        with self._trava, self.conexao:
+            self.conexao.execute(
+                "UPDATE rotinas_diarias SET estado = ?, contas = ?, total = ? WHERE rotina = ? AND data = ?",
+                (self.CONCLUIDA, contas, total, rotina, data)
+            )
+
+    def fechar(self) -> None:
+        '''
+        Grava as movimentações pendentes, encerra a thread de gravação e fecha o banco.
+        '''
+        if self._thread.is_alive():
+            try:
+                self.descarregar()
+            except OSError as e:
+                print(e)
+            with self._condicao:
+                self._encerrando = True
+                self._ocioso = False
+                self._condicao.notify_all()
+            self._thread.join()
+            self.conexao.close()
@@ -0,0 +1,835 @@
+import io
+import os
+import csv
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+import configuracao
+from dinheiro import formatar_decimal, para_centavos
+from snapshotUsuarios import ColunasSnapshot, SnapshotUsuarios, snapshot_valido
+
+COLUNAS_USUARIO = [
+    'nome', 'sobrenome', 'email', 'senha', 'cpf', 'tipo', 'saldo', 'status_cartao',
+    'limite_cartao', 'divida_cartao', 'limite_requerido', 'solicitar_encerramento'
+]
+COLUNAS_VALORES = ['saldo', 'limite_cartao', 'divida_cartao', 'limite_requerido']
+COLUNAS_OBRIGATORIAS = ['nome', 'sobrenome', 'email', 'senha', 'cpf', 'tipo']
+
+
+class RepositorioUsuarios(ABC):
+    '''
+    Interface de armazenamento dos usuários usada pelo GerenciadorUsuarios.
+
+    Os usuários trafegam como registros no formato de to_dict().
+    '''
+
+    @abstractmethod
+    def carregar(self):
+        '''
+        Lê todos os usuários armazenados.
+
+        Retorna
+        -------
+        iterable of dict
+            Registros dos usuários.
+        '''
+        pass
+
+    @abstractmethod
+    def carregar_indice(self):
+        '''
+        Lê apenas os dados de indexação dos usuários, sem montar os registros completos.
+
+        Retorna
+        -------
+        iterable of tuple
+            (email, cpf, tipo) de cada usuário.
+        '''
+        pass
+
+    @abstractmethod
+    def ler(self, email: str) -> dict:
+        '''
+        Lê o registro completo de um usuário.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado do usuário.
+
+        Retorna
+        -------
+        dict
+            Registro do usuário, ou None se ele não existir.
+        '''
+        pass
+
+    @abstractmethod
+    def salvar(self, registros: list) -> None:
+        '''
+        Persiste apenas os usuários alterados.
+
+        Parâmetros
+        ----------
+        registros : list of dict
+            Registros dos usuários alterados.
+        '''
+        pass
+
+    @abstractmethod
+    def remover(self, email: str) -> None:
+        '''
+        Remove um usuário do armazenamento.
+
+        Parâmetros
+        ----------
+        email : str
+            Email do usuário a ser removido.
+        '''
+        pass
+
+    @abstractmethod
+    def gravar_todos(self, registros) -> None:
+        '''
+        Substitui o conteúdo armazenado pelos registros informados.
+
+        Parâmetros
+        ----------
+        registros : iterable of dict
+            Registros de todos os usuários.
+        '''
+        pass
+
+    def precisa_compactar(self) -> bool:
+        '''
+        Indica se o armazenamento pede uma gravação completa (compactação).
+
+        Retorna
+        -------
+        bool
+            True se gravar_todos deve ser chamado.
+        '''
+        return False
+
+    def compactar_apos(self, quantidade: int) -> bool:
+        '''
+        Indica se uma gravação de muitos registros de uma vez deve ser seguida de uma compactação.
+
+        Parâmetros
+        ----------
+        quantidade : int
+            Registros gravados juntos.
+
+        Retorna
+        -------
+        bool
+            True se gravar_todos deve ser chamado depois da gravação.
+        '''
+        return False
+
+    def abrir_snapshot(self):
+        '''
+        Abre o snapshot binário dos usuários, se o armazenamento tiver um válido.
+
+        Retorna
+        -------
+        tuple
+            (snapshot, alteracoes): o SnapshotUsuarios e as alterações gravadas depois
+            dele (o registro, ou None para os usuários removidos, por email); None se
+            não houver snapshot.
+        '''
+        return None
+
+    def fechar(self) -> None:
+        '''
+        Libera os recursos do armazenamento.
+        '''
+        pass
+
+
+class RepositorioCSV(RepositorioUsuarios):
+    def __init__(self, nome_arquivo: str, usar_journal: bool = True, limite_journal: int = 1000,
+                 usar_snapshot: bool = True) -> None:
+        '''
+        Inicializa o armazenamento em CSV com journal e snapshot binário opcionais.
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Nome do arquivo CSV contendo os dados dos usuários.
+        usar_journal : bool, opcional
+            Se True, cada alteração é anexada ao journal em vez de reescrever o CSV inteiro.
+        limite_journal : int, opcional
+            Quantidade de registros no journal que pede a compactação para o CSV.
+        usar_snapshot : bool, opcional
+            Se True, cada compactação grava também um snapshot binário
+            ("<arquivo>.snapshot"), lido no lugar do CSV enquanto não for mais antigo que ele.
+        '''
+        self.nome_arquivo = nome_arquivo
+        self.nome_journal = f"{nome_arquivo}.journal"
+        self.nome_snapshot = f"{nome_arquivo}.snapshot"
+        self.usar_journal = usar_journal
+        self.limite_journal = limite_journal
+        self.usar_snapshot = usar_snapshot
+        self.registros_journal = 0
+        self._sobrepostos = {}
+        self._posicoes = None
+        self._snapshot = None
+        self._trava = threading.RLock()
+
+    def _abrir_snapshot(self):
+        '''
+        Abre o snapshot binário, se ele existir e corresponder ao CSV atual.
+
+        Retorna
+        -------
+        SnapshotUsuarios
+            O snapshot aberto, ou None.
+        '''
+        with self._trava:
+            if self._snapshot is None and self.usar_snapshot and snapshot_valido(self.nome_snapshot, self.nome_arquivo):
+                try:
+                    self._snapshot = SnapshotUsuarios(self.nome_snapshot)
+                except (OSError, ValueError) as e:
+                    print(f"Snapshot dos usuários ignorado: {e}")
+            return self._snapshot
+
+    def abrir_snapshot(self):
+        '''
+        Abre o snapshot binário para que os índices do gerenciador sejam servidos por ele.
+
+        Enquanto ele estiver aberto, ler() busca os usuários no snapshot pela sua tabela
+        de espalhamento, sem ler o CSV.
+
+        Retorna
+        -------
+        tuple
+            (snapshot, alteracoes), com as alterações do journal; None se não houver
+            snapshot válido.
+        '''
+        snapshot = self._abrir_snapshot()
+        if snapshot is None:
+            return None
+        with self._trava:
+            self._sobrepostos = self._ler_journal() if self.usar_journal else {}
+            self._posicoes = None
+            return snapshot, dict(self._sobrepostos)
+
+    def carregar(self):
+        '''
+        Lê os usuários do CSV linha a linha, aplicando o journal gravado após a última compactação.
+
+        Apenas o journal (limitado pela compactação) fica em memória; as linhas do CSV são
+        convertidas e entregues uma a uma. Linhas inválidas são informadas com o número da
+        linha e ignoradas. Se houver um snapshot válido, os usuários são lidos dele, sem
+        converter texto.
+
+        Retorna
+        -------
+        iterable of dict
+            Registros dos usuários.
+        '''
+        sobrepostos = self._ler_journal() if self.usar_journal else {}
+        snapshot = self._abrir_snapshot()
+        if snapshot is not None:
+            for registro in snapshot.registros():
+                if registro['email'] in sobrepostos:
+                    registro = sobrepostos.pop(registro['email'])
+                    if registro is None:
+                        continue
+                yield registro
+        elif os.path.exists(self.nome_arquivo):
+            with open(self.nome_arquivo, 'r', encoding='utf-8', newline='') as arquivo:
+                leitor = csv.reader(arquivo)
+                cabecalho = [coluna.strip() for coluna in next(leitor, [])]
+                faltando = [coluna for coluna in COLUNAS_OBRIGATORIAS if coluna not in cabecalho]
+                if faltando:
+                    print(f"Erro ao ler o arquivo CSV: colunas {', '.join(faltando)} faltando")
+                else:
+                    indices = [cabecalho.index(coluna) if coluna in cabecalho else None for coluna in COLUNAS_USUARIO]
+                    indice_email = cabecalho.index('email')
+                    for numero, linha in enumerate(leitor, start=2):
+                        if not linha:
+                            continue
+                        email = linha[indice_email].strip().lower() if indice_email < len(linha) else ''
+                        if email in sobrepostos:
+                            registro = sobrepostos.pop(email)
+                            if registro is not None:
+                                yield registro
+                            continue
+                        try:
+                            yield self._converter_linha(linha, indices)
+                        except ValueError as e:
+                            print(f"Erro ao carregar usuário na linha {numero}: {e}")
+
+        for registro in sobrepostos.values():
+            if registro is not None:
+                yield registro
+
+    def carregar_indice(self):
+        '''
+        Lê email, CPF e tipo de cada usuário, guardando a posição (em bytes) de cada linha
+        no CSV para que ler() busque o registro completo diretamente.
+
+        Retorna
+        -------
+        iterable of tuple
+            (email, cpf, tipo) de cada usuário.
+        '''
+        self._sobrepostos = self._ler_journal() if self.usar_journal else {}
+        self._posicoes = {}
+        if os.path.exists(self.nome_arquivo):
+            with open(self.nome_arquivo, 'rb') as arquivo:
+                cabecalho = [coluna.strip() for coluna in self._ler_campos(arquivo.readline())]
+                faltando = [coluna for coluna in COLUNAS_OBRIGATORIAS if coluna not in cabecalho]
+                if faltando:
+                    print(f"Erro ao ler o arquivo CSV: colunas {', '.join(faltando)} faltando")
+                    return
+                indice_email, indice_cpf, indice_tipo = (cabecalho.index(coluna) for coluna in ('email', 'cpf', 'tipo'))
+                maior_indice = max(indice_email, indice_cpf, indice_tipo)
+                numero = 1
+                while True:
+                    posicao = arquivo.tell()
+                    linha = arquivo.readline()
+                    if not linha:
+                        break
+                    numero += 1
+                    campos = self._ler_campos(linha)
+                    if len(campos) <= maior_indice:
+                        if campos:
+                            print(f"Erro ao carregar usuário na linha {numero}: colunas faltando")
+                        continue
+                    email = campos[indice_email].strip().lower()
+                    self._posicoes[email] = posicao
+                    if email not in self._sobrepostos:
+                        yield email, campos[indice_cpf].strip(), campos[indice_tipo].strip().lower()
+
+        for email, registro in self._sobrepostos.items():
+            if registro is not None:
+                yield email, registro['cpf'], registro['tipo']
+
+    @staticmethod
+    def _ler_campos(linha: bytes) -> list:
+        '''
+        Separa os campos de uma linha do CSV lida em modo binário.
+
+        Parâmetros
+        ----------
+        linha : bytes
+            Linha completa do arquivo.
+
+        Retorna
+        -------
+        list of str
+            Campos da linha.
+        '''
+        return next(csv.reader([linha.decode('utf-8')]), [])
+
+    def ler(self, email: str) -> dict:
+        '''
+        Lê um usuário: do journal, se ele foi alterado após a compactação, ou da sua linha
+        no CSV (ou no snapshot, se ele foi aberto por abrir_snapshot).
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado do usuário.
+
+        Retorna
+        -------
+        dict
+            Registro do usuário, ou None se ele não existir.
+        '''
+        with self._trava:
+            if email in self._sobrepostos:
+                return self._sobrepostos[email]
+            if self._posicoes is None and self._snapshot is not None:
+                linha = self._snapshot.buscar('email', email)
+                return None if linha is None else self._snapshot.registro(linha)
+            posicao = (self._posicoes or {}).get(email)
+            if posicao is None:
+                return None
+            with open(self.nome_arquivo, 'rb') as arquivo:
+                cabecalho = [coluna.strip() for coluna in self._ler_campos(arquivo.readline())]
+                arquivo.seek(posicao)
+                linha = self._ler_campos(arquivo.readline())
+        indices = [cabecalho.index(coluna) if coluna in cabecalho else None for coluna in COLUNAS_USUARIO]
+        return self._converter_linha(linha, indices)
+
+    @staticmethod
+    def _converter_linha(linha: list, indices: list) -> dict:
+        '''
+        Converte uma linha do CSV em um registro com os valores já tipados.
+
+        Parâmetros
+        ----------
+        linha : list of str
+            Campos lidos pelo csv.reader.
+        indices : list of int
+            Posição de cada coluna de COLUNAS_USUARIO na linha (None se a coluna não existir).
+
+        Retorna
+        -------
+        dict
+            Registro do usuário.
+        '''
+        tamanho = len(linha)
+        registro = dict(zip(COLUNAS_USUARIO, [
+            linha[indice].strip() if indice is not None and indice < tamanho else '' for indice in indices
+        ]))
+        registro['email'] = registro['email'].lower()
+        if registro['tipo'].lower() == 'cliente':
+            for coluna in COLUNAS_VALORES:
+                try:
+                    registro[coluna] = formatar_decimal(para_centavos(registro[coluna] or '0'))
+                except (ArithmeticError, ValueError):
+                    raise ValueError(f"valor inválido na coluna {coluna}: {registro[coluna]!r}") from None
+            registro['solicitar_encerramento'] = registro['solicitar_encerramento'].lower() == 'true'
+        return registro
+
+    def _ler_journal(self) -> dict:
+        '''
+        Lê o journal gravado após a última compactação.
+
+        Cada linha do journal é um registro JSON completo; uma linha final truncada
+        (escrita interrompida) é descartada.
+
+        Retorna
+        -------
+        dict
+            Último registro de cada email alterado, ou None para os removidos.
+        '''
+        self.registros_journal = 0
+        sobrepostos = {}
+        if not os.path.exists(self.nome_journal):
+            return sobrepostos
+
+        with open(self.nome_journal, 'r', encoding='utf-8') as journal:
+            for numero, linha in enumerate(journal, start=1):
+                if not linha.strip():
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    print(f"Journal: registro {numero} incompleto descartado.")
+                    break
+
+                self.registros_journal += 1
+                if registro['op'] == 'salvar':
+                    for dados in registro['usuarios']:
+                        sobrepostos[dados['email']] = dados
+                elif registro['op'] == 'remover':
+                    sobrepostos[registro['email']] = None
+        return sobrepostos
+
+    def _anexar_journal(self, registro: dict) -> None:
+        '''
+        Anexa um registro ao journal e força a gravação em disco.
+
+        Parâmetros
+        ----------
+        registro : dict
+            Registro a ser gravado como uma linha JSON.
+        '''
+        with self._trava:
+            with open(self.nome_journal, 'a', encoding='utf-8') as journal:
+                journal.write(json.dumps(registro, ensure_ascii=False) + "\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+            self.registros_journal += 1
+
+    def salvar(self, registros: list) -> None:
+        if self.usar_journal:
+            self._anexar_journal({'op': 'salvar', 'usuarios': registros})
+        with self._trava:
+            for registro in registros:
+                self._sobrepostos[registro['email']] = registro
+
+    def remover(self, email: str) -> None:
+        if self.usar_journal:
+            self._anexar_journal({'op': 'remover', 'email': email})
+        with self._trava:
+            self._sobrepostos[email] = None
+
+    def precisa_compactar(self) -> bool:
+        return not self.usar_journal or self.registros_journal >= self.limite_journal
+
+    def compactar_apos(self, quantidade: int) -> bool:
+        # Uma gravação grande é uma única linha do journal, relida inteira a cada
+        # inicialização até a próxima compactação.
+        return self.usar_journal and quantidade >= self.limite_journal
+
+    def gravar_todos(self, registros) -> None:
+        '''
+        Grava um snapshot completo dos usuários no CSV e descarta o journal.
+
+        O CSV é escrito em um arquivo temporário e substituído atomicamente, de modo
+        que uma falha durante a compactação não perde o journal. O snapshot binário é
+        montado na mesma passada e gravado depois do CSV.
+
+        Parâmetros
+        ----------
+        registros : iterable of dict
+            Registros de todos os usuários.
+        '''
+        with self._trava:
+            arquivo_temporario = f"{self.nome_arquivo}.tmp"
+            posicoes = {}
+            colunas = ColunasSnapshot() if self.usar_snapshot else None
+            with open(arquivo_temporario, 'wb') as arquivo:
+                linha = io.StringIO()
+                escritor = csv.DictWriter(linha, fieldnames=COLUNAS_USUARIO, restval='', extrasaction='ignore')
+                escritor.writeheader()
+                blocos = [linha.getvalue().encode('utf-8')]
+                posicao = len(blocos[0])
+                for registro in registros:
+                    linha.seek(0)
+                    linha.truncate()
+                    escritor.writerow(registro)
+                    dados = linha.getvalue().encode('utf-8')
+                    posicoes[registro['email']] = posicao
+                    posicao += len(dados)
+                    blocos.append(dados)
+                    if colunas is not None:
+                        try:
+                            colunas.adicionar(registro)
+                        except ValueError as e:
+                            print(f"Snapshot dos usuários não gravado: {e}")
+                            colunas = None
+                    if len(blocos) >= 4096:
+                        arquivo.write(b''.join(blocos))
+                        blocos.clear()
+                arquivo.write(b''.join(blocos))
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+            os.replace(arquivo_temporario, self.nome_arquivo)
+            gravado = colunas is not None and self._gravar_snapshot(colunas)
+
+            if os.path.exists(self.nome_journal):
+                os.remove(self.nome_journal)
+            self.registros_journal = 0
+            self._sobrepostos = {}
+            if self._snapshot is not None and not gravado:
+                # O snapshot aberto ficou desatualizado: ler() volta a usar o CSV. Ele não
+                # é fechado porque os índices do gerenciador continuam servidos por ele.
+                self._snapshot = None
+                self._posicoes = posicoes
+            elif self._posicoes is not None:
+                self._posicoes = posicoes
+
+    def _gravar_snapshot(self, colunas: ColunasSnapshot) -> bool:
+        '''
+        Grava o snapshot binário do CSV atual e o coloca no lugar do anterior (trocando o
+        mapeamento, se aberto).
+
+        Parâmetros
+        ----------
+        colunas : ColunasSnapshot
+            Usuários acumulados.
+
+        Retorna
+        -------
+        bool
+            True se o snapshot foi gravado.
+        '''
+        temporario = f"{self.nome_snapshot}.tmp"
+        try:
+            colunas.gravar(temporario, self.nome_arquivo)
+            if self._snapshot is not None:
+                self._snapshot.substituir(temporario)
+            else:
+                os.replace(temporario, self.nome_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao gravar o snapshot dos usuários: {e}")
+            if os.path.exists(temporario):
+                os.remove(temporario)
+            return False
+        return True
+
+    def gravar_snapshot(self) -> int:
+        '''
+        Grava o snapshot binário a partir do CSV e do journal atuais, sem compactar o CSV.
+
+        O journal continua sendo aplicado sobre o snapshot na leitura; como cada registro
+        do journal é completo, aplicá-lo de novo não altera o resultado.
+
+        Retorna
+        -------
+        int
+            Quantidade de usuários no snapshot.
+        '''
+        with self._trava:
+            colunas = ColunasSnapshot()
+            for registro in self.carregar():
+                colunas.adicionar(registro)
+            if not self._gravar_snapshot(colunas):
+                raise OSError(f"Não foi possível gravar {self.nome_snapshot}")
+        return len(colunas)
+
+    def fechar(self) -> None:
+        with self._trava:
+            if self._snapshot is not None:
+                self._snapshot.fechar()
+
+
+class RepositorioSQLite(RepositorioUsuarios):
+    SQL_CRIAR = '''
+        CREATE TABLE IF NOT EXISTS usuarios (
+            email TEXT PRIMARY KEY,
+            nome TEXT NOT NULL,
+            sobrenome TEXT NOT NULL,
+            senha TEXT NOT NULL,
+            cpf TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            saldo INTEGER,
+            status_cartao TEXT,
+            limite_cartao INTEGER,
+            divida_cartao INTEGER,
+            limite_requerido INTEGER,
+            solicitar_encerramento INTEGER
+        )
+    '''
+    COLUNAS_VALORES = ('saldo', 'limite_cartao', 'divida_cartao', 'limite_requerido')
+    SQL_SALVAR = '''
+        INSERT INTO usuarios (email, nome, sobrenome, senha, cpf, tipo, saldo, status_cartao,
+                              limite_cartao, divida_cartao, limite_requerido, solicitar_encerramento)
+        VALUES (:email, :nome, :sobrenome, :senha, :cpf, :tipo, :saldo, :status_cartao,
+                :limite_cartao, :divida_cartao, :limite_requerido, :solicitar_encerramento)
+        ON CONFLICT(email) DO UPDATE SET
+            nome = excluded.nome, sobrenome = excluded.sobrenome, senha = excluded.senha,
+            cpf = excluded.cpf, tipo = excluded.tipo, saldo = excluded.saldo,
+            status_cartao = excluded.status_cartao, limite_cartao = excluded.limite_cartao,
+            divida_cartao = excluded.divida_cartao, limite_requerido = excluded.limite_requerido,
+            solicitar_encerramento = excluded.solicitar_encerramento
+    '''
+
+    def __init__(self, nome_arquivo: str) -> None:
+        '''
+        Inicializa o armazenamento em SQLite, criando a tabela se necessário.
+
+        Os valores monetários são guardados em centavos (INTEGER); um banco criado com
+        as colunas em reais (REAL) é convertido na abertura.
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Nome do arquivo do banco de dados.
+        '''
+        self.nome_arquivo = nome_arquivo
+        self.conexao = abrir_conexao(nome_arquivo)
+        self._trava = threading.RLock()
+        with self.conexao:
+            self.conexao.execute(self.SQL_CRIAR)
+            self._migrar_centavos()
+
+    def _migrar_centavos(self) -> None:
+        '''
+        Converte as colunas monetárias de reais (REAL) para centavos (INTEGER), se preciso.
+
+        A tabela é recriada com o esquema atual na mesma transação, preservando a
+        ordem de cadastro.
+        '''
+        tipos = {linha['name']: linha['type'].upper() for linha in self.conexao.execute("PRAGMA table_info(usuarios)")}
+        if tipos.get('saldo') != 'REAL':
+            return
+        colunas = ', '.join(COLUNAS_USUARIO)
+        linhas = self.conexao.execute(f"SELECT {colunas} FROM usuarios ORDER BY rowid").fetchall()
+        self.conexao.execute("DROP TABLE usuarios")
+        self.conexao.execute(self.SQL_CRIAR)
+        registros = []
+        for linha in linhas:
+            registro = dict(linha)
+            for coluna in self.COLUNAS_VALORES:
+                if registro[coluna] is not None:
+                    registro[coluna] = para_centavos(float(registro[coluna]))
+            registros.append(registro)
+        self.conexao.executemany(
+            f"INSERT INTO usuarios ({colunas}) VALUES ({', '.join(':' + coluna for coluna in COLUNAS_USUARIO)})",
+            registros
+        )
+
+    @staticmethod
+    def _parametros(registro: dict) -> dict:
+        '''
+        Converte um registro de to_dict() nos parâmetros da instrução SQL.
+
+        Parâmetros
+        ----------
+        registro : dict
+            Registro do usuário.
+
+        Retorna
+        -------
+        dict
+            Parâmetros nomeados, com os valores em centavos; campos ausentes
+            (administradores) viram NULL.
+        '''
+        parametros = {coluna: registro.get(coluna) for coluna in COLUNAS_USUARIO}
+        for coluna in RepositorioSQLite.COLUNAS_VALORES:
+            if parametros[coluna] not in (None, ''):
+                parametros[coluna] = para_centavos(parametros[coluna])
+            else:
+                parametros[coluna] = None
+        if parametros['solicitar_encerramento'] not in (None, ''):
+            parametros['solicitar_encerramento'] = int(str(parametros['solicitar_encerramento']).lower() in ('true', '1'))
+        else:
+            parametros['solicitar_encerramento'] = None
+        if parametros['status_cartao'] == '':
+            parametros['status_cartao'] = None
+        parametros['cpf'] = str(parametros['cpf'])
+        return parametros
+
+    @classmethod
+    def _registro(cls, linha) -> dict:
+        '''
+        Converte uma linha da tabela em um registro no formato do armazenamento.
+
+        Parâmetros
+        ----------
+        linha : sqlite3.Row
+            Linha da tabela usuarios.
+
+        Retorna
+        -------
+        dict
+            Registro com os valores monetários em reais ("1234.56").
+        '''
+        registro = dict(linha)
+        for coluna in cls.COLUNAS_VALORES:
+            if registro[coluna] is not None:
+                registro[coluna] = formatar_decimal(registro[coluna])
+        if registro['solicitar_encerramento'] is not None:
+            registro['solicitar_encerramento'] = bool(registro['solicitar_encerramento'])
+        return registro
+
+    def carregar(self):
+        '''
+        Lê os usuários do banco na ordem de cadastro.
+
+        Retorna
+        -------
+        iterable of dict
+            Registros dos usuários.
+        '''
+        with self._trava:
+            linhas = self.conexao.execute(f"SELECT {', '.join(COLUNAS_USUARIO)} FROM usuarios ORDER BY rowid").fetchall()
+        for linha in linhas:
+            yield self._registro(linha)
+
+    def carregar_indice(self):
+        with self._trava:
+            linhas = self.conexao.execute("SELECT email, cpf, tipo FROM usuarios ORDER BY rowid").fetchall()
+        for linha in linhas:
+            yield linha['email'], linha['cpf'], linha['tipo']
+
+    def ler(self, email: str) -> dict:
+        with self._trava:
+            linha = self.conexao.execute(
+                f"SELECT {', '.join(COLUNAS_USUARIO)} FROM usuarios WHERE email = ?", (email,)
+            ).fetchone()
+        if linha is None:
+            return None
+        return self._registro(linha)
+
+    def salvar(self, registros: list) -> None:
+        '''
+        Atualiza uma linha por usuário alterado, em uma única transação.
+
+        Parâmetros
+        ----------
+        registros : list of dict
+            Registros dos usuários alterados.
+        '''
+        with self._trava, self.conexao:
+            self.conexao.executemany(self.SQL_SALVAR, [self._parametros(registro) for registro in registros])
+
+    def remover(self, email: str) -> None:
+        with self._trava, self.conexao:
+            self.conexao.execute("DELETE FROM usuarios WHERE email = ?", (email,))
+
+    def gravar_todos(self, registros) -> None:
+        with self._trava:
+            parametros = [self._parametros(registro) for registro in registros]
+            with self.conexao:
+                self.conexao.execute("DELETE FROM usuarios")
+                self.conexao.executemany(self.SQL_SALVAR, parametros)
+
+    def fechar(self) -> None:
+        self.conexao.close()
+
+
+def abrir_conexao(nome_arquivo: str) -> sqlite3.Connection:
+    '''
+    Abre uma conexão SQLite em modo WAL, compartilhável entre as threads da interface.
+
+    Com a durabilidade 'sincrono' cada commit vai para o disco (synchronous=FULL); nos
+    outros modos basta o fsync nos checkpoints do WAL (synchronous=NORMAL).
+
+    Parâmetros
+    ----------
+    nome_arquivo : str
+        Nome do arquivo do banco de dados.
+
+    Retorna
+    -------
+    sqlite3.Connection
+        Conexão configurada.
+    '''
+    conexao = sqlite3.connect(nome_arquivo, check_same_thread=False, cached_statements=256)
+    conexao.row_factory = sqlite3.Row
+    conexao.execute("PRAGMA journal_mode=WAL")
+    sincronismo = 'FULL' if configuracao.DURABILIDADE == 'sincrono' else 'NORMAL'
+    conexao.execute(f"PRAGMA synchronous={sincronismo}")
+    return conexao
+
+
+def criar_repositorio(backend: str = None, nome_arquivo: str = None) -> RepositorioUsuarios:
+    '''
+    Cria o armazenamento de usuários selecionado pela configuração.
+
+    Parâmetros
+    ----------
+    backend : str, opcional
+        'csv' ou 'sqlite'. Padrão: configuracao.BACKEND_USUARIOS.
+    nome_arquivo : str, opcional
+        Arquivo de dados. Padrão: o arquivo configurado para o backend.
+
+    Retorna
+    -------
+    RepositorioUsuarios
+        O armazenamento criado.
+    '''
+    backend = (backend or configuracao.BACKEND_USUARIOS).lower()
+    if backend == 'csv':
+        return RepositorioCSV(nome_arquivo or configuracao.ARQUIVO_USUARIOS_CSV,
+                              usar_journal=configuracao.USAR_JOURNAL, limite_journal=configuracao.LIMITE_JOURNAL,
+                              usar_snapshot=configuracao.USAR_SNAPSHOT)
+    elif backend == 'sqlite':
+        return RepositorioSQLite(nome_arquivo or configuracao.ARQUIVO_USUARIOS_SQLITE)
+    raise ValueError(f"Backend de armazenamento inválido: {backend}")
+
+
+def migrar_csv_para_sqlite(arquivo_csv: str, arquivo_sqlite: str) -> int:
+    '''
+    Converte o CSV de usuários (incluindo o journal pendente) em um banco SQLite.
+
+    Parâmetros
+    ----------
+    arquivo_csv : str
+        Arquivo CSV de origem.
+    arquivo_sqlite : str
+        Banco SQLite de destino; o conteúdo existente é substituído.
+
+    Retorna
+    -------
+    int
+        Quantidade de usuários migrados.
+    '''
+    registros = list(RepositorioCSV(arquivo_csv).carregar())
+    destino = RepositorioSQLite(arquivo_sqlite)
+    try:
+        destino.gravar_todos(registros)
+    finally:
+        destino.fechar()
+    return len(registros)
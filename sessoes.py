@@ -0,0 +1,148 @@
+import secrets
+import threading
+import time
+
+
+class Sessao:
+    __slots__ = ('token', 'usuario', 'ultimo_acesso')
+
+    def __init__(self, token: str, usuario, ultimo_acesso: float) -> None:
+        '''
+        Inicializa uma sessão de usuário.
+
+        Parâmetros
+        ----------
+        token : str
+            Identificador aleatório da sessão.
+        usuario : Cliente ou Administrador
+            Usuário autenticado.
+        ultimo_acesso : float
+            Instante (time.monotonic) do último uso da sessão.
+        '''
+        self.token = token
+        self.usuario = usuario
+        self.ultimo_acesso = ultimo_acesso
+
+
+class GerenciadorSessoes:
+    def __init__(self, tempo_ocioso: float = 900.0, intervalo_limpeza: float = 60.0) -> None:
+        '''
+        Inicializa o gerenciador das sessões abertas.
+
+        Parâmetros
+        ----------
+        tempo_ocioso : float, opcional
+            Segundos sem uso após os quais a sessão expira.
+        intervalo_limpeza : float, opcional
+            Intervalo mínimo, em segundos, entre as varreduras de sessões expiradas.
+        '''
+        self.tempo_ocioso = tempo_ocioso
+        self.intervalo_limpeza = intervalo_limpeza
+        self._sessoes = {}
+        self._trava = threading.Lock()
+        self._ultima_limpeza = time.monotonic()
+
+    def criar(self, usuario) -> str:
+        '''
+        Abre uma sessão para um usuário autenticado.
+
+        Parâmetros
+        ----------
+        usuario : Cliente ou Administrador
+            Usuário autenticado.
+
+        Retorna
+        -------
+        str
+            Token da nova sessão.
+        '''
+        token = secrets.token_urlsafe(32)
+        agora = time.monotonic()
+        with self._trava:
+            self._sessoes[token] = Sessao(token, usuario, agora)
+            if agora - self._ultima_limpeza >= self.intervalo_limpeza:
+                self._limpar(agora)
+        return token
+
+    def obter(self, token: str):
+        '''
+        Busca o usuário de uma sessão e renova o seu tempo de expiração.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário da sessão, ou None se ela não existir ou tiver expirado.
+        '''
+        if not token:
+            return None
+        agora = time.monotonic()
+        with self._trava:
+            sessao = self._sessoes.get(token)
+            if sessao is None:
+                return None
+            if agora - sessao.ultimo_acesso > self.tempo_ocioso:
+                del self._sessoes[token]
+                return None
+            sessao.ultimo_acesso = agora
+            return sessao.usuario
+
+    def encerrar(self, token: str):
+        '''
+        Encerra uma sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário da sessão encerrada, ou None se ela não existir.
+        '''
+        with self._trava:
+            sessao = self._sessoes.pop(token, None)
+        return sessao.usuario if sessao else None
+
+    def encerrar_do_usuario(self, email: str) -> int:
+        '''
+        Encerra todas as sessões de um usuário (por exemplo, quando a conta é removida).
+
+        Parâmetros
+        ----------
+        email : str
+            Email do usuário.
+
+        Retorna
+        -------
+        int
+            Quantidade de sessões encerradas.
+        '''
+        with self._trava:
+            tokens = [token for token, sessao in self._sessoes.items() if sessao.usuario.get_email() == email]
+            for token in tokens:
+                del self._sessoes[token]
+        return len(tokens)
+
+    def _limpar(self, agora: float) -> None:
+        '''
+        Remove as sessões expiradas. Deve ser chamada com a trava adquirida.
+
+        Parâmetros
+        ----------
+        agora : float
+            Instante atual (time.monotonic).
+        '''
+        expiradas = [token for token, sessao in self._sessoes.items() if agora - sessao.ultimo_acesso > self.tempo_ocioso]
+        for token in expiradas:
+            del self._sessoes[token]
+        self._ultima_limpeza = agora
+
+    def __len__(self) -> int:
+        with self._trava:
+            return len(self._sessoes)
@@ -1,18 +1,25 @@
+import configuracao
 from gerenciadorUsuario import GerenciadorUsuarios
+from sessoes import GerenciadorSessoes
 from cliente import Cliente
 from administrador import Administrador
+from dinheiro import formatar_reais, ler_centavos, para_centavos
+from transferenciasLote import transferir_em_lote
 
 class SistemaBliBank:
     def __init__(self) -> None:
         '''
-        Inicializa o sistema BliBank, criando um gerenciador de usuários e configurando a sessão atual como None.
+        Inicializa o sistema BliBank, criando um gerenciador de usuários e um gerenciador de sessões.
+
+        Um único sistema atende vários usuários ao mesmo tempo: cada login recebe um token
+        de sessão, que identifica o usuário nas operações seguintes.
         '''
         self.gerenciador = GerenciadorUsuarios()
-        self.sessao_atual = None
+        self.sessoes = GerenciadorSessoes(tempo_ocioso=configuracao.TEMPO_SESSAO)
 
-    def login(self, email: str, senha: str)-> None:
+    def login(self, email: str, senha: str) -> str:
         '''
-        Realiza o login de um usuário no sistema.
+        Realiza o login de um usuário no sistema e abre uma sessão.
 
         Parâmetros
         ----------
@@ -23,36 +30,173 @@ class SistemaBliBank:
 
         Retorna
         -------
-        Cliente ou Administrador
-            O usuário logado, ou None se o login falhar.
+        str
+            Token da sessão aberta, ou None se o login falhar.
         '''
         usuario = self.gerenciador.login(email, senha)
         if usuario:
-            self.sessao_atual = usuario
-            return usuario
+            return self.sessoes.criar(usuario)
         return None
 
-    def logout(self) -> str:
+    def usuario_da_sessao(self, token: str):
+        '''
+        Retorna o usuário de uma sessão aberta, renovando a sua validade.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário da sessão, ou None se ela não existir ou tiver expirado.
+        '''
+        return self.sessoes.obter(token)
+
+    def logout(self, token: str) -> str:
         '''
-        Realiza o logout do usuário atual.
+        Realiza o logout do usuário de uma sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
 
         Retorna
         -------
         str
             Mensagem de sucesso ou aviso se não houver usuário logado.
         '''
-        if self.sessao_atual:
-            nome_usuario = self.sessao_atual.get_nome()
-            self.sessao_atual = None
-            return f"Logout realizado com sucesso. Até logo, {nome_usuario}."
+        usuario = self.sessoes.encerrar(token)
+        if usuario:
+            self.gerenciador.logout()
+            return f"Logout realizado com sucesso. Até logo, {usuario.get_nome()}."
         return "Nenhum usuário logado atualmente."
     
-    def realizar_operacao_financeira(self, tipo: str, valor: float, email_destinatario: str = None, descricao: str = None):
+    def encerrar(self) -> None:
+        '''
+        Encerra o sistema, gravando todas as alterações pendentes.
+        '''
+        self.gerenciador.encerrar()
+
+    def registrar_compra(self, token: str, valor: float, loja: str, descricao: str) -> str:
+        '''
+        Registra uma compra no cartão de crédito do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+        valor : float
+            Valor da compra.
+        loja : str
+            Nome da loja.
+        descricao : str
+            Descrição da compra.
+
+        Retorna
+        -------
+        str
+            Mensagem indicando o resultado da compra.
+        '''
+        usuario = self.sessoes.obter(token)
+        if usuario is None:
+            return "Sessão expirada. Faça login novamente."
+        if not isinstance(usuario, Cliente):
+            return "Operação não permitida. Faça login como cliente."
+        centavos = ler_centavos(valor) if isinstance(valor, (int, float)) else None
+        if centavos is None or centavos <= 0:
+            return "Valor inválido. Por favor, insira um valor numérico positivo."
+        if usuario.cartao_credito.registrar_compra(valor, loja, descricao):
+            return f"Compra de R${formatar_reais(centavos)} aprovada na loja {loja}."
+        return "Compra não aprovada. Verifique o cartão e o limite disponível."
+
+    def pagar_fatura(self, token: str) -> str:
+        '''
+        Paga a fatura do cartão de crédito do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+
+        Retorna
+        -------
+        str
+            Mensagem indicando o resultado do pagamento.
+        '''
+        usuario = self.sessoes.obter(token)
+        if usuario is None:
+            return "Sessão expirada. Faça login novamente."
+        if not isinstance(usuario, Cliente):
+            return "Operação não permitida. Faça login como cliente."
+        if usuario.cartao_credito.pagar_fatura():
+            return f"Fatura paga com sucesso. Seu saldo atual é R${formatar_reais(usuario.get_saldo_centavos())}."
+        return "Não foi possível pagar a fatura. Verifique o saldo e se há compras registradas."
+
+    def consultar_extrato(self, token: str, inicio=None, fim=None, limite: int = 20, apos=None) -> list:
+        '''
+        Lê uma página do extrato do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+        inicio : datetime.date ou str, opcional
+            Data inicial do período (inclusive).
+        fim : datetime.date ou str, opcional
+            Data final do período (exclusive).
+        limite : int, opcional
+            Tamanho da página.
+        apos : Lancamento, opcional
+            Último lançamento da página anterior.
+
+        Retorna
+        -------
+        list of Lancamento
+            Os lançamentos da página, ou None se a sessão expirou ou não é de um cliente.
+        '''
+        usuario = self.sessoes.obter(token)
+        if not isinstance(usuario, Cliente):
+            return None
+        return self.gerenciador.lancamentos.extrato(usuario.get_email(), inicio, fim, limite, apos)
+
+    def transferir_em_lote(self, token: str, transferencias, estrito: bool = False) -> dict:
+        '''
+        Aplica várias transferências (por exemplo, uma folha de pagamento) com uma única gravação.
+
+        Um cliente só pode transferir a partir da própria conta; um administrador pode
+        informar qualquer conta de origem.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão de quem envia o lote.
+        transferencias : iterable of tuple
+            Tuplas (email_origem, email_destino, valor em reais).
+        estrito : bool, opcional
+            Se True, qualquer falha desfaz o lote inteiro.
+
+        Retorna
+        -------
+        dict
+            Resultado de transferenciasLote.transferir_em_lote, ou None se a sessão expirou.
+        '''
+        usuario = self.sessoes.obter(token)
+        if usuario is None:
+            return None
+        origem_autorizada = None if isinstance(usuario, Administrador) else usuario.get_email()
+        return transferir_em_lote(self.gerenciador, transferencias, estrito=estrito, origem_autorizada=origem_autorizada)
+
+    def realizar_operacao_financeira(self, token: str, tipo: str, valor: float, email_destinatario: str = None, descricao: str = None):
         '''
         Realiza operações financeiras como depósito, saque, transferência e investimento.
 
         Parâmetros
         ----------
+        token : str
+            Token da sessão do usuário que realiza a operação.
         tipo : str
             Tipo de operação financeira ('1' para depósito, '2' para saque, '3' para transferência, '4' para investimento).
         valor : float
@@ -67,42 +211,45 @@ class SistemaBliBank:
         str
             Mensagem indicando o resultado da operação.
         '''
-        try:
-            valor = float(valor)
-        except ValueError:
+        if ler_centavos(valor) is None:
             return "Valor inválido. Por favor, insira um número."
+        valor = float(valor)
+
+        usuario = self.sessoes.obter(token)
+        if usuario is None:
+            return "Sessão expirada. Faça login novamente."
 
-        if isinstance(self.sessao_atual, Cliente):
+        if isinstance(usuario, Cliente):
             operacoes = {
-                '1': self.sessao_atual.gestao_conta.depositar,
-                '2': self.sessao_atual.gestao_conta.sacar,
-                '3': lambda v: self.sessao_atual.gestao_conta.transferir(v, email_destinatario),
-                '4': lambda v: self.sessao_atual.investimentos.investir(v, descricao)
+                '1': usuario.gestao_conta.depositar,
+                '2': usuario.gestao_conta.sacar,
+                '3': lambda v: usuario.gestao_conta.transferir(v, email_destinatario),
+                '4': lambda v: usuario.investimentos.investir(v, descricao)
             }
 
             operacao = operacoes.get(tipo)
             if operacao:
                 if tipo == '3':
-                    destinatario = next((usuario for usuario in self.gerenciador.usuarios if usuario.get_email() == email_destinatario), None)
+                    destinatario = self.gerenciador.buscar_por_email(email_destinatario)
                     if destinatario:
                         if isinstance(destinatario, Administrador):
                             return "Não é possível realizar transferências para administradores."
                         operacao(valor)
-                        saldo_atual = round(self.sessao_atual.get_saldo(), 2)
-                        return f"Transferência de R${round(valor, 2)} realizada com sucesso. Seu saldo atual é R${saldo_atual}."
+                        saldo_atual = formatar_reais(usuario.get_saldo_centavos())
+                        return f"Transferência de R${formatar_reais(para_centavos(valor))} realizada com sucesso. Seu saldo atual é R${saldo_atual}."
                     else:
                         return "UsuarioNaoEncontrado"
                 elif tipo == '4':
                     try:
                         rendimento_percentual, rendimento_valor, valor_final = operacao(valor)
-                        saldo_atual = round(self.sessao_atual.get_saldo(), 2)
-                        return f"Investimento de R${round(valor, 2)} realizado com sucesso com rendimento de {round(rendimento_percentual, 2)}%. Valor após rendimento: R${round(valor_final, 2)}. Seu saldo atual é R${saldo_atual}."
+                        saldo_atual = formatar_reais(usuario.get_saldo_centavos())
+                        return f"Investimento de R${formatar_reais(para_centavos(valor))} realizado com sucesso com rendimento de {rendimento_percentual:.2f}%. Valor após rendimento: R${formatar_reais(para_centavos(valor_final))}. Seu saldo atual é R${saldo_atual}."
                     except ValueError as ve:
                         return str(ve)
                 else:
                     operacao(valor)
-                    saldo_atual = round(self.sessao_atual.get_saldo(), 2)
-                    return f"{'Depósito' if tipo == '1' else 'Saque'} de R${round(valor, 2)} realizado com sucesso. Seu saldo atual é R${saldo_atual}."
+                    saldo_atual = formatar_reais(usuario.get_saldo_centavos())
+                    return f"{'Depósito' if tipo == '1' else 'Saque'} de R${formatar_reais(para_centavos(valor))} realizado com sucesso. Seu saldo atual é R${saldo_atual}."
             else:
                 return "Operação inválida."
         else:
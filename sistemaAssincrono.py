@@ -0,0 +1,219 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import configuracao
+from sistema import SistemaBliBank
+
+
+class SistemaBliBankAssincrono:
+    def __init__(self, sistema: SistemaBliBank = None, trabalhadores: int = None) -> None:
+        '''
+        Inicializa a interface assíncrona do sistema BliBank.
+
+        As operações com acesso a disco (leitura de usuários, gravação das contas e das
+        faturas) rodam em um conjunto de threads, e as corrotinas apenas aguardam o
+        resultado. Assim, um único laço de eventos (por exemplo, o do flet em modo
+        assíncrono) atende vários usuários sem ficar parado durante a gravação. As
+        operações continuam seguras entre threads graças às travas por conta.
+
+        Parâmetros
+        ----------
+        sistema : SistemaBliBank, opcional
+            Sistema a ser usado; se não for informado, um novo é criado.
+        trabalhadores : int, opcional
+            Quantidade de threads de E/S (padrão: configuracao.TRABALHADORES_IO).
+        '''
+        self.sistema = sistema or SistemaBliBank()
+        self._executor = ThreadPoolExecutor(
+            max_workers=trabalhadores or configuracao.TRABALHADORES_IO,
+            thread_name_prefix='blibank-io'
+        )
+
+    async def _executar(self, funcao, *args, **kwargs):
+        '''
+        Executa uma função bloqueante no conjunto de threads e aguarda o resultado.
+
+        Parâmetros
+        ----------
+        funcao : callable
+            Função a ser executada.
+        *args, **kwargs
+            Argumentos da função.
+
+        Retorna
+        -------
+        object
+            O retorno da função.
+        '''
+        laco = asyncio.get_running_loop()
+        return await laco.run_in_executor(self._executor, functools.partial(funcao, *args, **kwargs))
+
+    async def login(self, email: str, senha: str) -> str:
+        '''
+        Realiza o login de um usuário e abre uma sessão.
+
+        Parâmetros
+        ----------
+        email : str
+            Email do usuário.
+        senha : str
+            Senha do usuário.
+
+        Retorna
+        -------
+        str
+            Token da sessão aberta, ou None se o login falhar.
+        '''
+        return await self._executar(self.sistema.login, email, senha)
+
+    def usuario_da_sessao(self, token: str):
+        '''
+        Retorna o usuário de uma sessão aberta. A consulta é feita em memória e não
+        precisa ser aguardada.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
+
+        Retorna
+        -------
+        Cliente ou Administrador
+            O usuário da sessão, ou None se ela não existir ou tiver expirado.
+        '''
+        return self.sistema.usuario_da_sessao(token)
+
+    async def logout(self, token: str) -> str:
+        '''
+        Realiza o logout do usuário de uma sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão.
+
+        Retorna
+        -------
+        str
+            Mensagem de sucesso ou aviso se não houver usuário logado.
+        '''
+        return await self._executar(self.sistema.logout, token)
+
+    async def realizar_operacao_financeira(self, token: str, tipo: str, valor: float, email_destinatario: str = None, descricao: str = None) -> str:
+        '''
+        Realiza depósito, saque, transferência ou investimento.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do usuário que realiza a operação.
+        tipo : str
+            Tipo de operação financeira ('1' depósito, '2' saque, '3' transferência, '4' investimento).
+        valor : float
+            Valor da operação.
+        email_destinatario : str, opcional
+            Email do destinatário da transferência.
+        descricao : str, opcional
+            Tipo do investimento.
+
+        Retorna
+        -------
+        str
+            Mensagem indicando o resultado da operação.
+        '''
+        return await self._executar(
+            self.sistema.realizar_operacao_financeira, token, tipo, valor, email_destinatario, descricao
+        )
+
+    async def registrar_compra(self, token: str, valor: float, loja: str, descricao: str) -> str:
+        '''
+        Registra uma compra no cartão de crédito do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+        valor : float
+            Valor da compra.
+        loja : str
+            Nome da loja.
+        descricao : str
+            Descrição da compra.
+
+        Retorna
+        -------
+        str
+            Mensagem indicando o resultado da compra.
+        '''
+        return await self._executar(self.sistema.registrar_compra, token, valor, loja, descricao)
+
+    async def pagar_fatura(self, token: str) -> str:
+        '''
+        Paga a fatura do cartão de crédito do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+
+        Retorna
+        -------
+        str
+            Mensagem indicando o resultado do pagamento.
+        '''
+        return await self._executar(self.sistema.pagar_fatura, token)
+
+    async def consultar_extrato(self, token: str, inicio=None, fim=None, limite: int = 20, apos=None) -> list:
+        '''
+        Lê uma página do extrato do cliente da sessão.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão do cliente.
+        inicio : datetime.date ou str, opcional
+            Data inicial do período (inclusive).
+        fim : datetime.date ou str, opcional
+            Data final do período (exclusive).
+        limite : int, opcional
+            Tamanho da página.
+        apos : Lancamento, opcional
+            Último lançamento da página anterior.
+
+        Retorna
+        -------
+        list of Lancamento
+            Os lançamentos da página, ou None se a sessão expirou ou não é de um cliente.
+        '''
+        return await self._executar(self.sistema.consultar_extrato, token, inicio, fim, limite, apos)
+
+    async def transferir_em_lote(self, token: str, transferencias, estrito: bool = False) -> dict:
+        '''
+        Aplica várias transferências com uma única gravação.
+
+        Parâmetros
+        ----------
+        token : str
+            Token da sessão de quem envia o lote.
+        transferencias : iterable of tuple
+            Tuplas (email_origem, email_destino, valor em reais).
+        estrito : bool, opcional
+            Se True, qualquer falha desfaz o lote inteiro.
+
+        Retorna
+        -------
+        dict
+            Resultado do lote, ou None se a sessão expirou.
+        '''
+        return await self._executar(self.sistema.transferir_em_lote, token, transferencias, estrito)
+
+    async def encerrar(self) -> None:
+        '''
+        Encerra o sistema, aguardando as operações em andamento e gravando as alterações pendentes.
+        '''
+        def encerrar():
+            self._executor.shutdown(wait=True)
+            self.sistema.encerrar()
+
+        await asyncio.get_running_loop().run_in_executor(None, encerrar)
@@ -0,0 +1,612 @@
+'''
+Snapshot binário dos usuários, gravado ao lado do CSV na compactação.
+
+O arquivo é colunar: os valores em centavos ficam em colunas de inteiros de 64 bits,
+o tipo, a situação do cartão e o pedido de encerramento em colunas de um byte, e os
+textos (nomes, emails, senhas e CPFs) em uma tabela de textos por coluna, com as
+posições de cada linha. Tabelas de espalhamento já montadas levam do email e do CPF à
+linha. O arquivo é mapeado em memória (mmap) e lido sob demanda: abrir o snapshot não
+depende da quantidade de usuários.
+
+Layout (little-endian, seções alinhadas em 8 bytes): cabeçalho (MAGICA, quantidade de
+usuários, posições de cada tabela de espalhamento, tamanho e data de modificação do
+CSV de origem), a posição de cada seção de SECOES e as seções.
+'''
+import os
+import re
+import sys
+import mmap
+import zlib
+import struct
+import threading
+from array import array
+from itertools import accumulate
+from collections.abc import MutableMapping, ItemsView
+
+from dinheiro import formatar_decimal, para_centavos
+
+MAGICA = b'BLIBSNP1'
+COLUNAS_VALORES = ('saldo', 'limite_cartao', 'divida_cartao', 'limite_requerido')
+COLUNAS_CODIGOS = ('tipo', 'status_cartao', 'solicitar_encerramento')
+COLUNAS_TEXTO = ('nome', 'sobrenome', 'email', 'senha', 'cpf', 'cpf_normalizado')
+SECOES = (
+    COLUNAS_VALORES + COLUNAS_CODIGOS
+    + tuple(f"{coluna}_posicoes" for coluna in COLUNAS_TEXTO)
+    + tuple(f"{coluna}_dados" for coluna in COLUNAS_TEXTO)
+    + ('indice_email', 'indice_cpf')
+)
+TIPOS = ('admin', 'cliente')
+STATUS = ('', 'nenhum', 'pendente', 'aprovado')
+LINHAS_POR_BLOCO = 65536
+
+_CABECALHO = struct.Struct(f'<8sqqqq{len(SECOES)}q')
+_VAZIO = -1
+_NAO_DIGITOS_OU_NULO = re.compile(r'[^\d\x00]')
+_PONTUACAO_CPF = {ord(caractere): None for caractere in '.- '}
+
+
+def _alinhar(posicao: int) -> int:
+    return (posicao + 7) & ~7
+
+
+def _para_bytes(valores: array) -> bytes:
+    '''
+    Converte um array para bytes little-endian.
+    '''
+    if sys.byteorder == 'big':
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    return valores.tobytes()
+
+
+def _centavos(valores: list) -> array:
+    '''
+    Converte uma coluna de valores em reais para centavos.
+
+    Cada valor distinto é convertido uma única vez (limites e dívidas se repetem entre
+    muitas contas).
+    '''
+    convertidos = {valor: para_centavos(valor or 0) for valor in dict.fromkeys(valores)}
+    return array('q', map(convertidos.__getitem__, valores))
+
+
+def _espalhamento(chaves: list) -> array:
+    '''
+    Monta uma tabela de espalhamento (endereçamento aberto, sondagem linear) das chaves.
+
+    Parâmetros
+    ----------
+    chaves : list of bytes
+        Chave de cada linha, na ordem das linhas.
+
+    Retorna
+    -------
+    array
+        Posições da tabela (potência de 2, ao menos o dobro das chaves) com a linha de
+        cada chave, ou -1 nas posições vazias.
+    '''
+    posicoes = 2
+    while posicoes < 2 * len(chaves):
+        posicoes *= 2
+    tabela = array('i', [_VAZIO]) * posicoes
+    mascara = posicoes - 1
+    crc32 = zlib.crc32
+    for linha, chave in enumerate(chaves):
+        posicao = crc32(chave) & mascara
+        while tabela[posicao] != _VAZIO:
+            posicao = (posicao + 1) & mascara
+        tabela[posicao] = linha
+    return tabela
+
+
+class ColunasSnapshot:
+    def __init__(self) -> None:
+        '''
+        Acumula os registros dos usuários em colunas, para gravá-los como snapshot.
+
+        Os campos são apenas guardados em adicionar(); as conversões são feitas por
+        coluna inteira em gravar().
+        '''
+        self.valores = {coluna: [] for coluna in COLUNAS_VALORES}
+        self.codigos = {coluna: bytearray() for coluna in COLUNAS_CODIGOS}
+        self.textos = {coluna: [] for coluna in COLUNAS_TEXTO[:-1]}
+
+    def __len__(self) -> int:
+        return len(self.codigos['tipo'])
+
+    def adicionar(self, registro: dict) -> None:
+        '''
+        Acrescenta um usuário no formato de to_dict().
+
+        Parâmetros
+        ----------
+        registro : dict
+            Registro do usuário.
+
+        Raises
+        ------
+        ValueError
+            Se o tipo ou a situação do cartão forem desconhecidos.
+        '''
+        tipo = str(registro['tipo']).strip().lower()
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de usuário desconhecido: {tipo}")
+        for coluna, textos in self.textos.items():
+            textos.append(registro[coluna])
+        cliente = tipo == 'cliente'
+        for coluna, valores in self.valores.items():
+            valores.append(registro.get(coluna) if cliente else '0.00')
+        status = (registro.get('status_cartao') or '') if cliente else ''
+        if status not in STATUS:
+            raise ValueError(f"Situação do cartão desconhecida: {status}")
+        encerramento = registro.get('solicitar_encerramento')
+        if isinstance(encerramento, str):
+            encerramento = encerramento.strip().lower() == 'true'
+        self.codigos['tipo'].append(TIPOS.index(tipo))
+        self.codigos['status_cartao'].append(STATUS.index(status))
+        self.codigos['solicitar_encerramento'].append(1 if cliente and encerramento else 0)
+
+    def _tabela_textos(self, coluna: str) -> tuple:
+        '''
+        Monta a tabela de textos de uma coluna.
+
+        Retorna
+        -------
+        tuple
+            (posicoes, dados, chaves): as posições de cada linha nos dados, os textos
+            em UTF-8 terminados pelo caractere nulo e o texto de cada linha em bytes.
+
+        Raises
+        ------
+        ValueError
+            Se um texto tiver o caractere nulo.
+        '''
+        if coluna == 'cpf_normalizado':
+            # Mesma normalização de normalizar_cpf, aplicada à coluna inteira de uma vez;
+            # a expressão regular só é usada se sobrar algo além de dígitos sem a pontuação.
+            cpfs = self._juntar('cpf').translate(_PONTUACAO_CPF)
+            if not cpfs.replace('\x00', '').isdecimal():
+                cpfs = _NAO_DIGITOS_OU_NULO.sub('', cpfs)
+            cpfs = cpfs.split('\x00')
+            texto = '\x00'.join(cpf.zfill(11) for cpf in cpfs)
+        else:
+            texto = self._juntar(coluna)
+            if coluna == 'email':
+                texto = texto.lower()
+        dados = texto.encode('utf-8') + b'\x00'
+        chaves = dados.split(b'\x00')[:-1] if len(self) else []
+        posicoes = array('q', accumulate((len(chave) + 1 for chave in chaves), initial=0))
+        return posicoes, (dados if chaves else b''), chaves
+
+    def _juntar(self, coluna: str) -> str:
+        textos = [str(texto).strip() for texto in self.textos[coluna]]
+        texto = '\x00'.join(textos)
+        if texto.count('\x00') != max(len(textos) - 1, 0):
+            raise ValueError(f"Caractere inválido na coluna {coluna}.")
+        return texto
+
+    def gravar(self, nome_arquivo: str, nome_csv: str) -> None:
+        '''
+        Grava o snapshot em um arquivo (que deve ser renomeado para o destino depois).
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Arquivo a ser criado.
+        nome_csv : str
+            CSV correspondente, já gravado; seu tamanho e data de modificação são
+            conferidos na abertura.
+
+        Raises
+        ------
+        ValueError
+            Se um valor ou texto não puder ser gravado.
+        '''
+        secoes = {coluna: _para_bytes(_centavos(valores)) for coluna, valores in self.valores.items()}
+        secoes.update((coluna, bytes(codigos)) for coluna, codigos in self.codigos.items())
+        for coluna in COLUNAS_TEXTO:
+            posicoes, secoes[f"{coluna}_dados"], chaves = self._tabela_textos(coluna)
+            secoes[f"{coluna}_posicoes"] = _para_bytes(posicoes)
+            if coluna == 'email':
+                indice_email = _espalhamento(chaves)
+            elif coluna == 'cpf_normalizado':
+                secoes['indice_cpf'] = _para_bytes(_espalhamento(chaves))
+        secoes['indice_email'] = _para_bytes(indice_email)
+
+        inicios = []
+        posicao = _alinhar(_CABECALHO.size)
+        for secao in SECOES:
+            inicios.append(posicao)
+            posicao = _alinhar(posicao + len(secoes[secao]))
+        with open(nome_arquivo, 'wb') as arquivo:
+            estado_csv = os.stat(nome_csv)
+            arquivo.write(_CABECALHO.pack(
+                MAGICA, len(self), len(indice_email), estado_csv.st_size, estado_csv.st_mtime_ns, *inicios
+            ))
+            for secao, inicio in zip(SECOES, inicios):
+                arquivo.write(b'\x00' * (inicio - arquivo.tell()))
+                arquivo.write(secoes[secao])
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+
+def snapshot_valido(nome_snapshot: str, nome_csv: str) -> bool:
+    '''
+    Indica se o snapshot pode substituir a leitura do CSV.
+
+    O snapshot vale se não for mais antigo que o CSV e se foi gravado para o CSV atual
+    (mesmo tamanho e data de modificação): uma edição do CSV fora do sistema, ou uma
+    compactação interrompida entre a gravação do CSV e a do snapshot, o invalida.
+
+    Parâmetros
+    ----------
+    nome_snapshot : str
+        Arquivo do snapshot.
+    nome_csv : str
+        Arquivo CSV de usuários.
+
+    Retorna
+    -------
+    bool
+        True se o snapshot pode ser usado.
+    '''
+    try:
+        estado_snapshot, estado_csv = os.stat(nome_snapshot), os.stat(nome_csv)
+        with open(nome_snapshot, 'rb') as arquivo:
+            cabecalho = arquivo.read(_CABECALHO.size)
+    except OSError:
+        return False
+    if len(cabecalho) < _CABECALHO.size:
+        return False
+    magica, _, _, tamanho_csv, modificacao_csv, *_ = _CABECALHO.unpack(cabecalho)
+    return (magica == MAGICA and (tamanho_csv, modificacao_csv) == (estado_csv.st_size, estado_csv.st_mtime_ns)
+            and estado_snapshot.st_mtime_ns >= estado_csv.st_mtime_ns)
+
+
+def _montar_registro(nome, sobrenome, email, senha, cpf, saldo, limite, divida, requerido, tipo, status, encerramento):
+    '''
+    Monta o registro de uma linha do snapshot no formato da leitura do CSV: valores em
+    reais ("1234.56", formatados a partir dos centavos) para os clientes e campos
+    vazios para os administradores.
+    '''
+    if tipo:
+        return {
+            'nome': nome, 'sobrenome': sobrenome, 'email': email, 'senha': senha, 'cpf': cpf,
+            'tipo': 'cliente', 'saldo': formatar_decimal(saldo), 'status_cartao': STATUS[status],
+            'limite_cartao': formatar_decimal(limite), 'divida_cartao': formatar_decimal(divida),
+            'limite_requerido': formatar_decimal(requerido), 'solicitar_encerramento': encerramento == 1
+        }
+    return {
+        'nome': nome, 'sobrenome': sobrenome, 'email': email, 'senha': senha, 'cpf': cpf,
+        'tipo': 'admin', 'saldo': '', 'status_cartao': '', 'limite_cartao': '',
+        'divida_cartao': '', 'limite_requerido': '', 'solicitar_encerramento': ''
+    }
+
+
+class SnapshotUsuarios:
+    def __init__(self, nome_arquivo: str) -> None:
+        '''
+        Abre um snapshot de usuários mapeando o arquivo em memória.
+
+        Parâmetros
+        ----------
+        nome_arquivo : str
+            Arquivo do snapshot.
+
+        Raises
+        ------
+        ValueError
+            Se o arquivo não for um snapshot válido.
+        '''
+        self.nome_arquivo = nome_arquivo
+        self._trava = threading.RLock()
+        self._arquivo = None
+        self._mapa = None
+        self._abrir()
+
+    def _abrir(self) -> None:
+        '''
+        Mapeia o arquivo e lê o cabeçalho.
+        '''
+        arquivo = open(self.nome_arquivo, 'rb')
+        try:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            arquivo.close()
+            raise ValueError(f"Snapshot vazio: {self.nome_arquivo}") from None
+        if len(mapa) < _CABECALHO.size or mapa[:len(MAGICA)] != MAGICA:
+            mapa.close()
+            arquivo.close()
+            raise ValueError(f"Arquivo não é um snapshot de usuários: {self.nome_arquivo}")
+        _, self.quantidade, self._posicoes_indice, _, _, *inicios = _CABECALHO.unpack_from(mapa)
+        self._inicios = dict(zip(SECOES, inicios))
+        self._arquivo, self._mapa = arquivo, mapa
+
+    def fechar(self) -> None:
+        '''
+        Desfaz o mapeamento e fecha o arquivo.
+        '''
+        with self._trava:
+            if self._mapa is not None:
+                self._mapa.close()
+                self._arquivo.close()
+                self._mapa = self._arquivo = None
+
+    def substituir(self, nome_temporario: str) -> None:
+        '''
+        Troca o snapshot pelo arquivo recém-gravado e o mapeia no lugar do atual.
+
+        O mapeamento atual é desfeito antes da troca (exigência do Windows para
+        substituir um arquivo mapeado).
+
+        Parâmetros
+        ----------
+        nome_temporario : str
+            Snapshot gravado por ColunasSnapshot.gravar.
+        '''
+        with self._trava:
+            self.fechar()
+            os.replace(nome_temporario, self.nome_arquivo)
+            self._abrir()
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def _texto(self, coluna: str, linha: int) -> bytes:
+        inicio, fim = struct.unpack_from('<2q', self._mapa, self._inicios[f"{coluna}_posicoes"] + 8 * linha)
+        dados = self._inicios[f"{coluna}_dados"]
+        return self._mapa[dados + inicio:dados + fim - 1]
+
+    def texto(self, coluna: str, linha: int) -> str:
+        '''
+        Lê um texto de uma linha.
+
+        Parâmetros
+        ----------
+        coluna : str
+            Coluna de COLUNAS_TEXTO.
+        linha : int
+            Linha do usuário.
+
+        Retorna
+        -------
+        str
+            O texto.
+        '''
+        with self._trava:
+            return self._texto(coluna, linha).decode('utf-8')
+
+    def textos(self, coluna: str, inicio: int, fim: int) -> list:
+        '''
+        Lê um texto de várias linhas consecutivas de uma só vez.
+
+        Parâmetros
+        ----------
+        coluna : str
+            Coluna de COLUNAS_TEXTO.
+        inicio, fim : int
+            Intervalo de linhas [inicio, fim).
+
+        Retorna
+        -------
+        list of str
+            Os textos, na ordem das linhas.
+        '''
+        if fim <= inicio:
+            return []
+        with self._trava:
+            posicoes = self._inicios[f"{coluna}_posicoes"]
+            primeiro, = struct.unpack_from('<q', self._mapa, posicoes + 8 * inicio)
+            ultimo, = struct.unpack_from('<q', self._mapa, posicoes + 8 * fim)
+            dados = self._inicios[f"{coluna}_dados"]
+            bloco = self._mapa[dados + primeiro:dados + ultimo - 1]
+        return bloco.decode('utf-8').split('\x00')
+
+    def codigos(self, coluna: str, inicio: int, fim: int) -> bytes:
+        '''
+        Lê uma coluna de um byte (COLUNAS_CODIGOS) de várias linhas consecutivas.
+        '''
+        with self._trava:
+            posicao = self._inicios[coluna]
+            return self._mapa[posicao + inicio:posicao + fim]
+
+    def valores(self, coluna: str, inicio: int, fim: int) -> array:
+        '''
+        Lê uma coluna de valores em centavos (COLUNAS_VALORES) de várias linhas consecutivas.
+        '''
+        valores = array('q')
+        with self._trava:
+            posicao = self._inicios[coluna]
+            valores.frombytes(self._mapa[posicao + 8 * inicio:posicao + 8 * fim])
+        if sys.byteorder == 'big':
+            valores.byteswap()
+        return valores
+
+    def tipo(self, linha: int) -> str:
+        '''
+        Retorna o tipo ('cliente' ou 'admin') de uma linha.
+        '''
+        with self._trava:
+            return TIPOS[self._mapa[self._inicios['tipo'] + linha]]
+
+    def buscar(self, coluna: str, chave: str) -> int:
+        '''
+        Busca a linha de um usuário pela tabela de espalhamento do email ou do CPF.
+
+        Parâmetros
+        ----------
+        coluna : str
+            'email' (email normalizado) ou 'cpf_normalizado'.
+        chave : str
+            Valor procurado.
+
+        Retorna
+        -------
+        int
+            A linha do usuário, ou None se a chave não estiver no snapshot.
+        '''
+        dados = chave.encode('utf-8')
+        indice = 'indice_email' if coluna == 'email' else 'indice_cpf'
+        mascara = self._posicoes_indice - 1
+        posicao = zlib.crc32(dados) & mascara
+        with self._trava:
+            inicio = self._inicios[indice]
+            while True:
+                linha, = struct.unpack_from('<i', self._mapa, inicio + 4 * posicao)
+                if linha == _VAZIO:
+                    return None
+                if self._texto(coluna, linha) == dados:
+                    return linha
+                posicao = (posicao + 1) & mascara
+
+    def registro(self, linha: int) -> dict:
+        '''
+        Monta o registro de uma linha, no mesmo formato da leitura do CSV.
+
+        Parâmetros
+        ----------
+        linha : int
+            Linha do usuário.
+
+        Retorna
+        -------
+        dict
+            Registro do usuário; os valores dos clientes em reais ("1234.56").
+        '''
+        with self._trava:
+            textos = [self._texto(coluna, linha).decode('utf-8') for coluna in COLUNAS_TEXTO[:-1]]
+            valores = [struct.unpack_from('<q', self._mapa, self._inicios[coluna] + 8 * linha)[0]
+                       for coluna in COLUNAS_VALORES]
+            codigos = [self._mapa[self._inicios[coluna] + linha] for coluna in COLUNAS_CODIGOS]
+        return _montar_registro(*textos, *valores, *codigos)
+
+    def registros(self, inicio: int = 0, fim: int = None):
+        '''
+        Percorre os registros das linhas, lendo as colunas em blocos de LINHAS_POR_BLOCO.
+
+        Parâmetros
+        ----------
+        inicio, fim : int, opcional
+            Intervalo de linhas [inicio, fim). Padrão: todas.
+
+        Retorna
+        -------
+        generator of dict
+            Registros no mesmo formato da leitura do CSV.
+        '''
+        fim = self.quantidade if fim is None else fim
+        for bloco in range(inicio, fim, LINHAS_POR_BLOCO):
+            ate = min(bloco + LINHAS_POR_BLOCO, fim)
+            textos = [self.textos(coluna, bloco, ate) for coluna in COLUNAS_TEXTO[:-1]]
+            valores = [self.valores(coluna, bloco, ate) for coluna in COLUNAS_VALORES]
+            codigos = [self.codigos(coluna, bloco, ate) for coluna in COLUNAS_CODIGOS]
+            for campos in zip(*textos, *valores, *codigos):
+                yield _montar_registro(*campos)
+
+
+_AUSENTE = object()
+_REMOVIDO = object()
+
+
+class IndiceSnapshot(MutableMapping):
+    def __init__(self, snapshot: SnapshotUsuarios, chave: str) -> None:
+        '''
+        Índice do gerenciador (como um dict) servido pela tabela de espalhamento do snapshot.
+
+        As chaves e valores do snapshot são lidos do arquivo mapeado a cada consulta; as
+        alterações feitas depois da abertura ficam em um dict em memória, consultado
+        antes do snapshot. Se o snapshot for regravado (compactação), as alterações
+        continuam valendo sobre o novo arquivo.
+
+        Parâmetros
+        ----------
+        snapshot : SnapshotUsuarios
+            Snapshot aberto.
+        chave : str
+            'email' (email -> tipo, como indice_email) ou 'cpf' (CPF normalizado ->
+            email, como indice_cpf).
+        '''
+        self._snapshot = snapshot
+        self._coluna = 'email' if chave == 'email' else 'cpf_normalizado'
+        self._alterados = {}
+        self._tamanho = len(snapshot)
+        self._trava = threading.Lock()
+
+    def _do_snapshot(self, chave):
+        linha = self._snapshot.buscar(self._coluna, chave) if isinstance(chave, str) else None
+        if linha is None:
+            return _AUSENTE
+        if self._coluna == 'email':
+            return self._snapshot.tipo(linha)
+        return self._snapshot.texto('email', linha)
+
+    def get(self, chave, padrao=None):
+        valor = self._alterados.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = self._do_snapshot(chave)
+        return padrao if valor is _AUSENTE or valor is _REMOVIDO else valor
+
+    def __getitem__(self, chave):
+        valor = self.get(chave, _AUSENTE)
+        if valor is _AUSENTE:
+            raise KeyError(chave)
+        return valor
+
+    def __contains__(self, chave) -> bool:
+        return self.get(chave, _AUSENTE) is not _AUSENTE
+
+    def __setitem__(self, chave, valor) -> None:
+        with self._trava:
+            if chave not in self:
+                self._tamanho += 1
+            self._alterados[chave] = valor
+
+    def __delitem__(self, chave) -> None:
+        with self._trava:
+            if chave not in self:
+                raise KeyError(chave)
+            self._tamanho -= 1
+            if self._do_snapshot(chave) is _AUSENTE:
+                del self._alterados[chave]
+            else:
+                self._alterados[chave] = _REMOVIDO
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+    def __iter__(self):
+        return (chave for chave, _ in self._itens())
+
+    def items(self):
+        return _ItensIndice(self)
+
+    def _itens(self):
+        '''
+        Percorre os pares (chave, valor): primeiro os do snapshot, na ordem das linhas,
+        depois os incluídos após a abertura.
+        '''
+        snapshot, alterados = self._snapshot, self._alterados
+        for bloco in range(0, len(snapshot), LINHAS_POR_BLOCO):
+            ate = min(bloco + LINHAS_POR_BLOCO, len(snapshot))
+            chaves = snapshot.textos(self._coluna, bloco, ate)
+            if self._coluna == 'email':
+                valores = [TIPOS[codigo] for codigo in snapshot.codigos('tipo', bloco, ate)]
+            else:
+                valores = snapshot.textos('email', bloco, ate)
+            if not alterados:
+                yield from zip(chaves, valores)
+                continue
+            for chave, valor in zip(chaves, valores):
+                alterado = alterados.get(chave, _AUSENTE)
+                if alterado is _AUSENTE:
+                    yield chave, valor
+                elif alterado is not _REMOVIDO:
+                    yield chave, alterado
+        for chave, valor in list(alterados.items()):
+            if valor is not _REMOVIDO and snapshot.buscar(self._coluna, chave) is None:
+                yield chave, valor
+
+
+class _ItensIndice(ItemsView):
+    def __iter__(self):
+        return self._mapping._itens()
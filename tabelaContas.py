@@ -0,0 +1,234 @@
+from array import array
+import threading
+
+
+def importar_numpy():
+    '''
+    Importa o NumPy se ele estiver instalado.
+
+    Retorna
+    -------
+    module
+        O módulo numpy, ou None se ele não estiver disponível.
+    '''
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class TabelaContas:
+    COLUNAS = ('saldo', 'limite_cartao', 'divida_cartao', 'limite_requerido')
+
+    def __init__(self, capacidade: int = 1024) -> None:
+        '''
+        Inicializa a tabela colunar com os valores monetários das contas, em centavos.
+
+        Cada coluna é um vetor contíguo de inteiros de 64 bits (NumPy, se instalado;
+        senão array.array) e cada conta ocupa uma linha, identificada pelo seu id. Linhas de contas liberadas
+        são zeradas e reaproveitadas. As escritas usam a mesma trava que o crescimento das
+        colunas, de modo que nenhuma é feita em uma coluna que está sendo substituída.
+
+        Parâmetros
+        ----------
+        capacidade : int, opcional
+            Quantidade inicial de linhas reservadas.
+        '''
+        self._np = importar_numpy()
+        self._capacidade = max(int(capacidade), 1)
+        self._tamanho = 0
+        self._livres = []
+        self._trava = threading.Lock()
+        self.colunas = {nome: self._criar_coluna(self._capacidade) for nome in self.COLUNAS}
+
+    def _criar_coluna(self, capacidade: int):
+        '''
+        Cria uma coluna zerada.
+
+        Parâmetros
+        ----------
+        capacidade : int
+            Quantidade de linhas.
+
+        Retorna
+        -------
+        numpy.ndarray ou array.array
+            A coluna criada.
+        '''
+        if self._np is not None:
+            return self._np.zeros(capacidade, dtype=self._np.int64)
+        return array('q', bytes(8 * capacidade))
+
+    def _crescer(self) -> None:
+        '''
+        Dobra a capacidade de todas as colunas, preservando os valores.
+        '''
+        nova_capacidade = self._capacidade * 2
+        for nome, coluna in self.colunas.items():
+            nova = self._criar_coluna(nova_capacidade)
+            nova[:self._capacidade] = coluna
+            self.colunas[nome] = nova
+        self._capacidade = nova_capacidade
+
+    def alocar(self, **valores) -> int:
+        '''
+        Reserva uma linha para uma conta.
+
+        Parâmetros
+        ----------
+        **valores : int
+            Valores iniciais das colunas em centavos (saldo, limite_cartao, divida_cartao,
+            limite_requerido).
+
+        Retorna
+        -------
+        int
+            Id da linha reservada.
+        '''
+        with self._trava:
+            if self._livres:
+                id_conta = self._livres.pop()
+            else:
+                if self._tamanho == self._capacidade:
+                    self._crescer()
+                id_conta = self._tamanho
+                self._tamanho += 1
+            for nome, valor in valores.items():
+                self.colunas[nome][id_conta] = valor
+        return id_conta
+
+    def liberar(self, id_conta: int) -> None:
+        '''
+        Zera a linha de uma conta e a deixa disponível para reaproveitamento.
+
+        Parâmetros
+        ----------
+        id_conta : int
+            Id da linha.
+        '''
+        with self._trava:
+            for coluna in self.colunas.values():
+                coluna[id_conta] = 0
+            self._livres.append(id_conta)
+
+    def obter(self, id_conta: int, nome: str) -> int:
+        '''
+        Lê um valor da tabela, em centavos.
+
+        Parâmetros
+        ----------
+        id_conta : int
+            Id da linha.
+        nome : str
+            Nome da coluna.
+
+        Retorna
+        -------
+        int
+            O valor armazenado.
+        '''
+        return int(self.colunas[nome][id_conta])
+
+    def definir(self, id_conta: int, nome: str, valor: int) -> None:
+        '''
+        Altera um valor da tabela, em centavos.
+
+        Parâmetros
+        ----------
+        id_conta : int
+            Id da linha.
+        nome : str
+            Nome da coluna.
+        valor : int
+            Novo valor.
+        '''
+        with self._trava:
+            self.colunas[nome][id_conta] = valor
+
+    def coluna(self, nome: str):
+        '''
+        Retorna as linhas em uso de uma coluna, sem cópia.
+
+        A visão deixa de refletir a tabela se ela crescer; obtenha uma nova após
+        reservar linhas. Linhas liberadas valem zero.
+
+        Parâmetros
+        ----------
+        nome : str
+            Nome da coluna.
+
+        Retorna
+        -------
+        numpy.ndarray ou memoryview
+            Visão das linhas em uso.
+        '''
+        coluna = self.colunas[nome]
+        if self._np is not None:
+            return coluna[:self._tamanho]
+        return memoryview(coluna)[:self._tamanho]
+
+    def total(self, nome: str) -> int:
+        '''
+        Soma uma coluna de todas as contas.
+
+        Parâmetros
+        ----------
+        nome : str
+            Nome da coluna.
+
+        Retorna
+        -------
+        int
+            A soma da coluna, em centavos.
+        '''
+        coluna = self.coluna(nome)
+        if self._np is not None:
+            return int(coluna.sum())
+        return sum(coluna)
+
+    def somar(self, nome: str, ids, valores) -> None:
+        '''
+        Soma valores a várias linhas de uma coluna em uma única operação.
+
+        Parâmetros
+        ----------
+        nome : str
+            Nome da coluna.
+        ids : sequence of int
+            Ids das linhas; um id repetido recebe a soma de todos os seus valores.
+        valores : sequence of int ou int
+            Valor de cada linha em centavos, ou um único valor para todas.
+        '''
+        if self._np is not None:
+            ids = self._np.asarray(ids, dtype=self._np.intp)
+            with self._trava:
+                self._np.add.at(self.colunas[nome], ids, valores)
+            return
+        if isinstance(valores, int):
+            valores = [valores] * len(ids)
+        with self._trava:
+            coluna = self.colunas[nome]
+            for id_conta, valor in zip(ids, valores):
+                coluna[id_conta] += valor
+
+    def __len__(self) -> int:
+        return self._tamanho - len(self._livres)
+
+
+_tabela_avulsa = None
+
+
+def tabela_avulsa() -> TabelaContas:
+    '''
+    Retorna a tabela usada por clientes criados sem gerenciador.
+
+    Retorna
+    -------
+    TabelaContas
+        Tabela compartilhada por esses clientes.
+    '''
+    global _tabela_avulsa
+    if _tabela_avulsa is None:
+        _tabela_avulsa = TabelaContas()
+    return _tabela_avulsa
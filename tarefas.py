@@ -0,0 +1,81 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import configuracao
+
+
+class ExecutorTarefas:
+    def __init__(self, trabalhadores: int = None) -> None:
+        '''
+        Inicializa o conjunto de threads que executa as tarefas das telas em segundo plano.
+
+        As telas entregam a leitura de faturas e a gravação das contas a este executor e
+        atualizam a página quando a tarefa termina, de modo que o clique não espera o disco.
+
+        Parâmetros
+        ----------
+        trabalhadores : int, opcional
+            Quantidade de threads (padrão: configuracao.TRABALHADORES_IO).
+        '''
+        self._executor = ThreadPoolExecutor(
+            max_workers=trabalhadores or configuracao.TRABALHADORES_IO,
+            thread_name_prefix='blibank-tarefa'
+        )
+
+    def executar(self, tarefa, ao_concluir=None, ao_falhar=None):
+        '''
+        Executa uma tarefa em segundo plano.
+
+        Parâmetros
+        ----------
+        tarefa : callable
+            Função sem argumentos com o trabalho bloqueante.
+        ao_concluir : callable, opcional
+            Chamada com o retorno da tarefa quando ela termina.
+        ao_falhar : callable, opcional
+            Chamada com a exceção se a tarefa falhar; sem ela, o erro é exibido no console.
+
+        Retorna
+        -------
+        concurrent.futures.Future
+            O futuro da tarefa.
+        '''
+        def concluir(futuro):
+            erro = futuro.exception()
+            if erro is not None:
+                if ao_falhar is not None:
+                    ao_falhar(erro)
+                else:
+                    print(f"Erro em tarefa de segundo plano: {erro}")
+            elif ao_concluir is not None:
+                ao_concluir(futuro.result())
+
+        futuro = self._executor.submit(tarefa)
+        futuro.add_done_callback(concluir)
+        return futuro
+
+    def encerrar(self) -> None:
+        '''
+        Aguarda as tarefas em andamento e encerra as threads.
+        '''
+        self._executor.shutdown(wait=True)
+
+
+_executor_padrao = None
+_trava_executor = threading.Lock()
+
+
+def executor_padrao() -> ExecutorTarefas:
+    '''
+    Retorna o executor compartilhado pelas páginas abertas no processo.
+
+    Retorna
+    -------
+    ExecutorTarefas
+        Executor de tarefas compartilhado.
+    '''
+    global _executor_padrao
+    with _trava_executor:
+        if _executor_padrao is None:
+            _executor_padrao = ExecutorTarefas()
+    return _executor_padrao
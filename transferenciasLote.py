@@ -0,0 +1,159 @@
+'''
+Transferências em lote (por exemplo, uma folha de pagamento).
+
+Todas as transferências são validadas pelos índices do gerenciador, as contas
+envolvidas são travadas uma única vez e os saldos são alterados em memória, na ordem
+do lote. As contas alteradas são gravadas em uma única chamada a salvar_usuarios e os
+lançamentos vão para o extrato em um único lote. No modo estrito, qualquer falha
+desfaz o lote inteiro; caso contrário, as transferências com falha são apenas
+relatadas e as demais são aplicadas. Uma transferência sem conta de origem é um
+depósito externo na conta de destino (por exemplo, um arquivo de pagamentos).
+'''
+from dinheiro import para_centavos
+from gerenciadorUsuario import normalizar_email
+
+
+def _resolver_contas(gerenciador, transferencias: list) -> tuple:
+    '''
+    Valida as transferências e busca as contas de origem e destino de cada uma.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os clientes.
+    transferencias : list of tuple
+        Tuplas (email_origem, email_destino, valor em reais[, descricao]).
+
+    Retorna
+    -------
+    tuple
+        (validas, falhas, contas): validas é uma lista de (indice, origem, destino,
+        centavos, descricao), com origem None nos depósitos externos; falhas, uma lista
+        de (indice, motivo); contas, os clientes envolvidos indexados pelo email
+        normalizado (grafias diferentes do mesmo email são a mesma conta).
+    '''
+    contas = {}
+
+    def buscar(email):
+        chave = normalizar_email(email)
+        if chave not in contas:
+            contas[chave] = gerenciador.buscar_por_email(chave)
+        return contas[chave]
+
+    validas, falhas = [], []
+    for indice, transferencia in enumerate(transferencias):
+        try:
+            email_origem, email_destino, valor, *descricao = transferencia
+            centavos = para_centavos(valor)
+            if len(descricao) > 1:
+                raise ValueError(transferencia)
+        except (TypeError, ValueError, ArithmeticError):
+            falhas.append((indice, "Movimentação mal formada."))
+            continue
+        descricao = descricao[0] if descricao else None
+        origem, destino = (buscar(email_origem) if email_origem else None), buscar(email_destino)
+        if email_origem and not isinstance(origem, gerenciador.Cliente):
+            falhas.append((indice, f"Origem não é um cliente BliBank: {email_origem}"))
+        elif not isinstance(destino, gerenciador.Cliente):
+            falhas.append((indice, f"Destinatário não é um cliente BliBank: {email_destino}"))
+        elif origem is destino:
+            falhas.append((indice, "Origem e destinatário são a mesma conta."))
+        elif centavos <= 0:
+            falhas.append((indice, "O valor da transferência deve ser positivo."))
+        else:
+            validas.append((indice, origem, destino, centavos, descricao))
+    return validas, falhas, {conta.get_email(): conta for conta in contas.values() if conta is not None}
+
+
+def transferir_em_lote(gerenciador, transferencias, estrito: bool = False, origem_autorizada: str = None,
+                       extrato_antes: bool = False) -> dict:
+    '''
+    Aplica várias transferências entre clientes com uma única gravação.
+
+    As transferências são aplicadas na ordem recebida: o crédito recebido por uma conta
+    no início do lote pode pagar uma transferência dela mais adiante.
+
+    Parâmetros
+    ----------
+    gerenciador : GerenciadorUsuarios
+        Gerenciador com os clientes e o armazenamento dos lançamentos.
+    transferencias : iterable of tuple
+        Tuplas (email_origem, email_destino, valor em reais[, descricao]); pode ser um
+        gerador. Com email_origem vazio, o valor é depositado na conta de destino. A
+        descrição, se houver, vai para o extrato.
+    estrito : bool, opcional
+        Se True, qualquer falha desfaz o lote inteiro e nenhuma transferência é gravada.
+    origem_autorizada : str, opcional
+        Se informado, apenas transferências a partir desse email são aceitas (e nenhum
+        depósito externo).
+    extrato_antes : bool, opcional
+        Se True, os lançamentos estão em disco antes que os saldos sejam gravados: uma
+        interrupção entre as duas gravações deixa o extrato à frente dos saldos, nunca o
+        contrário (o processamento de arquivos de pagamentos depende dessa ordem).
+
+    Retorna
+    -------
+    dict
+        Transferências aplicadas, total movimentado em centavos, falhas como uma lista
+        de (posição no lote, motivo) e se o lote foi desfeito (modo estrito).
+    '''
+    transferencias = list(transferencias)
+    validas, falhas, contas = _resolver_contas(gerenciador, transferencias)
+    if origem_autorizada is not None:
+        validas, negadas = [], validas
+        for item in negadas:
+            if item[1] is None:
+                falhas.append((item[0], "Depósito externo não autorizado."))
+            elif item[1].get_email() == origem_autorizada:
+                validas.append(item)
+            else:
+                falhas.append((item[0], "Transferência a partir de outra conta não autorizada."))
+    resultado = {'aplicadas': 0, 'total': 0, 'falhas': falhas, 'revertido': False}
+    if estrito and falhas:
+        resultado['falhas'].sort()
+        resultado['revertido'] = True
+        return resultado
+
+    alteradas, movimentacoes = {}, []
+    with gerenciador.travar_contas(*contas.values()):
+        saldos = {email: conta.get_saldo_centavos() for email, conta in contas.items()}
+        iniciais = dict(saldos)
+        for indice, origem, destino, centavos, descricao in validas:
+            email_destino = destino.get_email()
+            if origem is None:
+                saldos[email_destino] += centavos
+                alteradas[email_destino] = destino
+                movimentacoes.append((email_destino, 'deposito', centavos, saldos[email_destino], None, descricao))
+                resultado['aplicadas'] += 1
+                resultado['total'] += centavos
+                continue
+            email_origem = origem.get_email()
+            if saldos[email_origem] < centavos:
+                falhas.append((indice, "Saldo insuficiente."))
+                if estrito:
+                    break
+                continue
+            saldos[email_origem] -= centavos
+            saldos[email_destino] += centavos
+            alteradas[email_origem], alteradas[email_destino] = origem, destino
+            movimentacoes.append((email_origem, 'transferencia_enviada', -centavos, saldos[email_origem], email_destino, descricao))
+            movimentacoes.append((email_destino, 'transferencia_recebida', centavos, saldos[email_destino], email_origem, descricao))
+            resultado['aplicadas'] += 1
+            resultado['total'] += centavos
+
+        falhas.sort()
+        if estrito and falhas:
+            resultado.update(aplicadas=0, total=0, revertido=True)
+            return resultado
+        for email, conta in alteradas.items():
+            if saldos[email] != iniciais[email]:
+                conta.set_saldo_centavos(saldos[email])
+
+    if alteradas:
+        gerenciador.lancamentos.registrar_varios(movimentacoes)
+        try:
+            if extrato_antes:
+                gerenciador.lancamentos.descarregar()
+        finally:
+            gerenciador.salvar_usuarios(*alteradas.values())
+    return resultado
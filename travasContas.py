@@ -0,0 +1,73 @@
+import threading
+import zlib
+from contextlib import contextmanager
+
+
+class TravasContas:
+    def __init__(self, quantidade: int = 1024) -> None:
+        '''
+        Inicializa o conjunto de travas das contas.
+
+        Cada conta é associada, pelo email, a uma das travas do conjunto. Operações em
+        contas diferentes quase sempre usam travas diferentes e podem rodar em paralelo,
+        sem uma trava global e sem um objeto de trava por conta carregada.
+
+        Parâmetros
+        ----------
+        quantidade : int, opcional
+            Quantidade de travas do conjunto.
+        '''
+        self._travas = [threading.RLock() for _ in range(max(int(quantidade), 1))]
+
+    def indice(self, email: str) -> int:
+        '''
+        Retorna o índice da trava de uma conta.
+
+        Parâmetros
+        ----------
+        email : str
+            Email normalizado da conta.
+
+        Retorna
+        -------
+        int
+            Posição da trava no conjunto.
+        '''
+        return zlib.crc32(email.encode('utf-8')) % len(self._travas)
+
+    @contextmanager
+    def travar(self, *emails: str):
+        '''
+        Adquire as travas das contas informadas, sempre em ordem crescente de índice.
+
+        A ordem fixa impede o impasse (deadlock) entre duas operações que travam as
+        mesmas contas em ordens diferentes, como transferências A→B e B→A. As travas são
+        reentrantes: uma operação pode travar de novo uma conta que já travou.
+
+        Parâmetros
+        ----------
+        *emails : str
+            Emails normalizados das contas.
+        '''
+        travas = [self._travas[i] for i in sorted({self.indice(email) for email in emails})]
+        for trava in travas:
+            trava.acquire()
+        try:
+            yield
+        finally:
+            for trava in reversed(travas):
+                trava.release()
+
+    @contextmanager
+    def travar_todas(self):
+        '''
+        Adquire todas as travas, em ordem, para uma operação que altera todas as contas
+        de uma vez (por exemplo, os lançamentos diários em lote).
+        '''
+        for trava in self._travas:
+            trava.acquire()
+        try:
+            yield
+        finally:
+            for trava in reversed(self._travas):
+                trava.release()